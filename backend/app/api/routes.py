@@ -1,16 +1,37 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import List, Optional
+import asyncio
+import base64
+import json
+import math
 import os
-import zipfile
+import time
+from app.core.config import settings
 from app.models.schemas import (
     CauseListRequest, CauseListResponse, StateResponse, 
-    DistrictResponse, CourtResponse, JudgeResponse
+    DistrictResponse, CourtResponse, JudgeResponse, JobResponse, HistorySearchResponse,
+    CauseListDiffResponse, CauseListPage
 )
 from app.scrapers.ecourts_scraper import ECourtsScraper
 from app.scrapers.delhi_courts_scraper import DelhiCourtsScraper
 from app.scrapers.mock_scraper import MockScraper
+from app.scrapers.single_flight import CoalescingScraper, FlightTimeout
 from app.utils.pdf_generator import PDFGenerator
+from app.utils.hierarchy_cache import HierarchyCache, CachedScraper
+from app.utils.executors import PoolSaturated, scrape_pool, render_pool
+from app.utils.artifacts import Artifact, ArtifactRegistry
+from app.utils.cause_list_pipeline import CauseListPipeline
+from app.utils.janitor import Janitor
+from app.utils.result_cache import ResultCache
+from app.utils.history_store import SEARCH_FIELDS, HistoryStore
+from app.utils.prefetch import Prefetcher
+from app.utils.exporters import iter_csv, iter_ndjson, iter_rows
+from app.utils.jobs import JobManager, JobQueueFull
+from app.utils.metrics import DOWNLOAD_SECONDS
+from app.utils.tracing import start_trace
+from app.utils.upstream import UpstreamUnavailable, upstreams
 
 router = APIRouter()
 
@@ -18,15 +39,30 @@ router = APIRouter()
 ecourts_scraper = ECourtsScraper()
 delhi_scraper = DelhiCourtsScraper()
 mock_scraper = MockScraper()  # For testing without Chrome driver
+# Concurrent identical requests share one scrape
+coalesced_scraper = CoalescingScraper(mock_scraper)
 pdf_generator = PDFGenerator()
+hierarchy_cache = HierarchyCache()
+hierarchy_scraper = CachedScraper(coalesced_scraper, hierarchy_cache)
+artifacts = ArtifactRegistry()
+janitor = Janitor(on_removed=artifacts.remove_paths, on_purge=artifacts.purge_expired)
+result_cache = ResultCache(on_evicted=artifacts.remove_paths) if settings.RESULT_CACHE_ENABLED else None
+history = HistoryStore() if settings.HISTORY_ENABLED else None
+# Use mock scraper for now to avoid Chrome driver issues
+pipeline = CauseListPipeline(coalesced_scraper, pdf_generator, artifacts, result_cache, history)
+prefetcher = Prefetcher(pipeline)
 
 @router.get("/states", response_model=StateResponse)
 async def get_states():
     """Get list of states"""
     try:
         # Use mock scraper for now to avoid Chrome driver issues
-        states = mock_scraper.get_states()
+        states = await scrape_pool.run(hierarchy_scraper.get_states)
         return StateResponse(states=states)
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching states: {str(e)}")
 
@@ -35,8 +71,12 @@ async def get_districts(state: str):
     """Get districts for a given state"""
     try:
         # Use mock scraper for now
-        districts = mock_scraper.get_districts(state)
+        districts = await scrape_pool.run(hierarchy_scraper.get_districts, state)
         return DistrictResponse(districts=districts)
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching districts: {str(e)}")
 
@@ -45,8 +85,12 @@ async def get_courts(state: str, district: str):
     """Get court complexes for a given state and district"""
     try:
         # Use mock scraper for now
-        courts = mock_scraper.get_court_complexes(state, district)
+        courts = await scrape_pool.run(hierarchy_scraper.get_court_complexes, state, district)
         return CourtResponse(courts=courts)
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching courts: {str(e)}")
 
@@ -55,116 +99,448 @@ async def get_judges(state: str, district: str, court_complex: str):
     """Get judges for a given court complex"""
     try:
         # Use mock scraper for now
-        judges = mock_scraper.get_judges(state, district, court_complex)
+        judges = await scrape_pool.run(hierarchy_scraper.get_judges, state, district, court_complex)
         return JudgeResponse(judges=judges)
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching judges: {str(e)}")
 
+@router.delete("/admin/cache/hierarchy")
+async def invalidate_hierarchy_cache(state: Optional[str] = None, district: Optional[str] = None,
+                                     court_complex: Optional[str] = None):
+    """Invalidate cached hierarchy data for a subtree (everything if no state is given)"""
+    if (district and not state) or (court_complex and not district):
+        raise HTTPException(status_code=400, detail="district requires state, court_complex requires district")
+
+    path = [part for part in (state, district, court_complex) if part]
+    removed = hierarchy_cache.invalidate(*path)
+    return {"success": True, "invalidated": removed}
+
+@router.get("/admin/cache/results")
+async def result_cache_stats():
+    """Hit/miss counters and size of the rendered PDF cache"""
+    if result_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **result_cache.stats()}
+
+@router.get("/admin/upstreams")
+async def upstream_status():
+    """Rate, circuit breaker state and request counters per court website host"""
+    return {"upstreams": upstreams.status()}
+
+@router.get("/admin/prefetch")
+async def prefetch_status():
+    """Schedule, last-run timings and per-target failures of the prefetch crawler"""
+    return {"enabled": settings.PREFETCH_ENABLED, **prefetcher.status()}
+
+@router.post("/admin/prefetch/run", status_code=202)
+async def run_prefetch(date: Optional[str] = None):
+    """Start a prefetch run now (for the next working day unless a date is given)"""
+    try:
+        prefetcher.trigger(date)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"success": True, "message": "Prefetch started"}
+
 @router.post("/fetch-causelist", response_model=CauseListResponse)
-async def fetch_cause_list(request: CauseListRequest, background_tasks: BackgroundTasks):
+async def fetch_cause_list(request: CauseListRequest):
     """Fetch cause list and generate PDF"""
+    with start_trace("fetch_cause_list", state=request.state, district=request.district,
+                     court_complex=request.court_complex, date=request.date, case_type=request.case_type,
+                     engine=request.engine or "default", bundle=request.bundle) as trace:
+        try:
+            cached = await render_pool.run(pipeline.cached, request)
+            trace.set_attribute("cache_hit", cached is not None)
+            if cached is not None:
+                return build_cause_list_response(*cached)
+        
+            cause_lists = await scrape_pool.run(pipeline.scrape, request)
+        
+            if not cause_lists:
+                return build_cause_list_response([], None, found=False)
+        
+            # Generate PDFs (and a ZIP for several judges) off the event loop
+            pdf_artifacts, zip_artifact = await render_pool.run(pipeline.render, cause_lists, request.date, request)
+        
+            if pdf_artifacts:
+                # Schedule cleanup
+                janitor.schedule(artifact_paths(pdf_artifacts, zip_artifact))
+        
+            return build_cause_list_response(pdf_artifacts, zip_artifact)
+    
+        except UpstreamUnavailable as e:
+            raise upstream_unavailable(e)
+        except PoolSaturated as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        except FlightTimeout as e:
+            raise HTTPException(status_code=504, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error fetching cause list: {str(e)}")
+
+@router.post("/fetch-causelist/diff", response_model=CauseListDiffResponse)
+async def fetch_cause_list_diff(request: CauseListRequest):
+    """Re-scrape and return entries added, removed and modified since the last scrape.
+    
+    PDFs are only rendered for lists whose content changed; the rest come from the result cache.
+    """
+    if history is None:
+        raise HTTPException(status_code=404, detail="Cause list history is disabled")
     try:
-        # Use mock scraper for now to avoid Chrome driver issues
-        cause_lists = mock_scraper.fetch_cause_list(
-            request.state,
-            request.district,
-            request.court_complex,
-            request.court_name,
-            request.date,
-            request.case_type
-        )
+        cause_lists, diffs, stale = await scrape_pool.run(pipeline.scrape_with_diff, request)
         
         if not cause_lists:
-            return CauseListResponse(
-                success=False,
-                message="No cause lists found for the given criteria"
-            )
+            return CauseListDiffResponse(diffs=[], result=build_cause_list_response([], None, found=False))
         
-        # Generate PDFs
-        output_dir = pdf_generator.create_output_directory()
-        pdf_files = pdf_generator.generate_multiple_cause_lists_pdf(cause_lists, output_dir)
+        pdf_artifacts, zip_artifact = await render_pool.run(pipeline.render, cause_lists, request.date, request)
+        if pdf_artifacts:
+            janitor.schedule(artifact_paths(pdf_artifacts, zip_artifact))
         
-        if not pdf_files:
-            return CauseListResponse(
-                success=False,
-                message="Failed to generate PDF files"
-            )
-        
-        # If multiple PDFs, create a zip file
-        if len(pdf_files) > 1:
-            zip_filename = f"cause_lists_{request.date}.zip"
-            zip_path = os.path.join(output_dir, zip_filename)
-            
-            with zipfile.ZipFile(zip_path, 'w') as zipf:
-                for pdf_file in pdf_files:
-                    zipf.write(pdf_file, os.path.basename(pdf_file))
-            
-            # Schedule cleanup
-            background_tasks.add_task(cleanup_files, [zip_path] + pdf_files)
-            
-            return CauseListResponse(
-                success=True,
-                message=f"Generated {len(pdf_files)} cause list PDFs",
-                pdf_url=f"/download/{os.path.basename(zip_path)}",
-                filename=zip_filename
-            )
-        else:
-            # Single PDF
-            pdf_file = pdf_files[0]
-            background_tasks.add_task(cleanup_files, [pdf_file])
-            
-            return CauseListResponse(
-                success=True,
-                message="Generated cause list PDF",
-                pdf_url=f"/download/{os.path.basename(pdf_file)}",
-                filename=os.path.basename(pdf_file)
-            )
+        return CauseListDiffResponse(diffs=diffs, stale=stale,
+                                     result=build_cause_list_response(pdf_artifacts, zip_artifact))
     
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except FlightTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching cause list: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error diffing cause list: {str(e)}")
 
-@router.get("/download/{filename}")
-async def download_file(filename: str):
-    """Download generated PDF or ZIP file"""
+@router.post("/fetch-causelist/stream")
+async def stream_cause_list(request: CauseListRequest):
+    """Fetch cause lists and stream the PDF, or a ZIP of PDFs (or one combined PDF), without staging files on disk"""
     try:
-        # Look for the file in recent output directories
-        base_dir = "output"
-        if not os.path.exists(base_dir):
-            raise HTTPException(status_code=404, detail="File not found")
+        cause_lists = await scrape_pool.run(pipeline.scrape, request)
         
-        # Find the file in subdirectories
-        file_path = None
-        for root, dirs, files in os.walk(base_dir):
-            if filename in files:
-                file_path = os.path.join(root, filename)
-                break
+        if not cause_lists:
+            raise HTTPException(status_code=404, detail="No cause lists found for the given criteria")
         
-        if not file_path or not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="File not found")
+        if len(cause_lists) == 1:
+            pdf_bytes = await render_pool.run(pdf_generator.generate_cause_list_pdf_bytes, cause_lists[0])
+            filename = pdf_generator.pdf_filename(cause_lists[0])
+            return Response(
+                content=pdf_bytes,
+                media_type="application/pdf",
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+            )
         
-        # Determine media type
-        media_type = "application/pdf" if filename.endswith('.pdf') else "application/zip"
+        if request.bundle == "pdf":
+            pdf_bytes = await render_pool.run(pdf_generator.generate_combined_pdf_bytes, cause_lists)
+            return Response(
+                content=pdf_bytes,
+                media_type="application/pdf",
+                headers={"Content-Disposition": f'attachment; filename="{pdf_generator.combined_filename(request.date)}"'}
+            )
         
-        return FileResponse(
-            path=file_path,
-            media_type=media_type,
-            filename=filename
+        # PDFs are rendered into memory and written into the ZIP stream as they finish
+        return StreamingResponse(
+            render_pool.iterate(pipeline.stream_zip(cause_lists)),
+            media_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="cause_lists_{request.date}.zip"'}
         )
     
+    except HTTPException:
+        raise
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except FlightTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error downloading file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error fetching cause list: {str(e)}")
 
-def cleanup_files(file_paths: List[str]):
-    """Background task to cleanup generated files after some time"""
-    import time
-    time.sleep(300)  # Wait 5 minutes before cleanup
+@router.get("/history/cases", response_model=HistorySearchResponse)
+def find_case_listings(case_number: str, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                       limit: int = Query(100, ge=1, le=1000)):
+    """Where a case has been listed (court, judge, date), newest first"""
+    if history is None:
+        raise HTTPException(status_code=404, detail="Cause list history is disabled")
+    try:
+        results = history.find_case(case_number, date_from, date_to, limit)
+        return HistorySearchResponse(count=len(results), results=results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching history: {str(e)}")
+
+@router.get("/history/search", response_model=HistorySearchResponse)
+def search_history(q: str, field: Optional[str] = None, date_from: Optional[str] = None,
+                   date_to: Optional[str] = None, limit: int = Query(100, ge=1, le=1000)):
+    """Listings whose advocate, parties or case number mention every word of ``q``"""
+    if history is None:
+        raise HTTPException(status_code=404, detail="Cause list history is disabled")
+    if field is not None and field not in SEARCH_FIELDS:
+        raise HTTPException(status_code=400, detail=f"field must be one of: {', '.join(SEARCH_FIELDS)}")
+    try:
+        results = history.search(q, field, date_from, date_to, limit)
+        return HistorySearchResponse(count=len(results), results=results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching history: {str(e)}")
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+    "csv": ("text/csv", iter_csv),
+}
+
+@router.post("/export/causelist")
+async def export_cause_list(request: CauseListRequest, format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    """Stream cause list entries as NDJSON or CSV, one row per entry, instead of a PDF"""
+    try:
+        cause_lists = await scrape_pool.run(pipeline.scrape, request)
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except FlightTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching cause list: {str(e)}")
     
-    for file_path in file_paths:
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as e:
-            print(f"Error cleaning up file {file_path}: {str(e)}")
+    if not cause_lists:
+        raise HTTPException(status_code=404, detail="No cause lists found for the given criteria")
+    
+    media_type, serialize = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        serialize(iter_rows(cause_lists)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="cause_lists_{request.date}.{format}"'}
+    )
+
+@router.get("/export/causelist/pages", response_model=CauseListPage)
+async def export_cause_list_page(state: str, district: str, court_complex: str, date: str,
+                                 case_type: Optional[str] = "both", cursor: Optional[str] = None,
+                                 limit: int = Query(500, ge=1, le=5000)):
+    """Cause list entries as paged JSON; follow ``next_cursor`` until it is null.
+    
+    Pages are read from the history store, so they stay stable between calls.
+    The lists are scraped on the first page if they have not been stored yet.
+    """
+    if history is None:
+        raise HTTPException(status_code=404, detail="Cause list history is disabled")
+    try:
+        after_id = decode_cursor(cursor) if cursor else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    try:
+        # SQLite reads run off the event loop, like the result cache lookup
+        if not cursor and not await render_pool.run(history.has_lists, court_complex, date, case_type):
+            request = CauseListRequest(state=state, district=district, court_complex=court_complex,
+                                       date=date, case_type=case_type)
+            await scrape_pool.run(pipeline.scrape_into_history, request)
+        
+        results, next_id = await render_pool.run(history.page, court_complex, date, case_type, after_id, limit)
+        return CauseListPage(
+            count=len(results),
+            results=results,
+            next_cursor=encode_cursor(next_id) if next_id is not None else None
+        )
+    except UpstreamUnavailable as e:
+        raise upstream_unavailable(e)
+    except PoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except FlightTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error exporting cause list: {str(e)}")
+
+def upstream_unavailable(error: UpstreamUnavailable) -> HTTPException:
+    """503 telling the client when the court website is worth trying again"""
+    return HTTPException(status_code=503, detail=str(error),
+                         headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))})
+
+def encode_cursor(after_id: int) -> str:
+    return base64.urlsafe_b64encode(str(after_id).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> int:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce"""
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    except Exception:
+        raise ValueError(cursor)
+
+def artifact_paths(pdf_artifacts: List[Artifact], zip_artifact: Optional[Artifact]) -> List[str]:
+    return ([zip_artifact.path] if zip_artifact else []) + [artifact.path for artifact in pdf_artifacts]
+
+def build_cause_list_response(pdf_artifacts: List[Artifact], zip_artifact: Optional[Artifact],
+                              found: bool = True) -> CauseListResponse:
+    """Describe the files produced for a fetch"""
+    if not found:
+        return CauseListResponse(
+            success=False,
+            message="No cause lists found for the given criteria"
+        )
+    
+    if not pdf_artifacts:
+        return CauseListResponse(
+            success=False,
+            message="Failed to generate PDF files"
+        )
+    
+    if zip_artifact:
+        return CauseListResponse(
+            success=True,
+            message=f"Generated {len(pdf_artifacts)} cause list PDFs",
+            pdf_url=zip_artifact.url,
+            pdf_urls=[artifact.url for artifact in pdf_artifacts],
+            filename=zip_artifact.filename
+        )
+    
+    # Single PDF
+    pdf_artifact = pdf_artifacts[0]
+    return CauseListResponse(
+        success=True,
+        message="Generated cause list PDF",
+        pdf_url=pdf_artifact.url,
+        filename=pdf_artifact.filename
+    )
+
+def build_job_response(pdf_artifacts: List[Artifact], zip_artifact: Optional[Artifact],
+                       found: bool) -> CauseListResponse:
+    """Job variant of build_cause_list_response that also schedules cleanup"""
+    if pdf_artifacts:
+        janitor.schedule(artifact_paths(pdf_artifacts, zip_artifact))
+    return build_cause_list_response(pdf_artifacts, zip_artifact, found)
+
+job_manager = JobManager(pipeline, build_job_response)
+SSE_POLL_INTERVAL = 0.25  # seconds between checks for new job events
+
+@router.post("/jobs/fetch-causelist", response_model=JobResponse, status_code=202)
+async def submit_cause_list_job(request: CauseListRequest):
+    """Queue a cause list fetch and return its job id straight away"""
+    try:
+        job = job_manager.submit(request)
+        return job.to_response()
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Get status, progress and (when finished) results of a job"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_response()
+
+@router.delete("/jobs/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_response()
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Server-Sent Events stream of a job's status and per-judge progress"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        seen = 0
+        idle = 0.0
+        while True:
+            events = job.events[seen:]
+            for event in events:
+                yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+            seen += len(events)
+            
+            if job.finished and seen >= len(job.events):
+                break
+            if events:
+                idle = 0.0
+            elif idle >= 15:
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(SSE_POLL_INTERVAL)
+            idle += SSE_POLL_INTERVAL
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.get("/download/{artifact_id}")
+async def download_file(artifact_id: str, request: Request):
+    """Download a generated PDF or ZIP file by its artifact id (supports ETag and Range)"""
+    artifact = artifacts.get(artifact_id)
+    if artifact is None or not os.path.exists(artifact.path):
+        raise HTTPException(status_code=404, detail="File not found")
+    janitor.touch(artifact.path)
+    requested_at = time.perf_counter()
+    
+    headers = {
+        "ETag": artifact.etag,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{artifact.filename}"',
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or artifact.etag in if_none_match):
+        return Response(status_code=304, headers=headers)
+    
+    byte_range = parse_range_header(request.headers.get("range"), artifact.size)
+    if_range = request.headers.get("if-range")
+    if byte_range is not None and if_range and if_range.strip() != artifact.etag:
+        # Stale If-Range: send the whole current file instead
+        byte_range = None
+    
+    if byte_range is None:
+        return FileResponse(path=artifact.path, media_type=artifact.content_type, headers=headers,
+                            background=BackgroundTask(DOWNLOAD_SECONDS.labels("full").observe_since, requested_at))
+    
+    if byte_range == "unsatisfiable":
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{artifact.size}"})
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{artifact.size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        iter_file_range(artifact.path, start, end),
+        status_code=206,
+        media_type=artifact.content_type,
+        headers=headers,
+        background=BackgroundTask(DOWNLOAD_SECONDS.labels("range").observe_since, requested_at)
+    )
+
+def parse_range_header(value: Optional[str], size: int):
+    """Parse a single ``bytes=`` range into (start, end) inclusive.
+    
+    Returns None when the header is absent or not something we serve partially
+    (e.g. several ranges), and "unsatisfiable" when it lies outside the file.
+    """
+    if not value or not value.startswith("bytes=") or "," in value:
+        return None
+    
+    start_text, _, end_text = value[len("bytes="):].strip().partition("-")
+    try:
+        if not start_text:
+            # Suffix range: the last N bytes
+            length = int(end_text)
+            if length <= 0:
+                return "unsatisfiable"
+            return max(size - length, 0), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+    
+    if start >= size or start > end:
+        return "unsatisfiable"
+    return start, min(end, size - 1)
+
+def iter_file_range(path: str, start: int, end: int, chunk_size: int = 64 * 1024):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
 
 @router.get("/health")
 async def health_check():
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 import os
 
 class Settings(BaseSettings):
@@ -27,9 +27,105 @@ class Settings(BaseSettings):
     CHROME_HEADLESS: bool = True
     MAX_RETRY_ATTEMPTS: int = 3
     
+    # Browser Pool Configuration
+    DRIVER_POOL_SIZE: int = 2
+    DRIVER_LEASE_TIMEOUT: int = 60  # seconds to wait for a free browser
+    DRIVER_MAX_NAVIGATIONS: int = 200  # recycle a browser after this many page loads
+    DRIVER_POOL_MAX_MEMORY_MB: int = 2048  # 0 disables the memory cap
+    DRIVER_MEMORY_SAMPLE_SECONDS: float = 5.0  # re-measure a browser's memory at most this often
+    DRIVER_POOL_WARM_ON_STARTUP: bool = False
+    
+    # eCourts Engine Configuration
+    ECOURTS_BASE_URL: str = "https://services.ecourts.gov.in/ecourtindia_v6/"
+    DELHI_COURTS_BASE_URL: str = "https://newdelhi.dcourts.gov.in"
+    SCRAPER_ENGINE: str = "selenium"  # selenium or http
+    SCRAPER_ENGINE_FALLBACK: bool = True  # retry with Selenium when the HTTP engine fails
+    SCRAPE_PARALLELISM: int = 3  # browsers or HTTP workers per fetch (judge x case type items)
+    SINGLE_FLIGHT_WAIT_TIMEOUT: int = 300  # seconds a caller waits on an identical in-flight scrape; 0 = no limit
+    
+    # Upstream Politeness Configuration (per court website host, shared by all scrapers)
+    UPSTREAM_RATE: float = 2.0  # requests per second when healthy; 0 = no rate limit
+    UPSTREAM_BURST: int = 5
+    UPSTREAM_MIN_RATE: float = 0.2  # adaptive backoff never goes below this
+    UPSTREAM_MAX_CONCURRENT: int = 4  # requests in flight (and parallel scrape workers) per host
+    UPSTREAM_SLOW_SECONDS: float = 10.0  # responses slower than this halve the rate
+    UPSTREAM_FAILURE_THRESHOLD: int = 5  # consecutive failures that open the circuit breaker
+    UPSTREAM_OPEN_SECONDS: int = 60  # fail fast this long before probing the host again
+    
+    # Blocking Work Pools (keep scraping and PDF rendering off the event loop)
+    SCRAPE_WORKERS: int = 4
+    SCRAPE_QUEUE_SIZE: int = 32
+    RENDER_WORKERS: int = 2
+    RENDER_QUEUE_SIZE: int = 32
+    
+    # Background Job Configuration
+    JOB_WORKERS: int = 2
+    JOB_QUEUE_SIZE: int = 50  # pending jobs before submissions are rejected
+    JOB_RETENTION_SECONDS: int = 3600  # keep finished jobs this long
+    
+    # Hierarchy Cache Configuration (states/districts/courts/judges)
+    HIERARCHY_CACHE_DB: str = "cache/hierarchy.sqlite3"
+    HIERARCHY_CACHE_MAX_ENTRIES: int = 2048
+    HIERARCHY_TTL_STATES: int = 7 * 24 * 3600  # seconds
+    HIERARCHY_TTL_DISTRICTS: int = 7 * 24 * 3600
+    HIERARCHY_TTL_COURTS: int = 24 * 3600
+    HIERARCHY_TTL_JUDGES: int = 6 * 3600
+    HIERARCHY_STALE_SECONDS: int = 24 * 3600  # serve stale data this long past the TTL while refreshing
+    
     # PDF Configuration
     OUTPUT_DIR: str = "output"
     PDF_CLEANUP_DELAY: int = 300  # seconds (5 minutes)
+    ARTIFACT_DB: str = "cache/artifacts.sqlite3"  # index of downloadable files
+    # Processes for bulk rendering; 1 = render in-process, 0 = one per CPU. A pool only pays off
+    # for many long lists on a dedicated host: each worker is a spawned interpreter holding its
+    # own ReportLab (tens of MB and a slow first render), and every list is pickled to it
+    PDF_RENDER_PROCESSES: int = 1
+    PDF_PAGED_TABLE_MIN_ENTRIES: int = 300  # lists this long are laid out a page at a time; 0 = never
+    OUTPUT_MAX_BYTES: int = 1024 * 1024 * 1024  # evict least recently used files above this; 0 = no quota
+    JANITOR_BATCH_SIZE: int = 100  # files deleted per sweep
+    JANITOR_PURGE_INTERVAL: int = 600  # seconds between purges of expired download ids
+    
+    # Result Cache Configuration
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_DIR: str = "cache/pdfs"  # rendered files, named by content hash
+    RESULT_CACHE_DB: str = "cache/results.sqlite3"
+    RESULT_CACHE_FRESHNESS: int = 600  # seconds a repeat request is served without scraping
+    RESULT_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    
+    # Cause List History Configuration
+    HISTORY_ENABLED: bool = True
+    HISTORY_DB: str = "cache/history.sqlite3"
+    HISTORY_BATCH_SIZE: int = 50  # scrapes written per transaction
+    HISTORY_FLUSH_INTERVAL: float = 1.0  # seconds to wait for a batch to fill
+    HISTORY_QUEUE_SIZE: int = 1000
+    
+    # Prefetch Configuration (scrape and render ahead of court hours)
+    PREFETCH_ENABLED: bool = False
+    # e.g. [{"state": "Delhi", "district": "New Delhi", "court_complex": "Patiala House Court Complex"}];
+    # a target may also set court_name and case_type (which overrides PREFETCH_CASE_TYPE)
+    PREFETCH_TARGETS: List[Dict[str, str]] = []
+    PREFETCH_TIME: str = "20:00"  # local time to prefetch the next working day
+    PREFETCH_CONCURRENCY: int = 2  # targets scraped at once
+    PREFETCH_CASE_TYPE: str = "both"
+    PREFETCH_WORKING_DAYS: List[int] = [0, 1, 2, 3, 4, 5]  # Monday = 0
+    PREFETCH_HOLIDAYS: List[str] = []  # YYYY-MM-DD dates to skip
+    PREFETCH_FRESHNESS: int = 16 * 3600  # seconds prefetched results are served without scraping
+    
+    # Mock Scraper Configuration (synthetic load; defaults match the fixed sample data)
+    MOCK_JUDGES: int = 5
+    MOCK_ENTRIES_PER_JUDGE: int = 10
+    MOCK_FIELD_LENGTH: int = 0  # pad party/title/advocate fields to this many characters; 0 = as generated
+    MOCK_LATENCY: float = 0.0  # seconds per simulated page load
+    MOCK_JITTER: float = 0.0  # +/- seconds added to MOCK_LATENCY
+    MOCK_SEED: int = 0
+    
+    # Metrics Configuration
+    METRICS_ENABLED: bool = True  # expose Prometheus metrics at /metrics
+    
+    # Tracing Configuration (request-scoped spans for /fetch-causelist)
+    TRACE_SAMPLE_RATE: float = 0.0  # fraction of requests traced; 0 turns tracing off
+    TRACE_FILE: str = "traces/traces.jsonl"
+    TRACE_FORMAT: str = "otlp"  # "otlp" (one OTLP/JSON export per line) or "jsonl" (one span per line)
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -0,0 +1,88 @@
+import sys
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Union
+from app.models.schemas import CauseListData, CauseListEntry
+
+ENTRY_FIELDS = tuple(CauseListEntry.model_fields)
+
+# Columns with few distinct values; every row shares one string object per value
+INTERNED_FIELDS = frozenset(("case_type", "stage", "purpose"))
+
+
+class EntryRow(NamedTuple):
+    """Read-only view of one entry; has the same attributes as CauseListEntry"""
+    sr_no: Optional[str]
+    case_number: Optional[str]
+    case_title: Optional[str]
+    petitioner: Optional[str]
+    respondent: Optional[str]
+    advocate: Optional[str]
+    case_type: Optional[str]
+    stage: Optional[str]
+    purpose: Optional[str]
+
+
+class CompactEntries(Sequence):
+    """Cause list entries stored column by column.
+
+    One list per field instead of one validated model per row. Values are
+    trusted (parser or scraper output) and are not validated; repeated
+    values in low-cardinality columns are interned.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, rows: Iterable[Sequence[Optional[str]]] = ()):
+        self._columns = tuple([] for _ in ENTRY_FIELDS)
+        for row in rows:
+            self.append(row)
+
+    def append(self, row: Sequence[Optional[str]]):
+        """Add one row given as values in ENTRY_FIELDS order"""
+        for field, column, value in zip(ENTRY_FIELDS, self._columns, row):
+            if field in INTERNED_FIELDS and value:
+                value = sys.intern(value)
+            column.append(value)
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EntryRow._make(row) for row in zip(*(column[index] for column in self._columns))]
+        return EntryRow._make(column[index] for column in self._columns)
+
+    def __iter__(self) -> Iterator[EntryRow]:
+        return map(EntryRow._make, zip(*self._columns))
+
+    def to_schema(self) -> List[CauseListEntry]:
+        return [to_entry_schema(row) for row in self]
+
+
+class CompactCauseList:
+    """Internal counterpart of CauseListData with its entries held as CompactEntries.
+
+    It has the same attributes as CauseListData, so the PDF generator, history
+    store and diffing accept either.
+    """
+
+    __slots__ = ("court_name", "judge_name", "date", "case_type", "entries")
+
+    def __init__(self, court_name: str, judge_name: str, date: str, case_type: str,
+                 entries: CompactEntries):
+        self.court_name = court_name
+        self.judge_name = judge_name
+        self.date = date
+        self.case_type = case_type
+        self.entries = entries
+
+
+# Either form of a scraped cause list
+CauseList = Union[CauseListData, CompactCauseList]
+
+
+def to_entry_schema(entry) -> CauseListEntry:
+    """CauseListEntry for an EntryRow (or an entry that already is one)"""
+    if isinstance(entry, CauseListEntry):
+        return entry
+    # Validating in pydantic-core is cheaper than model_construct (see benchmarks/bench_compact_entries.py)
+    return CauseListEntry(**{field: getattr(entry, field) for field in ENTRY_FIELDS})
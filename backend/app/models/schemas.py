@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import date
 
 class CauseListRequest(BaseModel):
@@ -9,6 +9,9 @@ class CauseListRequest(BaseModel):
     court_name: Optional[str] = None
     date: str
     case_type: Optional[str] = "both"  # civil, criminal, or both
+    engine: Optional[Literal["selenium", "http"]] = None  # defaults to SCRAPER_ENGINE
+    refresh: bool = False  # scrape again even if a recent result is cached
+    bundle: Literal["zip", "pdf"] = "zip"  # several lists: ZIP of PDFs, or one PDF with a bookmark per judge
 
 class CauseListResponse(BaseModel):
     success: bool
@@ -51,3 +54,63 @@ class CauseListData(BaseModel):
     date: str
     case_type: str
     entries: List[CauseListEntry]
+
+class JobProgress(BaseModel):
+    done: int = 0
+    total: int = 0
+    current: Optional[str] = None
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed, cancelled
+    message: str
+    progress: JobProgress
+    result: Optional[CauseListResponse] = None
+    error: Optional[str] = None
+
+class HistoryEntry(BaseModel):
+    state: Optional[str] = None
+    district: Optional[str] = None
+    court_complex: Optional[str] = None
+    court_name: str
+    judge_name: str
+    date: str
+    sr_no: Optional[str] = None
+    case_number: Optional[str] = None
+    case_title: Optional[str] = None
+    petitioner: Optional[str] = None
+    respondent: Optional[str] = None
+    advocate: Optional[str] = None
+    case_type: Optional[str] = None
+    stage: Optional[str] = None
+    purpose: Optional[str] = None
+
+class HistorySearchResponse(BaseModel):
+    count: int
+    results: List[HistoryEntry]
+
+class CauseListPage(BaseModel):
+    count: int
+    results: List[HistoryEntry]
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page
+
+class EntryChange(BaseModel):
+    key: str
+    fields: List[str]
+    before: CauseListEntry
+    after: CauseListEntry
+
+class CauseListDiff(BaseModel):
+    court_name: str
+    judge_name: str
+    date: str
+    case_type: str
+    status: str  # new, changed or unchanged
+    added: List[CauseListEntry] = []
+    removed: List[CauseListEntry] = []
+    modified: List[EntryChange] = []
+
+class CauseListDiffResponse(BaseModel):
+    diffs: List[CauseListDiff]
+    stale: bool = False  # court website unavailable: result holds the last stored lists, not diffed
+    result: CauseListResponse
@@ -0,0 +1,263 @@
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, List, Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from app.core.config import settings
+from app.utils.metrics import DRIVER_STARTUP_SECONDS, NAVIGATION_SECONDS
+from app.utils.upstream import Upstream, upstreams
+
+
+class DriverPoolTimeout(Exception):
+    """Raised when no driver could be leased within the lease timeout"""
+
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """Create a Chrome driver with the options shared by all scrapers"""
+    chrome_options = Options()
+    if settings.CHROME_HEADLESS:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(settings.SCRAPING_TIMEOUT)
+    return driver
+
+
+def _process_tree_rss_mb(root_pid: int) -> float:
+    """Sum the resident memory of a process and its descendants (Linux only)"""
+    children = {}
+    rss = {}
+    try:
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    fields = f.read().rsplit(")", 1)[1].split()
+                pid = int(entry)
+                children.setdefault(int(fields[1]), []).append(pid)
+                rss[pid] = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+            except (OSError, IndexError, ValueError):
+                continue
+    except OSError:
+        return 0.0
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / (1024 * 1024)
+
+
+class PooledDriver:
+    """A WebDriver owned by the pool, tracking its age and navigation count"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.navigations = 0
+        self.broken = False
+        self.upstream: Optional[Upstream] = None  # host of the last page loaded
+        self.memory_mb = 0.0  # as of the last sample_memory()
+        self._memory_sampled_at: Optional[float] = None
+
+    def get(self, url: str):
+        self.navigations += 1
+        self.upstream = upstreams.for_url(url)
+        with self.upstream.request(), NAVIGATION_SECONDS.labels("selenium").time():
+            return self.driver.get(url)
+
+    def back(self):
+        self.navigations += 1
+        with self.upstream.request() if self.upstream else nullcontext(), \
+                NAVIGATION_SECONDS.labels("selenium").time():
+            return self.driver.back()
+
+    def sample_memory(self, max_age: float) -> float:
+        """Resident memory of chromedriver and the browsers it spawned.
+
+        Walking /proc is slow, so the value is re-read at most every
+        ``max_age`` seconds and cached in ``memory_mb`` in between.
+        """
+        now = time.monotonic()
+        if self._memory_sampled_at is None or now - self._memory_sampled_at >= max_age:
+            self._memory_sampled_at = now
+            service = getattr(self.driver, "service", None)
+            process = getattr(service, "process", None)
+            self.memory_mb = _process_tree_rss_mb(process.pid) if process is not None else 0.0
+        return self.memory_mb
+
+    def is_healthy(self) -> bool:
+        """Check the browser still answers commands"""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"Error closing driver: {str(e)}")
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+class DriverPool:
+    """Bounded pool of warm headless Chrome sessions shared by the scrapers.
+
+    Callers lease a driver with ``with pool.lease() as driver:``. A driver is
+    recycled once it has served ``max_navigations`` page loads, when it fails
+    a health check, when the leasing code raises a ``WebDriverException``, or
+    when the pool's total memory exceeds ``max_memory_mb``. Memory is sampled
+    when a driver starts and when it is returned, never while holding the
+    pool's lock.
+    """
+
+    def __init__(self, size: int = None, lease_timeout: float = None,
+                 max_navigations: int = None, max_memory_mb: int = None,
+                 memory_sample_seconds: float = None, driver_factory: Callable = create_chrome_driver):
+        self.size = size or settings.DRIVER_POOL_SIZE
+        self.lease_timeout = lease_timeout if lease_timeout is not None else settings.DRIVER_LEASE_TIMEOUT
+        self.max_navigations = max_navigations or settings.DRIVER_MAX_NAVIGATIONS
+        self.max_memory_mb = max_memory_mb if max_memory_mb is not None else settings.DRIVER_POOL_MAX_MEMORY_MB
+        self.memory_sample_seconds = memory_sample_seconds if memory_sample_seconds is not None \
+            else settings.DRIVER_MEMORY_SAMPLE_SECONDS
+        self.driver_factory = driver_factory
+
+        self._idle: List[PooledDriver] = []
+        self._leased: List[PooledDriver] = []
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @property
+    def busy(self) -> int:
+        return len(self._leased)
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def warm_up(self, count: Optional[int] = None):
+        """Start drivers ahead of time so the first requests don't pay for Chrome startup"""
+        count = min(count or self.size, self.size)
+        while True:
+            with self._condition:
+                if self._closed or len(self._idle) + len(self._leased) >= count:
+                    return
+            pooled = self._create()
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Check a driver out of the pool and return it when the block exits"""
+        pooled = self._checkout(self.lease_timeout if timeout is None else timeout)
+        try:
+            yield pooled
+        except WebDriverException:
+            pooled.broken = True
+            raise
+        finally:
+            self._checkin(pooled)
+
+    def _checkout(self, timeout: float) -> PooledDriver:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        self._leased.append(pooled)
+                        break
+                    if len(self._leased) < self.size and self._memory_allows_new_driver():
+                        pooled = None
+                        self._leased.append(None)  # reserve a slot while Chrome starts
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverPoolTimeout(f"No browser available within {timeout}s")
+                    self._condition.wait(remaining)
+
+            if pooled is None:
+                try:
+                    pooled = self._create()
+                except Exception:
+                    with self._condition:
+                        self._leased.remove(None)
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self._leased[self._leased.index(None)] = pooled
+                return pooled
+
+            if pooled.is_healthy():
+                return pooled
+
+            # Crashed while idle: replace it and try again
+            with self._condition:
+                self._leased.remove(pooled)
+                self._condition.notify()
+            pooled.quit()
+
+    def _checkin(self, pooled: PooledDriver):
+        recycle = (
+            pooled.broken
+            or pooled.navigations >= self.max_navigations
+            or self._closed
+        )
+        if not recycle and self.max_memory_mb:
+            recycle = pooled.sample_memory(self.memory_sample_seconds) > self.max_memory_mb / self.size
+
+        with self._condition:
+            self._leased.remove(pooled)
+            if not recycle:
+                self._idle.append(pooled)
+            self._condition.notify()
+
+        if recycle:
+            pooled.quit()
+
+    def _memory_allows_new_driver(self) -> bool:
+        if not self.max_memory_mb:
+            return True
+        # Cached samples only: this runs under the lock on every checkout
+        in_use = sum(p.memory_mb for p in self._idle + self._leased if p is not None)
+        return in_use < self.max_memory_mb
+
+    def _create(self) -> PooledDriver:
+        with DRIVER_STARTUP_SECONDS.time():
+            pooled = PooledDriver(self.driver_factory())
+        if self.max_memory_mb:
+            pooled.sample_memory(0)
+        return pooled
+
+    def shutdown(self):
+        """Quit every idle driver; leased drivers are quit when returned"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            pooled.quit()
+
+
+# Shared pool used by every Selenium scraper in the process
+driver_pool = DriverPool()
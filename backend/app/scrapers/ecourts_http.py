@@ -0,0 +1,210 @@
+import json
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple
+import lxml.html
+import requests
+from app.core.config import settings
+from app.models.compact import CompactCauseList
+from app.models.schemas import JudgeInfo
+from app.scrapers.parallel import run_work_items, per_judge_progress
+from app.scrapers.table_parser import parse_cause_list_rows
+from app.utils.metrics import DROPDOWN_CASCADE_SECONDS, NAVIGATION_SECONDS
+from app.utils.tracing import span
+from app.utils.upstream import upstreams
+
+
+class ECourtsHttpError(Exception):
+    """Raised when the eCourts endpoints answer with something we can't use"""
+
+
+class ECourtsHttpEngine:
+    """Browserless eCourts client that replays the cause list form's AJAX calls.
+
+    The cause list page fills its cascading selects (``state_code`` ->
+    ``dist_code`` -> ``court_code`` -> ``court_name``) and loads the result
+    table through plain POSTs, so we can issue those calls with a
+    ``requests.Session`` and parse the returned HTML fragments directly.
+
+    An engine carries the session cookies and ``app_token`` of one form
+    visit, so it is not shared between concurrent calls: use a new engine
+    per call, and ``worker_engine()`` copies for parallel workers.
+    """
+
+    INDEX_PATH = "?p=cause_list/index"
+    DISTRICTS_PATH = "?p=cause_list/fillDistrict"
+    COMPLEXES_PATH = "?p=cause_list/fillComplex"
+    COURTS_PATH = "?p=cause_list/fillCauseList"
+    SUBMIT_PATH = "?p=cause_list/submitCauseList"
+
+    CASE_TYPE_CODES = {"civil": "civ", "criminal": "cri"}
+
+    def __init__(self, session: Optional[requests.Session] = None, base_url: Optional[str] = None,
+                 timeout: Optional[float] = None):
+        self.session = session or requests.Session()
+        self.base_url = base_url or settings.ECOURTS_BASE_URL
+        self.timeout = timeout or settings.SCRAPING_TIMEOUT
+        self.upstream = upstreams.for_url(self.base_url)
+        self.app_token = ""
+
+    def _url(self, path: str) -> str:
+        return self.base_url.rstrip("/") + "/" + path
+
+    def _post(self, path: str, data: Dict[str, str]) -> str:
+        """POST a form call and return the HTML fragment it carries"""
+        payload = dict(data, ajax_req="true", app_token=self.app_token)
+        with self.upstream.request(), NAVIGATION_SECONDS.labels("http").time():
+            response = self.session.post(self._url(path), data=payload, timeout=self.timeout)
+            response.raise_for_status()
+        return self._extract_fragment(response.text)
+
+    def _extract_fragment(self, body: str) -> str:
+        """Responses are either raw HTML or JSON wrapping one HTML fragment"""
+        stripped = body.lstrip()
+        if not stripped.startswith("{"):
+            return body
+
+        try:
+            payload = json.loads(stripped)
+        except ValueError:
+            raise ECourtsHttpError("Malformed JSON response from eCourts")
+
+        if payload.get("app_token"):
+            self.app_token = payload["app_token"]
+        if payload.get("errormsg"):
+            raise ECourtsHttpError(str(payload["errormsg"]))
+
+        fragments = [value for key, value in payload.items()
+                     if key != "app_token" and isinstance(value, str) and "<" in value]
+        return "".join(fragments)
+
+    @staticmethod
+    def _parse_options(fragment: str, select_id: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Return (value, text) pairs for non-empty options in a fragment"""
+        if not fragment.strip():
+            return []
+        document = lxml.html.fromstring(f"<div>{fragment}</div>")
+        if select_id:
+            selects = document.xpath(f"//select[@id='{select_id}']")
+            if not selects:
+                return []
+            document = selects[0]
+
+        options = []
+        for option in document.iter("option"):
+            value = (option.get("value") or "").strip()
+            text = " ".join(option.text_content().split())
+            if value and value not in ("0", "-1") and text:
+                options.append((value, text))
+        return options
+
+    @staticmethod
+    def _code_for(options: List[Tuple[str, str]], name: str) -> str:
+        for value, text in options:
+            if text == name:
+                return value
+        raise ECourtsHttpError(f"'{name}' not found")
+
+    def _state_options(self) -> List[Tuple[str, str]]:
+        with self.upstream.request(), NAVIGATION_SECONDS.labels("http").time():
+            response = self.session.get(self._url(self.INDEX_PATH), timeout=self.timeout)
+            response.raise_for_status()
+        document = lxml.html.fromstring(response.text)
+        token = document.xpath("//input[@id='app_token']/@value")
+        if token:
+            self.app_token = token[0]
+        return self._parse_options(response.text, "state_code")
+
+    def _district_options(self, state_code: str) -> List[Tuple[str, str]]:
+        return self._parse_options(self._post(self.DISTRICTS_PATH, {"state_code": state_code}))
+
+    def _complex_options(self, state_code: str, dist_code: str) -> List[Tuple[str, str]]:
+        return self._parse_options(self._post(self.COMPLEXES_PATH, {
+            "state_code": state_code, "dist_code": dist_code
+        }))
+
+    def _court_options(self, state_code: str, dist_code: str, court_code: str) -> List[Tuple[str, str]]:
+        return self._parse_options(self._post(self.COURTS_PATH, {
+            "state_code": state_code, "dist_code": dist_code, "court_code": court_code
+        }))
+
+    def _resolve_codes(self, state: str, district: str = None, court_complex: str = None) -> List[str]:
+        with DROPDOWN_CASCADE_SECONDS.labels("http").time():
+            codes = [self._code_for(self._state_options(), state)]
+            if district is not None:
+                codes.append(self._code_for(self._district_options(codes[0]), district))
+            if court_complex is not None:
+                codes.append(self._code_for(self._complex_options(*codes), court_complex))
+        return codes
+
+    def get_states(self) -> List[str]:
+        return [text for _, text in self._state_options()]
+
+    def get_districts(self, state: str) -> List[str]:
+        state_code, = self._resolve_codes(state)
+        return [text for _, text in self._district_options(state_code)]
+
+    def get_court_complexes(self, state: str, district: str) -> List[str]:
+        state_code, dist_code = self._resolve_codes(state, district)
+        return [text for _, text in self._complex_options(state_code, dist_code)]
+
+    def get_judges(self, state: str, district: str, court_complex: str) -> List[JudgeInfo]:
+        codes = self._resolve_codes(state, district, court_complex)
+        return [
+            JudgeInfo(name=text, designation="Judge", court_number=value)
+            for value, text in self._court_options(*codes)
+        ]
+
+    def worker_engine(self) -> "ECourtsHttpEngine":
+        """A copy with its own session for a parallel worker, sharing cookies and token"""
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        session.cookies.update(self.session.cookies)
+        engine = ECourtsHttpEngine(session, base_url=self.base_url, timeout=self.timeout)
+        engine.app_token = self.app_token
+        return engine
+
+    def _fetch_work_item(self, codes: List[str], court_complex: str, date: str,
+                         item: Tuple[str, str, str]) -> Optional[CompactCauseList]:
+        court_value, judge_name, ct = item
+        state_code, dist_code, court_code = codes
+        with span("scrape.judge", judge=judge_name, case_type=ct, engine="http") as item_span:
+            fragment = self._post(self.SUBMIT_PATH, {
+                "state_code": state_code,
+                "dist_code": dist_code,
+                "court_code": court_code,
+                "court_name": court_value,
+                "hearing_date": date,
+                "cicri": self.CASE_TYPE_CODES.get(ct, ct),
+            })
+            entries = parse_cause_list_rows(fragment)
+            item_span.set_attribute("entries", len(entries))
+        if not entries:
+            return None
+        return CompactCauseList(
+            court_name=court_complex,
+            judge_name=judge_name,
+            date=date,
+            case_type=ct,
+            entries=entries
+        )
+
+    def fetch_cause_list(self, state: str, district: str, court_complex: str,
+                         court_name: Optional[str], date: str, case_type: str = "both",
+                         progress: Optional[Callable] = None) -> List[CompactCauseList]:
+        codes = self._resolve_codes(state, district, court_complex)
+        courts = self._court_options(*codes)
+
+        if court_name:
+            courts = [(value, text) for value, text in courts if court_name in text][:1]
+
+        case_types_to_try = ["civil", "criminal"] if case_type == "both" else [case_type]
+        work_items = [(value, text, ct) for value, text in courts for ct in case_types_to_try]
+
+        results = run_work_items(
+            work_items,
+            lambda engine, item: engine._fetch_work_item(codes, court_complex, date, item),
+            lambda: nullcontext(self.worker_engine()),
+            min(settings.SCRAPE_PARALLELISM, self.upstream.max_concurrent),
+            per_judge_progress([item[1] for item in work_items], progress)
+        )
+        return [cause_list for cause_list in results if cause_list]
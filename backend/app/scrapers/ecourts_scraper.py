@@ -1,339 +1,359 @@
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-import re
-from selenium import webdriver
+from typing import Callable, List, Optional
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import Select
 import time
-from app.models.schemas import CauseListData, CauseListEntry, JudgeInfo
+from contextlib import contextmanager
+from app.core.config import settings
+from app.models.compact import CompactCauseList, CompactEntries
+from app.models.schemas import JudgeInfo
+from app.scrapers.driver_pool import DriverPool, driver_pool
+from app.scrapers.ecourts_http import ECourtsHttpEngine
+from app.scrapers.parallel import run_work_items, per_judge_progress
+from app.scrapers.table_parser import parse_cause_list_rows
+from app.utils.metrics import DROPDOWN_CASCADE_SECONDS, SCRAPER_FAILURES, SCRAPER_RETRIES
+from app.utils.tracing import span
+from app.utils.upstream import UpstreamUnavailable, upstreams
+
+class _FormSession:
+    """A leased browser plus whether it is sitting on a filled-in cause list form"""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.ready = False
 
 class ECourtsScraper:
-    def __init__(self):
-        self.base_url = "https://services.ecourts.gov.in/ecourtindia_v6/"
+    def __init__(self, pool: Optional[DriverPool] = None):
+        self.base_url = settings.ECOURTS_BASE_URL
         self.cause_list_url = f"{self.base_url}?p=cause_list/index"
-        self.session = requests.Session()
-        self.driver = None
+        self.pool = pool or driver_pool
+        self.upstream = upstreams.for_url(self.base_url)
         
-    def setup_driver(self):
-        """Setup Chrome driver with appropriate options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        return self.driver
-    
-    def close_driver(self):
-        """Close the Chrome driver"""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+    def _via_http(self, engine: Optional[str], method: str, *args, **kwargs):
+        """Run a call on the HTTP engine; None means use the Selenium path instead"""
+        if (engine or settings.SCRAPER_ENGINE) != "http":
+            return None
+        state = args[0] if args else ""
+        try:
+            # A fresh engine per call: its session cookies and app_token belong to one form visit
+            http_engine = ECourtsHttpEngine(base_url=self.base_url)
+            result = getattr(http_engine, method)(*args, **kwargs)
+            if result:
+                return result
+        except UpstreamUnavailable:
+            raise  # same host either way, so no point falling back to Selenium
+        except Exception as e:
+            print(f"HTTP engine failed in {method}: {str(e)}")
+            SCRAPER_FAILURES.labels("ecourts_http", state).inc()
+        if not settings.SCRAPER_ENGINE_FALLBACK:
+            return []
+        SCRAPER_RETRIES.labels("ecourts", state).inc()
+        return None
     
-    def get_states(self) -> List[str]:
+    def get_states(self, engine: Optional[str] = None) -> List[str]:
         """Fetch list of states from eCourts website"""
+        result = self._via_http(engine, "get_states")
+        if result is not None:
+            return result
+        
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            self.driver.get(self.cause_list_url)
-            time.sleep(3)
-            
-            # Find state dropdown
-            state_select = Select(self.driver.find_element(By.ID, "state_code"))
-            states = []
-            
-            for option in state_select.options[1:]:  # Skip first empty option
-                if option.text.strip():
-                    states.append(option.text.strip())
-            
-            return states
+            with self.pool.lease() as driver:
+                driver.get(self.cause_list_url)
+                time.sleep(3)
+                
+                # Find state dropdown
+                state_select = Select(driver.find_element(By.ID, "state_code"))
+                states = []
+                
+                for option in state_select.options[1:]:  # Skip first empty option
+                    if option.text.strip():
+                        states.append(option.text.strip())
+                
+                return states
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
             print(f"Error fetching states: {str(e)}")
+            SCRAPER_FAILURES.labels("ecourts", "").inc()
             return []
     
-    def get_districts(self, state: str) -> List[str]:
+    def get_districts(self, state: str, engine: Optional[str] = None) -> List[str]:
         """Fetch districts for a given state"""
+        result = self._via_http(engine, "get_districts", state)
+        if result is not None:
+            return result
+        
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            self.driver.get(self.cause_list_url)
-            time.sleep(3)
-            
-            # Select state
-            state_select = Select(self.driver.find_element(By.ID, "state_code"))
-            for option in state_select.options:
-                if option.text.strip() == state:
-                    state_select.select_by_visible_text(state)
-                    break
-            
-            # Wait for districts to load
-            time.sleep(3)
-            
-            district_select = Select(self.driver.find_element(By.ID, "dist_code"))
-            districts = []
-            
-            for option in district_select.options[1:]:  # Skip first empty option
-                if option.text.strip():
-                    districts.append(option.text.strip())
-            
-            return districts
+            with self.pool.lease() as driver:
+                driver.get(self.cause_list_url)
+                time.sleep(3)
+                
+                # Select state
+                state_select = Select(driver.find_element(By.ID, "state_code"))
+                for option in state_select.options:
+                    if option.text.strip() == state:
+                        state_select.select_by_visible_text(state)
+                        break
+                
+                # Wait for districts to load
+                time.sleep(3)
+                
+                district_select = Select(driver.find_element(By.ID, "dist_code"))
+                districts = []
+                
+                for option in district_select.options[1:]:  # Skip first empty option
+                    if option.text.strip():
+                        districts.append(option.text.strip())
+                
+                return districts
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
             print(f"Error fetching districts: {str(e)}")
+            SCRAPER_FAILURES.labels("ecourts", state).inc()
             return []
     
-    def get_court_complexes(self, state: str, district: str) -> List[str]:
+    def get_court_complexes(self, state: str, district: str, engine: Optional[str] = None) -> List[str]:
         """Fetch court complexes for a given state and district"""
+        result = self._via_http(engine, "get_court_complexes", state, district)
+        if result is not None:
+            return result
+        
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            self.driver.get(self.cause_list_url)
-            time.sleep(3)
-            
-            # Select state
-            state_select = Select(self.driver.find_element(By.ID, "state_code"))
-            for option in state_select.options:
-                if option.text.strip() == state:
-                    state_select.select_by_visible_text(state)
-                    break
-            
-            time.sleep(2)
-            
-            # Select district
-            district_select = Select(self.driver.find_element(By.ID, "dist_code"))
-            for option in district_select.options:
-                if option.text.strip() == district:
-                    district_select.select_by_visible_text(district)
-                    break
-            
-            # Wait for court complexes to load
-            time.sleep(3)
-            
-            court_select = Select(self.driver.find_element(By.ID, "court_code"))
-            courts = []
-            
-            for option in court_select.options[1:]:  # Skip first empty option
-                if option.text.strip():
-                    courts.append(option.text.strip())
-            
-            return courts
+            with self.pool.lease() as driver:
+                driver.get(self.cause_list_url)
+                time.sleep(3)
+                
+                # Select state
+                state_select = Select(driver.find_element(By.ID, "state_code"))
+                for option in state_select.options:
+                    if option.text.strip() == state:
+                        state_select.select_by_visible_text(state)
+                        break
+                
+                time.sleep(2)
+                
+                # Select district
+                district_select = Select(driver.find_element(By.ID, "dist_code"))
+                for option in district_select.options:
+                    if option.text.strip() == district:
+                        district_select.select_by_visible_text(district)
+                        break
+                
+                # Wait for court complexes to load
+                time.sleep(3)
+                
+                court_select = Select(driver.find_element(By.ID, "court_code"))
+                courts = []
+                
+                for option in court_select.options[1:]:  # Skip first empty option
+                    if option.text.strip():
+                        courts.append(option.text.strip())
+                
+                return courts
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
             print(f"Error fetching court complexes: {str(e)}")
+            SCRAPER_FAILURES.labels("ecourts", state).inc()
             return []
     
-    def get_judges(self, state: str, district: str, court_complex: str) -> List[JudgeInfo]:
+    def get_judges(self, state: str, district: str, court_complex: str,
+                   engine: Optional[str] = None) -> List[JudgeInfo]:
         """Fetch judges for a given court complex"""
+        result = self._via_http(engine, "get_judges", state, district, court_complex)
+        if result is not None:
+            return result
+        
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            self.driver.get(self.cause_list_url)
-            time.sleep(3)
-            
-            # Select state
-            state_select = Select(self.driver.find_element(By.ID, "state_code"))
-            for option in state_select.options:
-                if option.text.strip() == state:
-                    state_select.select_by_visible_text(state)
-                    break
-            
-            time.sleep(2)
-            
-            # Select district
-            district_select = Select(self.driver.find_element(By.ID, "dist_code"))
-            for option in district_select.options:
-                if option.text.strip() == district:
-                    district_select.select_by_visible_text(district)
-                    break
-            
-            time.sleep(2)
-            
-            # Select court complex
-            court_select = Select(self.driver.find_element(By.ID, "court_code"))
-            for option in court_select.options:
-                if option.text.strip() == court_complex:
-                    court_select.select_by_visible_text(court_complex)
-                    break
-            
-            # Wait for judges to load
-            time.sleep(3)
-            
-            judge_select = Select(self.driver.find_element(By.ID, "court_name"))
-            judges = []
-            
-            for option in judge_select.options[1:]:  # Skip first empty option
-                if option.text.strip():
-                    # Parse judge info (usually contains court number, name, and designation)
-                    judge_text = option.text.strip()
-                    judges.append(JudgeInfo(
-                        name=judge_text,
-                        designation="Judge",  # Default designation
-                        court_number=option.get_attribute("value") or ""
-                    ))
-            
-            return judges
+            with self.pool.lease() as driver:
+                driver.get(self.cause_list_url)
+                time.sleep(3)
+                
+                # Select state
+                state_select = Select(driver.find_element(By.ID, "state_code"))
+                for option in state_select.options:
+                    if option.text.strip() == state:
+                        state_select.select_by_visible_text(state)
+                        break
+                
+                time.sleep(2)
+                
+                # Select district
+                district_select = Select(driver.find_element(By.ID, "dist_code"))
+                for option in district_select.options:
+                    if option.text.strip() == district:
+                        district_select.select_by_visible_text(district)
+                        break
+                
+                time.sleep(2)
+                
+                # Select court complex
+                court_select = Select(driver.find_element(By.ID, "court_code"))
+                for option in court_select.options:
+                    if option.text.strip() == court_complex:
+                        court_select.select_by_visible_text(court_complex)
+                        break
+                
+                # Wait for judges to load
+                time.sleep(3)
+                
+                judge_select = Select(driver.find_element(By.ID, "court_name"))
+                judges = []
+                
+                for option in judge_select.options[1:]:  # Skip first empty option
+                    if option.text.strip():
+                        # Parse judge info (usually contains court number, name, and designation)
+                        judge_text = option.text.strip()
+                        judges.append(JudgeInfo(
+                            name=judge_text,
+                            designation="Judge",  # Default designation
+                            court_number=option.get_attribute("value") or ""
+                        ))
+                
+                return judges
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
             print(f"Error fetching judges: {str(e)}")
+            SCRAPER_FAILURES.labels("ecourts", state).inc()
             return []
     
     def fetch_cause_list(self, state: str, district: str, court_complex: str, 
-                        court_name: Optional[str], date: str, case_type: str = "both") -> List[CauseListData]:
+                        court_name: Optional[str], date: str, case_type: str = "both",
+                        engine: Optional[str] = None, progress: Optional[Callable] = None) -> List[CompactCauseList]:
         """Fetch cause list data from eCourts website"""
+        result = self._via_http(engine, "fetch_cause_list", state, district, court_complex, court_name,
+                                date, case_type, progress=progress)
+        if result is not None:
+            return result
+        
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            self.driver.get(self.cause_list_url)
-            time.sleep(3)
-            
-            # Select state
-            state_select = Select(self.driver.find_element(By.ID, "state_code"))
-            for option in state_select.options:
-                if option.text.strip() == state:
-                    state_select.select_by_visible_text(state)
-                    break
-            
-            time.sleep(2)
-            
-            # Select district
-            district_select = Select(self.driver.find_element(By.ID, "dist_code"))
-            for option in district_select.options:
-                if option.text.strip() == district:
-                    district_select.select_by_visible_text(district)
-                    break
-            
-            time.sleep(2)
-            
-            # Select court complex
-            court_select = Select(self.driver.find_element(By.ID, "court_code"))
-            for option in court_select.options:
-                if option.text.strip() == court_complex:
-                    court_select.select_by_visible_text(court_complex)
-                    break
-            
-            time.sleep(2)
-            
-            # Get all judges if no specific court name provided
-            judge_select = Select(self.driver.find_element(By.ID, "court_name"))
-            judges_to_process = []
-            
-            if court_name:
-                # Find specific judge
-                for option in judge_select.options[1:]:
-                    if court_name in option.text:
-                        judges_to_process.append((option.get_attribute("value"), option.text))
-                        break
-            else:
-                # Get all judges
-                for option in judge_select.options[1:]:
-                    if option.text.strip():
-                        judges_to_process.append((option.get_attribute("value"), option.text))
-            
-            cause_lists = []
-            
-            for judge_value, judge_name in judges_to_process:
-                try:
-                    # Select judge
-                    judge_select = Select(self.driver.find_element(By.ID, "court_name"))
-                    judge_select.select_by_value(judge_value)
-                    
-                    # Set date
-                    date_input = self.driver.find_element(By.ID, "hearing_date")
-                    date_input.clear()
-                    date_input.send_keys(date)
-                    
-                    # Handle captcha (this is a limitation - would need manual intervention or OCR)
-                    # For now, we'll skip captcha handling
-                    
-                    # Try both civil and criminal if case_type is "both"
-                    case_types_to_try = []
-                    if case_type == "both":
-                        case_types_to_try = ["civil", "criminal"]
-                    else:
-                        case_types_to_try = [case_type]
-                    
-                    for ct in case_types_to_try:
-                        try:
-                            # Click appropriate button
-                            if ct == "civil":
-                                civil_btn = self.driver.find_element(By.NAME, "civil_btn")
-                                civil_btn.click()
-                            else:
-                                criminal_btn = self.driver.find_element(By.NAME, "criminal_btn")
-                                criminal_btn.click()
-                            
-                            time.sleep(3)
-                            
-                            # Parse the result table
-                            entries = self._parse_cause_list_table()
-                            
-                            if entries:
-                                cause_list_data = CauseListData(
-                                    court_name=court_complex,
-                                    judge_name=judge_name,
-                                    date=date,
-                                    case_type=ct,
-                                    entries=entries
-                                )
-                                cause_lists.append(cause_list_data)
-                            
-                            # Go back to form
-                            self.driver.back()
-                            time.sleep(2)
-                            
-                        except Exception as e:
-                            print(f"Error processing {ct} cases for {judge_name}: {str(e)}")
-                            continue
+            with self.pool.lease() as driver:
+                driver.get(self.cause_list_url)
+                time.sleep(3)
+                self._select_court_complex(driver, state, district, court_complex)
                 
-                except Exception as e:
-                    print(f"Error processing judge {judge_name}: {str(e)}")
-                    continue
-            
-            return cause_lists
-            
+                # Get all judges if no specific court name provided
+                judge_select = Select(driver.find_element(By.ID, "court_name"))
+                judges_to_process = []
+                
+                if court_name:
+                    # Find specific judge
+                    for option in judge_select.options[1:]:
+                        if court_name in option.text:
+                            judges_to_process.append((option.get_attribute("value"), option.text))
+                            break
+                else:
+                    # Get all judges
+                    for option in judge_select.options[1:]:
+                        if option.text.strip():
+                            judges_to_process.append((option.get_attribute("value"), option.text))
+            
+            # Try both civil and criminal if case_type is "both"
+            case_types_to_try = ["civil", "criminal"] if case_type == "both" else [case_type]
+            work_items = [
+                (judge_value, judge_name, ct)
+                for judge_value, judge_name in judges_to_process
+                for ct in case_types_to_try
+            ]
+            
+            # Spread judge x case type work over several browser sessions
+            results = run_work_items(
+                work_items,
+                lambda session, item: self._fetch_work_item(session, state, district, court_complex, date, item),
+                self._form_session,
+                min(settings.SCRAPE_PARALLELISM, self.pool.size, self.upstream.max_concurrent),
+                per_judge_progress([item[1] for item in work_items], progress)
+            )
+            return [cause_list for cause_list in results if cause_list]
+            
+        except UpstreamUnavailable:
+            raise
         except Exception as e:
             print(f"Error fetching cause list: {str(e)}")
+            SCRAPER_FAILURES.labels("ecourts", state).inc()
             return []
     
-    def _parse_cause_list_table(self) -> List[CauseListEntry]:
+    def _select_court_complex(self, driver, state: str, district: str, court_complex: str):
+        """Walk the state -> district -> court complex selects on the cause list form"""
+        with DROPDOWN_CASCADE_SECONDS.labels("selenium").time():
+            for element_id, value in (("state_code", state), ("dist_code", district), ("court_code", court_complex)):
+                select = Select(driver.find_element(By.ID, element_id))
+                for option in select.options:
+                    if option.text.strip() == value:
+                        select.select_by_visible_text(value)
+                        break
+                
+                # Wait for the next select to load
+                time.sleep(2)
+    
+    @contextmanager
+    def _form_session(self):
+        """Lease a browser for a worker; the form is filled on first use"""
+        with self.pool.lease() as driver:
+            yield _FormSession(driver)
+    
+    def _fetch_work_item(self, session: "_FormSession", state: str, district: str, court_complex: str,
+                         date: str, item) -> Optional[CompactCauseList]:
+        """Fetch one judge's civil or criminal list on a worker's browser"""
+        judge_value, judge_name, ct = item
+        driver = session.driver
+        
+        with span("scrape.judge", judge=judge_name, case_type=ct, engine="selenium") as item_span:
+            try:
+                if not session.ready:
+                    driver.get(self.cause_list_url)
+                    time.sleep(3)
+                    self._select_court_complex(driver, state, district, court_complex)
+                    session.ready = True
+            
+                # Select judge
+                judge_select = Select(driver.find_element(By.ID, "court_name"))
+                judge_select.select_by_value(judge_value)
+            
+                # Set date
+                date_input = driver.find_element(By.ID, "hearing_date")
+                date_input.clear()
+                date_input.send_keys(date)
+            
+                # Handle captcha (this is a limitation - would need manual intervention or OCR)
+                # For now, we'll skip captcha handling
+            
+                # Click appropriate button
+                button_name = "civil_btn" if ct == "civil" else "criminal_btn"
+                button = driver.find_element(By.NAME, button_name)
+                with self.upstream.request():
+                    button.click()
+                time.sleep(3)
+            
+                # Parse the result table
+                entries = self._parse_cause_list_table(driver)
+                item_span.set_attribute("entries", len(entries))
+            
+                # Go back to form
+                driver.back()
+                time.sleep(2)
+            except Exception:
+                # Start from a fresh page on this worker's next item
+                session.ready = False
+                SCRAPER_FAILURES.labels("ecourts", state).inc()
+                raise
+        
+        if not entries:
+            return None
+        
+        return CompactCauseList(
+            court_name=court_complex,
+            judge_name=judge_name,
+            date=date,
+            case_type=ct,
+            entries=entries
+        )
+    
+    def _parse_cause_list_table(self, driver) -> CompactEntries:
         """Parse cause list table from the webpage"""
         try:
-            # Look for table containing cause list data
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
-            entries = []
-            
-            for table in tables:
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                
-                for row in rows[1:]:  # Skip header row
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
-                    if len(cells) >= 3:  # Minimum expected columns
-                        entry = CauseListEntry(
-                            sr_no=cells[0].text.strip() if len(cells) > 0 else "",
-                            case_number=cells[1].text.strip() if len(cells) > 1 else "",
-                            case_title=cells[2].text.strip() if len(cells) > 2 else "",
-                            petitioner=cells[3].text.strip() if len(cells) > 3 else "",
-                            respondent=cells[4].text.strip() if len(cells) > 4 else "",
-                            advocate=cells[5].text.strip() if len(cells) > 5 else "",
-                            case_type=cells[6].text.strip() if len(cells) > 6 else "",
-                            stage=cells[7].text.strip() if len(cells) > 7 else "",
-                            purpose=cells[8].text.strip() if len(cells) > 8 else ""
-                        )
-                        entries.append(entry)
-            
-            return entries
-            
+            return parse_cause_list_rows(driver.page_source)
         except Exception as e:
             print(f"Error parsing cause list table: {str(e)}")
-            return []
+            return CompactEntries()
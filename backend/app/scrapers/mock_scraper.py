@@ -1,11 +1,56 @@
-from typing import List
-from app.models.schemas import JudgeInfo, CauseListData, CauseListEntry
+import random
+import time
+from typing import Callable, List, Optional
+from app.core.config import settings
+from app.models.compact import CompactCauseList, CompactEntries
+from app.models.schemas import JudgeInfo
+from app.utils.tracing import span
+
+# Words used to pad text fields up to MOCK_FIELD_LENGTH
+FILLER_WORDS = ("and", "others", "through", "legal", "heirs", "union", "of", "india", "state",
+                "municipal", "corporation", "private", "limited", "trust", "society", "bank")
 
 class MockScraper:
-    """Mock scraper for testing without Chrome driver dependencies"""
+    """Mock scraper for testing without Chrome driver dependencies.
+    
+    The defaults reproduce the fixed 5 judges x 10 entries. For load tests the
+    size, field lengths and latency come from the MOCK_* settings (or the
+    arguments); generated data depends only on the seed and the request, so
+    repeated runs produce identical lists.
+    """
+    
+    def __init__(self, judges: int = None, entries_per_judge: int = None, field_length: int = None,
+                 latency: float = None, jitter: float = None, seed: int = None):
+        self.judges = settings.MOCK_JUDGES if judges is None else judges
+        self.entries_per_judge = settings.MOCK_ENTRIES_PER_JUDGE if entries_per_judge is None else entries_per_judge
+        self.field_length = settings.MOCK_FIELD_LENGTH if field_length is None else field_length
+        self.latency = settings.MOCK_LATENCY if latency is None else latency
+        self.jitter = settings.MOCK_JITTER if jitter is None else jitter
+        self.seed = settings.MOCK_SEED if seed is None else seed
+        self._latency_rng = random.Random(self.seed)
+    
+    def _wait(self):
+        """Stand-in for one page load: MOCK_LATENCY +/- MOCK_JITTER seconds"""
+        if self.latency <= 0 and self.jitter <= 0:
+            return
+        delay = self.latency + self._latency_rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _pad(self, text: str, rng: random.Random) -> str:
+        if len(text) >= self.field_length:
+            return text
+        words = [text]
+        length = len(text)
+        while length < self.field_length:
+            word = rng.choice(FILLER_WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words)[:self.field_length]
     
     def get_states(self) -> List[str]:
         """Return mock list of states"""
+        self._wait()
         return [
             "Delhi",
             "Maharashtra", 
@@ -21,6 +66,7 @@ class MockScraper:
     
     def get_districts(self, state: str) -> List[str]:
         """Return mock districts for a state"""
+        self._wait()
         if state.lower() == "delhi":
             return ["Delhi"]
         elif state.lower() == "maharashtra":
@@ -32,6 +78,7 @@ class MockScraper:
     
     def get_court_complexes(self, state: str, district: str) -> List[str]:
         """Return mock court complexes"""
+        self._wait()
         if state.lower() == "delhi":
             return [
                 "Patiala House Court Complex",
@@ -50,8 +97,12 @@ class MockScraper:
     
     def get_judges(self, state: str, district: str, court_complex: str) -> List[JudgeInfo]:
         """Return mock judges for a court complex"""
+        self._wait()
+        return self._judges(court_complex)
+    
+    def _judges(self, court_complex: str) -> List[JudgeInfo]:
         judges = []
-        for i in range(1, 6):  # 5 mock judges
+        for i in range(1, self.judges + 1):
             judges.append(JudgeInfo(
                 name=f"Hon'ble Judge {i} - {court_complex}",
                 designation="District Judge" if i <= 2 else "Additional District Judge",
@@ -60,11 +111,12 @@ class MockScraper:
         return judges
     
     def fetch_cause_list(self, state: str, district: str, court_complex: str, 
-                        court_name: str = None, date: str = None, case_type: str = "both") -> List[CauseListData]:
+                        court_name: str = None, date: str = None, case_type: str = "both",
+                        engine: str = None, progress: Optional[Callable] = None) -> List[CompactCauseList]:
         """Return mock cause list data"""
         
         # Get judges to process
-        judges = self.get_judges(state, district, court_complex)
+        judges = self._judges(court_complex)
         judges_to_process = []
         
         if court_name:
@@ -79,30 +131,39 @@ class MockScraper:
         cause_lists = []
         
         for judge in judges_to_process:
-            # Create mock cause list entries
-            entries = []
-            for i in range(1, 11):  # 10 mock cases per judge
-                entry = CauseListEntry(
-                    sr_no=str(i),
-                    case_number=f"CC/{i:03d}/2024",
-                    case_title=f"Sample Case {i} vs State",
-                    petitioner=f"Petitioner {i}",
-                    respondent=f"Respondent {i}",
-                    advocate=f"Advocate {i}",
-                    case_type="Civil" if i % 2 == 0 else "Criminal",
-                    stage="Arguments",
-                    purpose="Hearing"
+            with span("scrape.judge", judge=judge.name, case_type=case_type, engine="mock"):
+                self._wait()  # one cause list page per judge
+            
+                # Same seed and request, same filler text
+                rng = random.Random(f"{self.seed}:{court_complex}:{judge.court_number}:{date}:{case_type}")
+                pad = (lambda text: self._pad(text, rng)) if self.field_length else (lambda text: text)
+            
+                # Create mock cause list entries
+                entries = CompactEntries()
+                for i in range(1, self.entries_per_judge + 1):
+                    entries.append((
+                        str(i),                                  # sr_no
+                        f"CC/{i:03d}/2024",                      # case_number
+                        pad(f"Sample Case {i} vs State"),        # case_title
+                        pad(f"Petitioner {i}"),                  # petitioner
+                        pad(f"Respondent {i}"),                  # respondent
+                        pad(f"Advocate {i}"),                    # advocate
+                        "Civil" if i % 2 == 0 else "Criminal",   # case_type
+                        "Arguments",                             # stage
+                        "Hearing"                                # purpose
+                    ))
+            
+                # Create cause list data
+                cause_list_data = CompactCauseList(
+                    court_name=court_complex,
+                    judge_name=judge.name,
+                    date=date or "2024-10-15",
+                    case_type=case_type,
+                    entries=entries
                 )
-                entries.append(entry)
+                cause_lists.append(cause_list_data)
             
-            # Create cause list data
-            cause_list_data = CauseListData(
-                court_name=court_complex,
-                judge_name=judge.name,
-                date=date or "2024-10-15",
-                case_type=case_type,
-                entries=entries
-            )
-            cause_lists.append(cause_list_data)
+            if progress:
+                progress(len(cause_lists), len(judges_to_process), judge.name)
         
         return cause_lists
@@ -0,0 +1,103 @@
+import contextvars
+import queue
+import threading
+from typing import Any, Callable, ContextManager, List, Optional, Sequence
+from app.utils.upstream import UpstreamUnavailable
+
+
+def run_work_items(items: Sequence[Any], handler: Callable[[Any, Any], Any],
+                   session_factory: Callable[[], ContextManager], parallelism: int,
+                   on_item_done: Optional[Callable[[int, Any], None]] = None) -> List[Any]:
+    """Process work items on up to ``parallelism`` sessions and keep their order.
+
+    Each worker opens one session with ``session_factory()`` (a leased
+    browser, an HTTP client, ...) and calls ``handler(session, item)`` for
+    every item it picks up. Results come back in the order of ``items``; an
+    item whose handler raises is logged and yields ``None`` without stopping
+    the others. UpstreamUnavailable is the exception: once the host's circuit
+    is open the rest would fail too, so the run stops and raises it.
+    ``on_item_done(index, result)`` runs on the calling thread, so exceptions
+    it raises (e.g. job cancellation) propagate to the caller.
+    """
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results
+
+    pending: "queue.Queue" = queue.Queue()
+    for index, item in enumerate(items):
+        pending.put((index, item))
+    finished: "queue.Queue" = queue.Queue()
+    stop = threading.Event()
+
+    def worker():
+        try:
+            with session_factory() as session:
+                while not stop.is_set():
+                    try:
+                        index, item = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        finished.put((index, handler(session, item), None))
+                    except Exception as e:
+                        finished.put((index, None, e))
+        except Exception as e:
+            # Could not open a session: hand our share of the work to the others
+            finished.put((None, None, e))
+
+    workers = max(1, min(parallelism, len(items)))
+    for _ in range(workers):
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(worker,), daemon=True).start()
+
+    remaining = len(items)
+    failed_workers = 0
+    try:
+        while remaining:
+            index, result, error = finished.get()
+            if index is None:
+                failed_workers += 1
+                print(f"Error opening scraping session: {str(error)}")
+                if failed_workers == workers:
+                    # Nobody left to process the queue
+                    break
+                continue
+
+            remaining -= 1
+            if isinstance(error, UpstreamUnavailable):
+                raise error
+            if error is not None:
+                print(f"Error processing work item {items[index]}: {str(error)}")
+            results[index] = result
+            if on_item_done:
+                on_item_done(index, result)
+    finally:
+        stop.set()
+
+    return results
+
+
+def per_judge_progress(judge_names: Sequence[str],
+                       progress: Optional[Callable[[int, int, str], None]]) -> Optional[Callable[[int, Any], None]]:
+    """Turn per-item completions into ``progress(done, total, judge_name)`` calls.
+
+    ``judge_names[i]`` is the judge work item ``i`` belongs to; a judge counts
+    as done once all of its items (e.g. civil and criminal) have finished.
+    """
+    if not progress:
+        return None
+
+    outstanding = {}
+    for name in judge_names:
+        outstanding[name] = outstanding.get(name, 0) + 1
+    total = len(outstanding)
+    done = [0]
+
+    def on_item_done(index: int, _result):
+        name = judge_names[index]
+        outstanding[name] -= 1
+        if outstanding[name] == 0:
+            done[0] += 1
+            progress(done[0], total, name)
+
+    return on_item_done
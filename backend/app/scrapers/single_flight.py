@@ -0,0 +1,171 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from app.core.config import settings
+
+
+class FlightTimeout(Exception):
+    """Raised to a caller that gave up waiting for a shared scrape"""
+
+
+class FlightAbandoned(BaseException):
+    """Raised inside a shared scrape once every caller waiting on it has left.
+
+    A BaseException, like JobCancelled, so the scrapers' ``except Exception``
+    handlers don't swallow it.
+    """
+
+
+class _Waiter:
+    __slots__ = ("event", "progress", "error")
+
+    def __init__(self, progress: Optional[Callable]):
+        self.event = threading.Event()
+        self.progress = progress
+        self.error: Optional[BaseException] = None
+
+
+class _Flight:
+    def __init__(self):
+        self.waiters: List[_Waiter] = []
+        self.last_progress: Optional[tuple] = None
+        self.finished = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run one call per key no matter how many callers ask for it at once.
+
+    The first caller (the leader) runs the call on its own thread, so the
+    call occupies the leader's scrape_pool worker like any other scrape and
+    the pool keeps bounding how many run at once. Later callers wait for it
+    with their own timeout. Progress updates are forwarded to all callers; a
+    caller whose progress callback raises (e.g. job cancellation) leaves with
+    that error while the others keep waiting. The call itself is aborted at
+    its next progress update once nobody is waiting on it any more, which can
+    only happen after the leader itself left that way.
+    """
+
+    def __init__(self, wait_timeout: int = None):
+        self.wait_timeout = wait_timeout if wait_timeout is not None else settings.SINGLE_FLIGHT_WAIT_TIMEOUT
+        self.counters = {"calls": 0, "shared": 0}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[Callable], Any],
+           progress: Optional[Callable] = None, timeout: Optional[float] = None) -> Any:
+        """Return ``func(progress)`` for ``key``, sharing it with concurrent callers.
+
+        ``func`` receives a progress callback to pass on to the scraper.
+        """
+        waiter = _Waiter(progress)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            flight.waiters.append(waiter)
+            self.counters["calls" if leader else "shared"] += 1
+            replay = flight.last_progress
+
+        if leader:
+            # Returns once the call is done, with every waiter's event set
+            self._run(key, flight, func)
+        elif replay is not None:
+            self._notify(key, flight, waiter, replay)
+
+        timeout = self.wait_timeout if timeout is None else timeout
+        try:
+            if not waiter.event.wait(timeout or None):
+                raise FlightTimeout(f"Timed out after {timeout}s waiting for an in-flight scrape")
+            if waiter.error is not None:
+                raise waiter.error
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        finally:
+            self._leave(key, flight, waiter)
+
+    def _run(self, key: Hashable, flight: _Flight, func: Callable[[Callable], Any]):
+        def shared_progress(*args):
+            with self._lock:
+                flight.last_progress = args
+                waiters = list(flight.waiters)
+            for waiter in waiters:
+                self._notify(key, flight, waiter, args)
+            with self._lock:
+                if not flight.waiters:
+                    raise FlightAbandoned()
+
+        try:
+            flight.result = func(shared_progress)
+        except BaseException as e:
+            flight.error = e
+        finally:
+            with self._lock:
+                flight.finished = True
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                waiters = list(flight.waiters)
+            for waiter in waiters:
+                waiter.event.set()
+
+    def _notify(self, key: Hashable, flight: _Flight, waiter: _Waiter, args: tuple):
+        if waiter.progress is None:
+            return
+        try:
+            waiter.progress(*args)
+        except BaseException as e:
+            # This caller is done (cancelled); the others carry on
+            waiter.error = e
+            self._leave(key, flight, waiter)
+            waiter.event.set()
+
+    def _leave(self, key: Hashable, flight: _Flight, waiter: _Waiter):
+        with self._lock:
+            if waiter in flight.waiters:
+                flight.waiters.remove(waiter)
+            if not flight.waiters and not flight.finished and self._flights.get(key) is flight:
+                # Nobody left: let the next caller start afresh rather than join a dying call
+                del self._flights[key]
+
+
+def _normalize(value: Any) -> Any:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+class CoalescingScraper:
+    """Scraper wrapper that lets identical concurrent requests share one scrape"""
+
+    def __init__(self, scraper, flights: Optional[SingleFlight] = None):
+        self.scraper = scraper
+        self.flights = flights or SingleFlight()
+
+    def _shared(self, method: str, args: tuple, kwargs: dict, progress: Optional[Callable] = None):
+        key = (method,) + tuple(_normalize(arg) for arg in args) + tuple(
+            (name, _normalize(value)) for name, value in sorted(kwargs.items())
+        )
+        call = getattr(self.scraper, method)
+        if method == "fetch_cause_list":
+            func = lambda shared_progress: call(*args, progress=shared_progress, **kwargs)
+        else:
+            func = lambda _shared_progress: call(*args, **kwargs)
+        return self.flights.do(key, func, progress=progress)
+
+    def get_states(self, *args, **kwargs) -> List[str]:
+        return self._shared("get_states", args, kwargs)
+
+    def get_districts(self, *args, **kwargs) -> List[str]:
+        return self._shared("get_districts", args, kwargs)
+
+    def get_court_complexes(self, *args, **kwargs) -> List[str]:
+        return self._shared("get_court_complexes", args, kwargs)
+
+    def get_judges(self, *args, **kwargs):
+        return self._shared("get_judges", args, kwargs)
+
+    def fetch_cause_list(self, *args, progress: Optional[Callable] = None, **kwargs):
+        return self._shared("fetch_cause_list", args, kwargs, progress)
+
+    def __getattr__(self, name):
+        return getattr(self.scraper, name)
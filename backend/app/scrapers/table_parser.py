@@ -0,0 +1,102 @@
+from typing import Dict, List, Optional
+import lxml.html
+from app.models.compact import ENTRY_FIELDS, CompactEntries
+from app.models.schemas import CauseListEntry
+from app.utils.metrics import TABLE_PARSE_SECONDS
+
+# Column order used by the court sites when a table has no recognisable header
+POSITIONAL_FIELDS = [
+    "sr_no", "case_number", "case_title", "petitioner", "respondent",
+    "advocate", "case_type", "stage", "purpose"
+]
+
+# Header keywords mapped to CauseListEntry fields, checked in order
+HEADER_KEYWORDS = [
+    ("sr_no", ("sr", "s.no", "sl", "serial", "item")),
+    ("case_number", ("case no", "case number", "case_no", "cnr", "registration")),
+    ("petitioner", ("petitioner", "appellant", "complainant", "plaintiff")),
+    ("respondent", ("respondent", "accused", "defendant")),
+    ("advocate", ("advocate", "counsel", "lawyer")),
+    ("case_type", ("case type", "type")),
+    ("stage", ("stage", "status")),
+    ("purpose", ("purpose", "business", "remarks")),
+    ("case_title", ("title", "parties", "party name", "versus", "particulars")),
+]
+
+MIN_CELLS = 3  # Minimum expected columns for a data row
+
+
+def _cell_text(cell) -> str:
+    return " ".join(cell.text_content().split())
+
+
+def _match_header(text: str) -> Optional[str]:
+    text = text.lower()
+    for field, keywords in HEADER_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            return field
+    return None
+
+
+def _detect_columns(header_cells: List[str]) -> Optional[Dict[int, str]]:
+    """Map column index to entry field if the row looks like a header"""
+    columns = {}
+    for index, text in enumerate(header_cells):
+        field = _match_header(text)
+        if field and field not in columns.values():
+            columns[index] = field
+    # Need at least two recognised columns to trust the header
+    return columns if len(columns) >= 2 else None
+
+
+def _positional_columns(width: int) -> Dict[int, str]:
+    return {i: field for i, field in enumerate(POSITIONAL_FIELDS[:width])}
+
+
+def parse_cause_list_rows(html: str) -> CompactEntries:
+    """Parse every cause list table in a page in a single pass.
+
+    Takes the full page source (e.g. ``driver.page_source``) so a list costs
+    one WebDriver round trip instead of one per table, row and cell. Rows
+    go straight into column storage without per-row model validation.
+    """
+    with TABLE_PARSE_SECONDS.time():
+        return _parse_rows(html)
+
+
+def _parse_rows(html: str) -> CompactEntries:
+    entries = CompactEntries()
+    if not html or not html.strip():
+        return entries
+
+    document = lxml.html.fromstring(html)
+    positions = {field: index for index, field in enumerate(ENTRY_FIELDS)}
+
+    for table in document.iter("table"):
+        # Skip tables nested in this one; they are visited on their own
+        rows = [row for row in table.iter("tr") if next(row.iterancestors("table")) is table]
+        if len(rows) < 2:
+            continue
+
+        header = [_cell_text(cell) for cell in rows[0] if cell.tag in ("th", "td")]
+        columns = _detect_columns(header)
+
+        for row in rows[1:]:  # Skip header row
+            cells = [_cell_text(cell) for cell in row if cell.tag == "td"]
+            if len(cells) < MIN_CELLS:
+                continue
+
+            mapping = columns or _positional_columns(len(cells))
+            values = [""] * len(ENTRY_FIELDS)
+            for index, field in mapping.items():
+                if index < len(cells):
+                    values[positions[field]] = cells[index]
+
+            entries.append(values)
+
+    return entries
+
+
+def parse_cause_list_html(html: str) -> List[CauseListEntry]:
+    """parse_cause_list_rows() as CauseListEntry models"""
+    return parse_cause_list_rows(html).to_schema()
@@ -0,0 +1,139 @@
+import hashlib
+import mimetypes
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+from app.core.config import settings
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Artifact:
+    """A generated file that can be downloaded by its opaque id"""
+
+    __slots__ = ("id", "path", "filename", "size", "content_type", "sha256", "created_at", "expires_at")
+
+    def __init__(self, id: str, path: str, filename: str, size: int, content_type: str,
+                 sha256: str, created_at: float, expires_at: float):
+        self.id = id
+        self.path = path
+        self.filename = filename
+        self.size = size
+        self.content_type = content_type
+        self.sha256 = sha256
+        self.created_at = created_at
+        self.expires_at = expires_at
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256}"'
+
+    @property
+    def url(self) -> str:
+        return f"/download/{self.id}"
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.expires_at
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactRegistry:
+    """Index of generated PDFs and ZIPs keyed by opaque id.
+
+    Lookups hit an in-memory dict; the SQLite copy lets other worker
+    processes and a restarted server resolve ids issued earlier.
+    """
+
+    COLUMNS = Artifact.__slots__
+
+    def __init__(self, db_path: str = None, ttl: int = None):
+        self.db_path = db_path or settings.ARTIFACT_DB
+        self.ttl = ttl or settings.PDF_CLEANUP_DELAY
+        self._artifacts: Dict[str, Artifact] = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS artifacts ("
+            "id TEXT PRIMARY KEY, path TEXT NOT NULL, filename TEXT NOT NULL, size INTEGER NOT NULL, "
+            "content_type TEXT NOT NULL, sha256 TEXT NOT NULL, created_at REAL NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def register(self, path: str, content_type: Optional[str] = None, filename: Optional[str] = None,
+                 ttl: Optional[int] = None, sha256: Optional[str] = None) -> Artifact:
+        """Record a finished file and return its artifact.
+
+        Pass ``sha256`` when a digest identifying the content is already
+        known (e.g. the result cache's) to skip hashing the file.
+        """
+        now = time.time()
+        filename = filename or os.path.basename(path)
+        artifact = Artifact(
+            id=secrets.token_urlsafe(16),
+            path=os.path.abspath(path),
+            filename=filename,
+            size=os.path.getsize(path),
+            content_type=content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream",
+            sha256=sha256 or _file_sha256(path),
+            created_at=now,
+            expires_at=now + (ttl if ttl is not None else self.ttl),
+        )
+        with self._lock:
+            self._artifacts[artifact.id] = artifact
+            self._db.execute(
+                f"INSERT INTO artifacts ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                tuple(getattr(artifact, column) for column in self.COLUMNS)
+            )
+            self._db.commit()
+        return artifact
+
+    def get(self, artifact_id: str) -> Optional[Artifact]:
+        """Resolve an id; expired artifacts are treated as missing"""
+        artifact = self._artifacts.get(artifact_id)
+        if artifact is None:
+            with self._lock:
+                row = self._db.execute(
+                    f"SELECT {', '.join(self.COLUMNS)} FROM artifacts WHERE id = ?", (artifact_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                artifact = Artifact(*row)
+                self._artifacts[artifact.id] = artifact
+        if artifact.expired():
+            return None
+        return artifact
+
+    def remove_paths(self, paths: List[str]):
+        """Forget every artifact stored at one of ``paths`` (e.g. after cleanup)"""
+        paths = [os.path.abspath(path) for path in paths]
+        with self._lock:
+            wanted = set(paths)
+            for artifact_id in [i for i, a in self._artifacts.items() if a.path in wanted]:
+                del self._artifacts[artifact_id]
+            self._db.executemany("DELETE FROM artifacts WHERE path = ?", [(path,) for path in paths])
+            self._db.commit()
+
+    def purge_expired(self) -> int:
+        """Drop expired artifacts from memory and the database; returns how many rows went"""
+        now = time.time()
+        with self._lock:
+            for artifact_id in [i for i, a in self._artifacts.items() if a.expired(now)]:
+                del self._artifacts[artifact_id]
+            purged = self._db.execute("DELETE FROM artifacts WHERE expires_at <= ?", (now,)).rowcount
+            self._db.commit()
+        return purged
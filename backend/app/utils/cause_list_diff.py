@@ -0,0 +1,52 @@
+from typing import Dict, List, Optional
+from app.models.compact import ENTRY_FIELDS, CauseList, to_entry_schema
+from app.models.schemas import CauseListDiff, CauseListEntry, EntryChange
+from app.utils.history_store import case_key
+
+
+def entry_keys(entries) -> Dict[str, CauseListEntry]:
+    """Key entries by case number (or serial number when there is none).
+
+    A case listed more than once in the same list gets ``#2``, ``#3``... so
+    every entry has a distinct key.
+    """
+    keyed: Dict[str, CauseListEntry] = {}
+    for entry in entries:
+        base = case_key(entry.case_number) or f"sr:{(entry.sr_no or '').strip()}"
+        key = base
+        occurrence = 1
+        while key in keyed:
+            occurrence += 1
+            key = f"{base}#{occurrence}"
+        keyed[key] = entry
+    return keyed
+
+
+def diff_cause_list(previous: Optional[List[CauseListEntry]], cause_list: CauseList) -> CauseListDiff:
+    """Entries added, removed and modified since the previous scrape of the same list"""
+    diff = CauseListDiff(
+        court_name=cause_list.court_name,
+        judge_name=cause_list.judge_name,
+        date=cause_list.date,
+        case_type=cause_list.case_type,
+        status="new" if previous is None else "unchanged",
+    )
+    if previous is None:
+        diff.added = [to_entry_schema(entry) for entry in cause_list.entries]
+        return diff
+
+    before = entry_keys(previous)
+    after = entry_keys(cause_list.entries)
+    diff.added = [to_entry_schema(entry) for key, entry in after.items() if key not in before]
+    diff.removed = [entry for key, entry in before.items() if key not in after]
+    for key, entry in after.items():
+        old = before.get(key)
+        if old is None:
+            continue
+        fields = [field for field in ENTRY_FIELDS if getattr(old, field) != getattr(entry, field)]
+        if fields:
+            diff.modified.append(EntryChange(key=key, fields=fields, before=old, after=to_entry_schema(entry)))
+
+    if diff.added or diff.removed or diff.modified:
+        diff.status = "changed"
+    return diff
@@ -0,0 +1,226 @@
+import os
+import time
+import zipfile
+from typing import Callable, Iterator, List, Optional, Tuple
+from app.models.compact import CauseList
+from app.models.schemas import CauseListDiff, CauseListRequest
+from app.utils.cause_list_diff import diff_cause_list
+from app.utils.artifacts import Artifact, ArtifactRegistry
+from app.utils.history_store import HistoryStore
+from app.utils.metrics import ZIP_BUILD_SECONDS
+from app.utils.pdf_generator import PDFGenerator
+from app.utils.result_cache import ResultCache
+from app.utils.tracing import span
+from app.utils.upstream import UpstreamUnavailable
+from app.utils.zip_stream import stream_zip
+
+# progress(done, total, judge_name) is called after each judge is scraped
+ProgressCallback = Callable[[int, int, str], None]
+
+
+class CauseListPipeline:
+    """Scrape a cause list request and render the resulting files.
+
+    Shared by the synchronous ``/fetch-causelist`` endpoint and the job
+    workers so both follow exactly the same steps.
+    """
+
+    def __init__(self, scraper, pdf_generator: PDFGenerator, artifacts: ArtifactRegistry,
+                 result_cache: Optional[ResultCache] = None, history: Optional[HistoryStore] = None):
+        self.scraper = scraper
+        self.pdf_generator = pdf_generator
+        self.artifacts = artifacts
+        self.result_cache = result_cache
+        self.history = history
+    
+    def cached(self, request: CauseListRequest) -> Optional[Tuple[List[Artifact], Optional[Artifact]]]:
+        """Artifacts for a repeat of a recent request, or None if it has to be scraped"""
+        if self.result_cache is None or request.refresh:
+            return None
+        with span("result_cache.lookup") as lookup_span:
+            stored = self.result_cache.lookup(request)
+            lookup_span.set_attribute("hit", stored is not None)
+        if stored is None:
+            return None
+        pdfs, bundle = stored
+        # The cache's content digests identify the files, so nothing is re-hashed here
+        pdf_artifacts = [self.artifacts.register(path, "application/pdf", filename, sha256=digest)
+                         for path, filename, digest in pdfs]
+        zip_artifact = self.artifacts.register(bundle[0], "application/zip", bundle[1], sha256=bundle[2]) \
+            if bundle else None
+        return pdf_artifacts, zip_artifact
+
+    def scrape(self, request: CauseListRequest, progress: Optional[ProgressCallback] = None,
+               record: bool = True) -> List[CauseList]:
+        """Fetch cause lists for every judge the request covers (and record them in the history).
+        
+        While the court website is unavailable, the lists last recorded for
+        the request are returned instead, if there are any.
+        """
+        cause_lists, from_history = self._scrape(request, progress)
+        if record and not from_history and self.history is not None:
+            self.history.submit(cause_lists, request)
+        return cause_lists
+
+    def _scrape(self, request: CauseListRequest,
+                progress: Optional[ProgressCallback] = None) -> Tuple[List[CauseList], bool]:
+        """scrape() without recording; also says whether the lists came from the history"""
+        from_history = False
+        with span("scrape", court_complex=request.court_complex, case_type=request.case_type) as scrape_span:
+            try:
+                cause_lists = self.scraper.fetch_cause_list(
+                    request.state,
+                    request.district,
+                    request.court_complex,
+                    request.court_name,
+                    request.date,
+                    request.case_type,
+                    engine=request.engine,
+                    progress=progress
+                )
+            except UpstreamUnavailable:
+                cause_lists = self.stored_lists(request)
+                if not cause_lists:
+                    raise
+                scrape_span.set_attribute("from_history", True)
+                from_history = True
+            scrape_span.set_attribute("lists", len(cause_lists))
+        return cause_lists, from_history
+    
+    def stored_lists(self, request: CauseListRequest) -> List[CauseList]:
+        """The lists last scraped for a request, served while the court website is unavailable"""
+        if self.history is None:
+            return []
+        return self.history.stored_lists(request.court_complex, request.date, request.case_type,
+                                         request.court_name)
+    
+    def scrape_into_history(self, request: CauseListRequest) -> List[CauseList]:
+        """Scrape and write the lists to the history store before returning"""
+        cause_lists, from_history = self._scrape(request)
+        if cause_lists and not from_history:
+            self.history.ingest([(cause_lists, request, time.time())])
+        return cause_lists
+    
+    def scrape_with_diff(self, request: CauseListRequest, progress: Optional[ProgressCallback] = None
+                         ) -> Tuple[List[CauseList], List[CauseListDiff], bool]:
+        """Scrape afresh and compare each judge's list with the last one in the history.
+
+        Returns the lists, their diffs and whether the lists are stale: while
+        the court website is unavailable they are the stored copies, which
+        are neither diffed against themselves nor recorded again.
+        """
+        cause_lists, from_history = self._scrape(request, progress)
+        if from_history:
+            return cause_lists, [], True
+        # Lists from a request that just finished may still be waiting in the ingest queue
+        self.history.flush()
+        diffs = [diff_cause_list(self.history.previous_entries(cause_list), cause_list) for cause_list in cause_lists]
+        self.history.submit(cause_lists, request)
+        return cause_lists, diffs, False
+
+    def render(self, cause_lists: List[CauseList], date: str, request: Optional[CauseListRequest] = None,
+               freshness: Optional[int] = None) -> Tuple[List[Artifact], Optional[Artifact]]:
+        """Render one PDF per cause list and, for several, bundle them in a ZIP.
+        
+        Every file is registered as a downloadable artifact. With a result
+        cache, repeats of ``request`` are served from it for ``freshness``
+        seconds (RESULT_CACHE_FRESHNESS by default). A request asking for a
+        ``pdf`` bundle gets a single combined document instead.
+        """
+        with span("render", lists=len(cause_lists), bundle=request.bundle if request else "zip"):
+            if request is not None and request.bundle == "pdf" and len(cause_lists) > 1:
+                return self._render_combined(cause_lists, date, request, freshness)
+            if self.result_cache is not None:
+                return self._render_cached(cause_lists, date, request, freshness)
+            return self._render_files(cause_lists, date)
+
+    def _render_files(self, cause_lists: List[CauseList], date: str) -> Tuple[List[Artifact], Optional[Artifact]]:
+        """render() without a result cache: fresh files in a new output directory"""
+        output_dir = self.pdf_generator.create_output_directory()
+        pdf_files = self.pdf_generator.generate_multiple_cause_lists_pdf(cause_lists, output_dir)
+
+        zip_path = None
+        if len(pdf_files) > 1:
+            zip_path = os.path.join(output_dir, f"cause_lists_{date}.zip")
+            with span("zip.build", files=len(pdf_files)), ZIP_BUILD_SECONDS.time(), \
+                    zipfile.ZipFile(zip_path, 'w') as zipf:
+                for pdf_file in pdf_files:
+                    zipf.write(pdf_file, os.path.basename(pdf_file))
+
+        pdf_artifacts = [self.artifacts.register(pdf_file, "application/pdf") for pdf_file in pdf_files]
+        zip_artifact = self.artifacts.register(zip_path, "application/zip") if zip_path else None
+        return pdf_artifacts, zip_artifact
+
+    def _render_cached(self, cause_lists: List[CauseList], date: str, request: Optional[CauseListRequest],
+                       freshness: Optional[int]) -> Tuple[List[Artifact], Optional[Artifact]]:
+        """render() through the result cache: only cause lists it has not seen are rendered"""
+        cache = self.result_cache
+        digests = [cache.data_digest(cause_list) for cause_list in cause_lists]
+        paths = {digest: cache.get(digest) for digest in set(digests)}
+        
+        missing = {}
+        for cause_list, digest in zip(cause_lists, digests):
+            if paths[digest] is None:
+                missing.setdefault(digest, cause_list)
+        if missing:
+            output_dir = self.pdf_generator.create_output_directory()
+            rendered = set(self.pdf_generator.generate_multiple_cause_lists_pdf(list(missing.values()), output_dir))
+            for digest, cause_list in missing.items():
+                pdf_path = os.path.join(output_dir, self.pdf_generator.pdf_filename(cause_list))
+                if pdf_path in rendered:
+                    paths[digest] = cache.put(digest, pdf_path, ".pdf")
+            try:
+                os.rmdir(output_dir)
+            except OSError:
+                pass
+        
+        pdfs = [(digest, self.pdf_generator.pdf_filename(cause_list))
+                for cause_list, digest in zip(cause_lists, digests) if paths[digest]]
+        
+        bundle = None
+        zip_path = None
+        if len(pdfs) > 1:
+            bundle = (cache.bundle_digest(pdfs), f"cause_lists_{date}.zip")
+            zip_path = cache.get(bundle[0])
+            if zip_path is None:
+                staging_path = os.path.join(cache.root, f"{bundle[0]}.zip.tmp")
+                with span("zip.build", files=len(pdfs)), ZIP_BUILD_SECONDS.time(), \
+                        zipfile.ZipFile(staging_path, 'w') as zipf:
+                    for digest, filename in pdfs:
+                        zipf.write(paths[digest], filename)
+                zip_path = cache.put(bundle[0], staging_path, ".zip")
+        
+        if request is not None and pdfs:
+            cache.remember(request, pdfs, bundle, freshness)
+        
+        pdf_artifacts = [self.artifacts.register(paths[digest], "application/pdf", filename, sha256=digest)
+                         for digest, filename in pdfs]
+        zip_artifact = self.artifacts.register(zip_path, "application/zip", bundle[1], sha256=bundle[0]) \
+            if bundle else None
+        return pdf_artifacts, zip_artifact
+    
+    def _render_combined(self, cause_lists: List[CauseList], date: str, request: CauseListRequest,
+                         freshness: Optional[int]) -> Tuple[List[Artifact], Optional[Artifact]]:
+        """One PDF with every cause list, registered as the only artifact"""
+        cache = self.result_cache
+        filename = self.pdf_generator.combined_filename(date)
+        digest = None
+        pdf_path = None
+        if cache is not None:
+            digest = cache.document_digest([cache.data_digest(cause_list) for cause_list in cause_lists])
+            pdf_path = cache.get(digest)
+        
+        if pdf_path is None:
+            output_dir = self.pdf_generator.create_output_directory()
+            pdf_path = self.pdf_generator.generate_combined_pdf(cause_lists, os.path.join(output_dir, filename))
+            if cache is not None:
+                pdf_path = cache.put(digest, pdf_path, ".pdf")
+                os.rmdir(output_dir)
+        
+        if cache is not None:
+            cache.remember(request, [(digest, filename)], None, freshness)
+        return [self.artifacts.register(pdf_path, "application/pdf", filename, sha256=digest)], None
+    
+    def stream_zip(self, cause_lists: List[CauseList]) -> Iterator[bytes]:
+        """ZIP of every cause list's PDF, produced chunk by chunk as documents finish"""
+        return stream_zip(self.pdf_generator.iter_cause_list_pdfs(cause_lists))
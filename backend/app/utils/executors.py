@@ -0,0 +1,120 @@
+import asyncio
+import contextvars
+import functools
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator
+from app.core.config import settings
+
+
+class PoolSaturated(Exception):
+    """Raised when a blocking pool already has its maximum of queued work"""
+
+
+class BlockingPool:
+    """Bounded thread pool for running blocking work off the event loop.
+
+    At most ``max_workers`` calls run at once and at most ``max_queued`` more
+    wait for a thread; anything beyond that is rejected with PoolSaturated
+    instead of piling up behind a slow upstream.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queued: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        # Slots are taken and released on the event loop, so streams can await
+        # one; each loop (a new app, another test client) gets its own semaphore
+        self._loop_slots = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Calls running or waiting for a thread"""
+        return self._in_flight
+
+    def _slots(self) -> asyncio.BoundedSemaphore:
+        """Slot semaphore of the running loop, created on first use there"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._loop_slots.get(loop)
+            if slots is None:
+                slots = self._loop_slots[loop] = asyncio.BoundedSemaphore(self.max_workers + self.max_queued)
+            return slots
+
+    def _release(self, loop: asyncio.AbstractEventLoop, slots: asyncio.BoundedSemaphore):
+        with self._lock:
+            self._in_flight -= 1
+        try:
+            loop.call_soon_threadsafe(slots.release)
+        except RuntimeError:
+            # The loop is already closed (shutdown); nobody is waiting for the slot
+            pass
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run ``func`` on the pool and await its result without blocking the loop"""
+        slots = self._slots()
+        if slots.locked():
+            raise PoolSaturated(f"{self.name} pool is busy, try again shortly")
+        await slots.acquire()
+        return await asyncio.wrap_future(self._start(slots, func, *args, **kwargs))
+
+    async def iterate(self, iterator: Iterator) -> AsyncIterator:
+        """Drain a blocking iterator on the pool, one item per thread hop.
+
+        Meant for response bodies: once streaming has started we wait for a
+        slot rather than fail half way through with PoolSaturated.
+        """
+        done = object()
+        slots = self._slots()
+        close = getattr(iterator, "close", None)
+        future = None
+        try:
+            while True:
+                await slots.acquire()
+                future = self._start(slots, next, iterator, done)
+                item = await asyncio.wrap_future(future)
+                if item is done:
+                    break
+                yield item
+        finally:
+            if close is not None:
+                if future is not None and not future.done():
+                    # The client went away while next() runs on a pool thread;
+                    # closing the generator under it raises "generator already executing"
+                    try:
+                        await asyncio.wait([asyncio.wrap_future(future)])
+                    except asyncio.CancelledError:
+                        future.add_done_callback(lambda _: close())
+                        raise
+                close()
+
+    def _start(self, slots: asyncio.BoundedSemaphore, func: Callable, *args, **kwargs) -> Future:
+        """Submit ``func`` to the executor; the caller has already taken one of ``slots``"""
+        with self._lock:
+            self._in_flight += 1
+
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        try:
+            future = self._executor.submit(call)
+        except Exception:
+            self._release(loop, slots)
+            raise
+        # The slot is freed when the thread finishes, even if the caller gave up
+        future.add_done_callback(lambda _: self._release(loop, slots))
+        return future
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Selenium/HTTP scraping: each call may hold a browser for many seconds
+scrape_pool = BlockingPool("scrape", settings.SCRAPE_WORKERS, settings.SCRAPE_QUEUE_SIZE)
+
+# ReportLab rendering and ZIP packing
+render_pool = BlockingPool("render", settings.RENDER_WORKERS, settings.RENDER_QUEUE_SIZE)
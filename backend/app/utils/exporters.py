@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Tuple
+from app.models.compact import ENTRY_FIELDS, CauseList
+
+# One row per entry; the list's own case type is kept apart from the entry's
+EXPORT_COLUMNS = ("court_name", "judge_name", "date", "list_case_type") + ENTRY_FIELDS
+
+CHUNK_SIZE = 64 * 1024  # bytes buffered before a chunk is handed to the response
+
+
+def iter_rows(cause_lists: Iterable[CauseList]) -> Iterator[Tuple]:
+    """Flatten cause lists into EXPORT_COLUMNS tuples, one per entry"""
+    for cause_list in cause_lists:
+        prefix = (cause_list.court_name, cause_list.judge_name, cause_list.date, cause_list.case_type)
+        for entry in cause_list.entries:
+            yield prefix + tuple(getattr(entry, field) for field in ENTRY_FIELDS)
+
+
+def _chunked(pieces: Iterable[str]) -> Iterator[bytes]:
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def iter_ndjson(rows: Iterable[Tuple]) -> Iterator[bytes]:
+    """One JSON object per line, serialized row by row"""
+    return _chunked(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n" for row in rows)
+
+
+def iter_csv(rows: Iterable[Tuple]) -> Iterator[bytes]:
+    """CSV with a header row, serialized row by row"""
+    line = io.StringIO()
+    writer = csv.writer(line)
+
+    def take() -> str:
+        value = line.getvalue()
+        line.seek(0)
+        line.truncate()
+        return value
+
+    def lines():
+        writer.writerow(EXPORT_COLUMNS)
+        yield take()
+        for row in rows:
+            writer.writerow(row)
+            yield take()
+
+    return _chunked(lines())
@@ -0,0 +1,184 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.models.schemas import JudgeInfo
+from app.utils.upstream import UpstreamUnavailable
+
+LEVELS = ("states", "districts", "courts", "judges")
+PATH_SEPARATOR = "\x1f"
+
+
+class HierarchyCache:
+    """Two-tier cache for the state/district/complex/judge dropdown data.
+
+    Entries live in an in-memory LRU backed by a SQLite file, so they survive
+    restarts. Each level has its own TTL; once an entry is older than its TTL
+    but younger than ``stale_seconds`` it is still served while a background
+    thread reloads it. While the court website is unavailable, entries of any
+    age are served.
+    """
+
+    def __init__(self, db_path: str = None, max_entries: int = None,
+                 ttls: Optional[Dict[str, int]] = None, stale_seconds: int = None):
+        self.db_path = db_path or settings.HIERARCHY_CACHE_DB
+        self.max_entries = max_entries or settings.HIERARCHY_CACHE_MAX_ENTRIES
+        self.ttls = ttls or {
+            "states": settings.HIERARCHY_TTL_STATES,
+            "districts": settings.HIERARCHY_TTL_DISTRICTS,
+            "courts": settings.HIERARCHY_TTL_COURTS,
+            "judges": settings.HIERARCHY_TTL_JUDGES,
+        }
+        self.stale_seconds = stale_seconds if stale_seconds is not None else settings.HIERARCHY_STALE_SECONDS
+
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS hierarchy ("
+            "key TEXT PRIMARY KEY, level TEXT NOT NULL, path TEXT NOT NULL, "
+            "value TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _key(level: str, path: Tuple[str, ...]) -> str:
+        return level + ":" + PATH_SEPARATOR.join(path)
+
+    def _read(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            row = self._db.execute(
+                "SELECT value, fetched_at FROM hierarchy WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            item = (json.loads(row[0]), row[1])
+            self._remember(key, item)
+            return item
+
+    def _remember(self, key: str, item: Tuple[Any, float]):
+        self._memory[key] = item
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _write(self, level: str, path: Tuple[str, ...], value: Any):
+        key = self._key(level, path)
+        item = (value, time.time())
+        with self._lock:
+            self._remember(key, item)
+            self._db.execute(
+                "INSERT OR REPLACE INTO hierarchy (key, level, path, value, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, level, PATH_SEPARATOR.join(path), json.dumps(value), item[1])
+            )
+            self._db.commit()
+
+    def _refresh_in_background(self, level: str, path: Tuple[str, ...], loader: Callable[[], Any]):
+        key = self._key(level, path)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = loader()
+                if value:
+                    self._write(level, path, value)
+            except Exception as e:
+                print(f"Error refreshing {key}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def get(self, level: str, path: Tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        """Return the cached value for a level/path, loading it on a miss"""
+        item = self._read(self._key(level, path))
+        if item is not None:
+            value, fetched_at = item
+            age = time.time() - fetched_at
+            if age <= self.ttls[level]:
+                return value
+            if age <= self.ttls[level] + self.stale_seconds:
+                self._refresh_in_background(level, path, loader)
+                return value
+
+        try:
+            value = loader()
+        except UpstreamUnavailable:
+            if item is None:
+                raise
+            value = []
+        # Scrapers return an empty list on failure; don't pin that in the cache,
+        # and prefer an outdated entry while the site is failing
+        if value:
+            self._write(level, path, value)
+        elif item is not None:
+            return item[0]
+        return value
+
+    def invalidate(self, *path: str) -> int:
+        """Drop a subtree, e.g. ``invalidate("Delhi")`` or ``invalidate()`` for everything"""
+        prefix = PATH_SEPARATOR.join(path)
+        with self._lock:
+            if not path:
+                keys = [row[0] for row in self._db.execute("SELECT key FROM hierarchy")]
+            else:
+                keys = [row[0] for row in self._db.execute(
+                    "SELECT key FROM hierarchy WHERE path = ? OR substr(path, 1, ?) = ?",
+                    (prefix, len(prefix) + 1, prefix + PATH_SEPARATOR)
+                )]
+            self._db.executemany("DELETE FROM hierarchy WHERE key = ?", [(key,) for key in keys])
+            self._db.commit()
+            # Memory holds a subset of the database, but drop stray entries too
+            for key in list(self._memory):
+                entry_path = key.split(":", 1)[1]
+                if not path or entry_path == prefix or entry_path.startswith(prefix + PATH_SEPARATOR):
+                    del self._memory[key]
+                    if key not in keys:
+                        keys.append(key)
+        return len(keys)
+
+
+class CachedScraper:
+    """Serve a scraper's hierarchy ``get_*`` methods through a HierarchyCache"""
+
+    def __init__(self, scraper, cache: HierarchyCache):
+        self.scraper = scraper
+        self.cache = cache
+
+    def get_states(self) -> List[str]:
+        return self.cache.get("states", (), self.scraper.get_states)
+
+    def get_districts(self, state: str) -> List[str]:
+        return self.cache.get("districts", (state,), lambda: self.scraper.get_districts(state))
+
+    def get_court_complexes(self, state: str, district: str) -> List[str]:
+        return self.cache.get(
+            "courts", (state, district),
+            lambda: self.scraper.get_court_complexes(state, district)
+        )
+
+    def get_judges(self, state: str, district: str, court_complex: str) -> List[JudgeInfo]:
+        judges = self.cache.get(
+            "judges", (state, district, court_complex),
+            lambda: [judge.model_dump() for judge in self.scraper.get_judges(state, district, court_complex)]
+        )
+        return [JudgeInfo(**judge) for judge in judges]
+
+    def __getattr__(self, name):
+        return getattr(self.scraper, name)
@@ -0,0 +1,275 @@
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.models.compact import ENTRY_FIELDS, CauseList, CompactCauseList, CompactEntries
+from app.models.schemas import CauseListEntry, CauseListRequest
+
+SEARCH_FIELDS = ("case_number", "advocate", "petitioner", "respondent")
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS lists ("
+    "id INTEGER PRIMARY KEY, state TEXT, district TEXT, court_complex TEXT, "
+    "court_name TEXT NOT NULL, judge_name TEXT NOT NULL, date TEXT NOT NULL, case_type TEXT NOT NULL, "
+    "scraped_at REAL NOT NULL, UNIQUE (court_name, judge_name, date, case_type))",
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "id INTEGER PRIMARY KEY, list_id INTEGER NOT NULL REFERENCES lists(id) ON DELETE CASCADE, "
+    "sr_no TEXT, case_number TEXT, case_key TEXT, case_title TEXT, petitioner TEXT, respondent TEXT, "
+    "advocate TEXT, case_type TEXT, stage TEXT, purpose TEXT)",
+    "CREATE INDEX IF NOT EXISTS entries_case_key ON entries (case_key)",
+    "CREATE INDEX IF NOT EXISTS entries_list ON entries (list_id)",
+    "CREATE INDEX IF NOT EXISTS lists_date ON lists (date)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+    "case_number, advocate, petitioner, respondent, content='entries', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN "
+    "INSERT INTO entries_fts (rowid, case_number, advocate, petitioner, respondent) "
+    "VALUES (new.id, new.case_number, new.advocate, new.petitioner, new.respondent); END",
+    "CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN "
+    "INSERT INTO entries_fts (entries_fts, rowid, case_number, advocate, petitioner, respondent) "
+    "VALUES ('delete', old.id, old.case_number, old.advocate, old.petitioner, old.respondent); END",
+)
+
+RESULT_COLUMNS = (
+    "l.state", "l.district", "l.court_complex", "l.court_name", "l.judge_name", "l.date",
+    "e.sr_no", "e.case_number", "e.case_title", "e.petitioner", "e.respondent", "e.advocate",
+    "e.case_type", "e.stage", "e.purpose",
+)
+
+
+def case_key(case_number: Optional[str]) -> Optional[str]:
+    """Case number normalized for exact lookups: 'cc / 123/2024' -> 'CC/123/2024'"""
+    if not case_number:
+        return None
+    return re.sub(r"\s+", "", case_number).upper()
+
+
+def fts_query(text: str, field: Optional[str] = None) -> str:
+    """Turn user text into an FTS5 query matching every word, optionally in one column"""
+    terms = " AND ".join('"' + term.replace('"', '""') + '"' for term in re.findall(r"\w+", text))
+    if not terms:
+        return ""
+    columns = field if field else "{" + " ".join(SEARCH_FIELDS) + "}"
+    return f"{columns} : ({terms})"
+
+
+class HistoryStore:
+    """Persistent, searchable record of every scraped cause list.
+
+    ``submit`` only queues the lists; a writer thread ingests them in batches
+    (one transaction per batch), so scraping never waits on SQLite. Entries
+    are searchable by exact case number and by full-text search over case
+    number, advocate and party names.
+    """
+
+    def __init__(self, db_path: str = None, batch_size: int = None,
+                 flush_interval: float = None, queue_size: int = None):
+        self.db_path = db_path or settings.HISTORY_DB
+        self.batch_size = batch_size or settings.HISTORY_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.HISTORY_FLUSH_INTERVAL
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size or settings.HISTORY_QUEUE_SIZE)
+        self._read_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._writer = self._connect()
+        for statement in SCHEMA:
+            self._writer.execute(statement)
+        self._writer.commit()
+        self._reader = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL lets searches run while the writer thread is ingesting
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA foreign_keys=ON")
+        return db
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def submit(self, cause_lists: List[CauseList], request: Optional[CauseListRequest] = None):
+        """Queue scraped lists for ingest without blocking the caller"""
+        if not cause_lists:
+            return
+        try:
+            self._queue.put_nowait((cause_lists, request, time.time()))
+        except queue.Full:
+            print(f"Error recording cause list history: ingest queue full, dropped {len(cause_lists)} lists")
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until every list submitted so far is written; False if that took too long"""
+        if self._thread is None:
+            return True
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch = []
+            flushes = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    # A flush() is waiting: write what we have now
+                    flushes.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self.ingest(batch)
+                except Exception as e:
+                    print(f"Error recording cause list history: {str(e)}")
+            for marker in flushes:
+                marker.set()
+            if stop:
+                return
+
+    def ingest(self, batch: List[Tuple[List[CauseList], Optional[CauseListRequest], float]]):
+        """Write a batch in one transaction; a re-scraped list replaces its earlier entries"""
+        db = self._writer
+        with db:
+            for cause_lists, request, scraped_at in batch:
+                for cause_list in cause_lists:
+                    db.execute(
+                        "DELETE FROM lists WHERE court_name = ? AND judge_name = ? AND date = ? AND case_type = ?",
+                        (cause_list.court_name, cause_list.judge_name, cause_list.date, cause_list.case_type)
+                    )
+                    list_id = db.execute(
+                        "INSERT INTO lists (state, district, court_complex, court_name, judge_name, date, "
+                        "case_type, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (request.state if request else None, request.district if request else None,
+                         request.court_complex if request else None, cause_list.court_name,
+                         cause_list.judge_name, cause_list.date, cause_list.case_type, scraped_at)
+                    ).lastrowid
+                    db.executemany(
+                        "INSERT INTO entries (list_id, sr_no, case_number, case_key, case_title, petitioner, "
+                        "respondent, advocate, case_type, stage, purpose) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(list_id, entry.sr_no, entry.case_number, case_key(entry.case_number), entry.case_title,
+                          entry.petitioner, entry.respondent, entry.advocate, entry.case_type, entry.stage,
+                          entry.purpose) for entry in cause_list.entries]
+                    )
+
+    def previous_entries(self, cause_list: CauseList) -> Optional[List[CauseListEntry]]:
+        """Entries stored for the same court, judge, date and case type, or None if never seen"""
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT id FROM lists WHERE court_name = ? AND judge_name = ? AND date = ? AND case_type = ?",
+                (cause_list.court_name, cause_list.judge_name, cause_list.date, cause_list.case_type)
+            ).fetchone()
+            if row is None:
+                return None
+            rows = self._reader.execute(
+                f"SELECT {', '.join(ENTRY_FIELDS)} FROM entries WHERE list_id = ? ORDER BY id", (row[0],)
+            ).fetchall()
+        return [CauseListEntry(**dict(zip(ENTRY_FIELDS, values))) for values in rows]
+
+    def find_case(self, case_number: str, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  limit: int = 100) -> List[Dict[str, Any]]:
+        """Every listing of a case number, newest first"""
+        return self._select("e.case_key = ?", [case_key(case_number)], date_from, date_to, limit)
+
+    def search(self, text: str, field: Optional[str] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Entries whose advocate, party names or case number contain every word of ``text``"""
+        query = fts_query(text, field)
+        if not query:
+            return []
+        return self._select(
+            "e.id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)", [query], date_from, date_to, limit
+        )
+
+    def stored_lists(self, court_complex: str, date: str, case_type: Optional[str] = None,
+                     court_name: Optional[str] = None) -> List[CompactCauseList]:
+        """Cause lists last recorded for a complex and date, optionally for one judge"""
+        condition, params = self._list_filter(court_complex, date, case_type)
+        if court_name:
+            condition += " AND l.judge_name LIKE ?"
+            params.append(f"%{court_name}%")
+        sql = (f"SELECT l.id, l.court_name, l.judge_name, l.date, l.case_type FROM lists l "
+               f"WHERE {condition} ORDER BY l.judge_name, l.case_type")
+        cause_lists = []
+        with self._read_lock:
+            for list_id, list_court, judge_name, list_date, list_case_type in \
+                    self._reader.execute(sql, params).fetchall():
+                rows = self._reader.execute(
+                    f"SELECT {', '.join(ENTRY_FIELDS)} FROM entries WHERE list_id = ? ORDER BY id", (list_id,)
+                )
+                cause_lists.append(CompactCauseList(list_court, judge_name, list_date, list_case_type,
+                                                    CompactEntries(rows)))
+        return cause_lists
+
+    def has_lists(self, court_complex: str, date: str, case_type: Optional[str] = None) -> bool:
+        condition, params = self._list_filter(court_complex, date, case_type)
+        with self._read_lock:
+            return self._reader.execute(f"SELECT 1 FROM lists l WHERE {condition} LIMIT 1", params).fetchone() is not None
+
+    def page(self, court_complex: str, date: str, case_type: Optional[str] = None, after_id: int = 0,
+             limit: int = 100) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Up to ``limit`` entries of a complex's lists for a date, after entry id ``after_id``.
+
+        Returns the rows and the id to continue after, or None on the last page.
+        """
+        condition, params = self._list_filter(court_complex, date, case_type)
+        sql = (f"SELECT e.id, {', '.join(RESULT_COLUMNS)} FROM entries e JOIN lists l ON l.id = e.list_id "
+               f"WHERE {condition} AND e.id > ? ORDER BY e.id LIMIT ?")
+        with self._read_lock:
+            rows = self._reader.execute(sql, params + [after_id, limit + 1]).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        names = [column.split(".")[1] for column in RESULT_COLUMNS]
+        return [dict(zip(names, row[1:])) for row in rows], (rows[-1][0] if more else None)
+
+    @staticmethod
+    def _list_filter(court_complex: str, date: str, case_type: Optional[str]) -> Tuple[str, list]:
+        condition = "l.court_complex = ? COLLATE NOCASE AND l.date = ?"
+        params = [court_complex.strip(), date]
+        # "both" means either kind; the eCourts scrapers store civil and criminal lists separately
+        if case_type and case_type != "both":
+            condition += " AND l.case_type = ?"
+            params.append(case_type)
+        return condition, params
+
+    def _select(self, condition: str, params: list, date_from: Optional[str], date_to: Optional[str],
+                limit: int) -> List[Dict[str, Any]]:
+        if date_from:
+            condition += " AND l.date >= ?"
+            params.append(date_from)
+        if date_to:
+            condition += " AND l.date <= ?"
+            params.append(date_to)
+        sql = (f"SELECT {', '.join(RESULT_COLUMNS)} FROM entries e JOIN lists l ON l.id = e.list_id "
+               f"WHERE {condition} ORDER BY l.date DESC, l.judge_name, e.id LIMIT ?")
+        with self._read_lock:
+            rows = self._reader.execute(sql, params + [limit]).fetchall()
+        names = [column.split(".")[1] for column in RESULT_COLUMNS]
+        return [dict(zip(names, row)) for row in rows]
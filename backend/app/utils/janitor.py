@@ -0,0 +1,213 @@
+import heapq
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from app.core.config import settings
+
+
+class Janitor:
+    """Single background thread that deletes generated files when they expire.
+
+    Expirations sit in a heap, so the thread sleeps until the next one is due
+    instead of one sleeping task per request. Due files are removed in
+    batches together with any output directories left empty, and when the
+    output root grows past ``quota_bytes`` the least recently used files are
+    evicted early. On start the output root is rescanned, so files left by a
+    previous process are still cleaned up. ``on_purge`` is also called every
+    ``purge_interval`` seconds, for bookkeeping that expires on its own
+    (e.g. download ids).
+    """
+
+    def __init__(self, root: str = None, delay: int = None, quota_bytes: int = None,
+                 batch_size: int = None, on_removed: Optional[Callable[[List[str]], None]] = None,
+                 on_purge: Optional[Callable[[], None]] = None, purge_interval: int = None):
+        self.root = os.path.abspath(root or settings.OUTPUT_DIR)
+        self.delay = delay if delay is not None else settings.PDF_CLEANUP_DELAY
+        self.quota_bytes = quota_bytes if quota_bytes is not None else settings.OUTPUT_MAX_BYTES
+        self.batch_size = batch_size or settings.JANITOR_BATCH_SIZE
+        self.on_removed = on_removed
+        self.on_purge = on_purge
+        self.purge_interval = purge_interval or settings.JANITOR_PURGE_INTERVAL
+        self._next_purge = 0.0
+
+        self._heap: List[Tuple[float, str]] = []
+        self._expires: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._last_used: Dict[str, float] = {}
+        self._total_bytes = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently tracked under the output root"""
+        return self._total_bytes
+
+    @property
+    def pending(self) -> int:
+        return len(self._expires)
+
+    def schedule(self, paths: Iterable[str], delay: Optional[int] = None, expires_at: Optional[float] = None):
+        """Delete ``paths`` after ``delay`` seconds (PDF_CLEANUP_DELAY by default)"""
+        if expires_at is None:
+            expires_at = time.time() + (self.delay if delay is None else delay)
+        with self._condition:
+            for path in paths:
+                path = os.path.abspath(path)
+                if not path.startswith(self.root + os.sep):
+                    # e.g. files in the result cache, which evicts its own
+                    continue
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    continue
+                self._total_bytes += size - self._sizes.get(path, 0)
+                self._sizes[path] = size
+                self._last_used.setdefault(path, time.time())
+                self._expires[path] = expires_at
+                heapq.heappush(self._heap, (expires_at, path))
+            self._condition.notify()
+
+    def touch(self, path: str):
+        """Mark a file as recently used so quota eviction picks it last"""
+        path = os.path.abspath(path)
+        with self._condition:
+            if path in self._sizes:
+                self._last_used[path] = time.time()
+
+    def rescan(self):
+        """Schedule every file under the output root by its modification time"""
+        if not os.path.isdir(self.root):
+            return
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if path not in self._expires:
+                    self.schedule([path], expires_at=mtime + self.delay)
+        self._remove_empty_directories(self.root)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped = False
+        self.rescan()
+        self._thread = threading.Thread(target=self._run, name="janitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _due_batch(self) -> List[str]:
+        """Pop up to batch_size expired paths; caller holds the lock"""
+        now = time.time()
+        batch = []
+        while self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size:
+            expires_at, path = heapq.heappop(self._heap)
+            # Skip heap entries superseded by a later schedule() call
+            if self._expires.get(path) == expires_at:
+                batch.append(path)
+        return batch
+
+    def _over_quota_batch(self) -> List[str]:
+        """Least recently used paths to evict to get back under quota; caller holds the lock"""
+        if not self.quota_bytes or self._total_bytes <= self.quota_bytes:
+            return []
+        excess = self._total_bytes - self.quota_bytes
+        batch = []
+        for path in sorted(self._last_used, key=self._last_used.get):
+            if excess <= 0 or len(batch) >= self.batch_size:
+                break
+            batch.append(path)
+            excess -= self._sizes.get(path, 0)
+        return batch
+
+    def _forget(self, path: str):
+        self._total_bytes -= self._sizes.pop(path, 0)
+        self._expires.pop(path, None)
+        self._last_used.pop(path, None)
+
+    def _run(self):
+        self._next_purge = time.time() + self.purge_interval
+        while True:
+            purge = False
+            with self._condition:
+                while not self._stopped:
+                    batch = self._due_batch() or self._over_quota_batch()
+                    if batch:
+                        break
+                    now = time.time()
+                    if self.on_purge and now >= self._next_purge:
+                        purge = True
+                        break
+                    wake_at = self._heap[0][0] if self._heap else None
+                    if self.on_purge:
+                        wake_at = min(wake_at, self._next_purge) if wake_at is not None else self._next_purge
+                    self._condition.wait(wake_at - now if wake_at is not None else None)
+                if self._stopped:
+                    return
+                for path in batch:
+                    self._forget(path)
+
+            if purge:
+                self._purge()
+            else:
+                self._delete(batch)
+
+    def _purge(self):
+        self._next_purge = time.time() + self.purge_interval
+        try:
+            self.on_purge()
+        except Exception as e:
+            print(f"Error purging expired entries: {str(e)}")
+
+    def _delete(self, paths: List[str]):
+        removed = []
+        directories = set()
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+                removed.append(path)
+                directories.add(os.path.dirname(path))
+            except Exception as e:
+                print(f"Error cleaning up file {path}: {str(e)}")
+
+        for directory in directories:
+            self._remove_empty_directories(directory)
+
+        if removed and self.on_removed:
+            try:
+                self.on_removed(removed)
+            except Exception as e:
+                print(f"Error forgetting cleaned up files: {str(e)}")
+
+    def _remove_empty_directories(self, directory: str):
+        """Remove empty directories under the output root, deepest first"""
+        if directory == self.root:
+            for entry in os.listdir(directory):
+                path = os.path.join(directory, entry)
+                if os.path.isdir(path):
+                    self._remove_empty_directories(path)
+            return
+        if not directory.startswith(self.root + os.sep):
+            return
+        try:
+            for entry in os.listdir(directory):
+                path = os.path.join(directory, entry)
+                if os.path.isdir(path):
+                    self._remove_empty_directories(path)
+            os.rmdir(directory)
+        except OSError:
+            # Not empty (or already gone)
+            pass
@@ -0,0 +1,163 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from app.core.config import settings
+from app.models.schemas import CauseListRequest, CauseListResponse, JobProgress, JobResponse
+from app.utils.cause_list_pipeline import CauseListPipeline
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue already holds JOB_QUEUE_SIZE pending jobs"""
+
+
+class JobCancelled(BaseException):
+    """Raised inside a worker to abort a cancelled job.
+
+    Derives from BaseException so the scrapers' broad ``except Exception``
+    handlers around each judge don't swallow it.
+    """
+
+
+class Job:
+    """State of one fetch-causelist job plus the events streamed to clients"""
+
+    def __init__(self, request: CauseListRequest):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = "queued"  # queued, running, completed, failed, cancelled
+        self.message = "Waiting for a worker"
+        self.progress = JobProgress()
+        self.result: Optional[CauseListResponse] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.events: List[Dict] = []
+        self.cancel_requested = threading.Event()
+        self.future = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def publish(self, event: str, **data):
+        """Append an event; SSE streams read ``events`` from their last index"""
+        with self._lock:
+            self.events.append({"event": event, "data": data})
+
+    def to_response(self) -> JobResponse:
+        return JobResponse(
+            job_id=self.id,
+            status=self.status,
+            message=self.message,
+            progress=self.progress,
+            result=self.result,
+            error=self.error
+        )
+
+
+class JobManager:
+    """Runs fetch-causelist jobs on a small worker pool with a bounded queue"""
+
+    def __init__(self, pipeline: CauseListPipeline, build_response: Callable,
+                 workers: int = None, queue_size: int = None, retention: int = None):
+        self.pipeline = pipeline
+        self.build_response = build_response
+        self.queue_size = queue_size or settings.JOB_QUEUE_SIZE
+        self.retention = retention or settings.JOB_RETENTION_SECONDS
+        self._executor = ThreadPoolExecutor(max_workers=workers or settings.JOB_WORKERS,
+                                            thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Jobs waiting for a worker (read by the queue_depth gauge from other threads)"""
+        with self._lock:
+            return self._pending_locked()
+
+    def _pending_locked(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == "queued")
+
+    def submit(self, request: CauseListRequest) -> Job:
+        with self._lock:
+            self._prune()
+            if self._pending_locked() >= self.queue_size:
+                raise JobQueueFull("Too many queued jobs, try again shortly")
+            job = Job(request)
+            job.publish("status", status=job.status, message=job.message)
+            self._jobs[job.id] = job
+            job.future = self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.cancel_requested.set()
+        if job.future is not None and job.future.cancel():
+            # Never started, so the worker won't report it
+            self._finish(job, "cancelled", "Job cancelled")
+        return job
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def _finish(self, job: Job, status: str, message: str):
+        job.status = status
+        job.message = message
+        job.finished_at = time.time()
+        job.publish(status, status=status, message=message, error=job.error)
+
+    def _check_cancelled(self, job: Job):
+        if job.cancel_requested.is_set():
+            raise JobCancelled()
+
+    def _run(self, job: Job):
+        def on_progress(done: int, total: int, judge_name: str):
+            job.progress = JobProgress(done=done, total=total, current=judge_name)
+            job.publish("progress", done=done, total=total, judge=judge_name)
+            self._check_cancelled(job)
+
+        try:
+            self._check_cancelled(job)
+            job.status = "running"
+            job.message = "Fetching cause lists"
+            job.publish("status", status=job.status, message=job.message)
+
+            cached = self.pipeline.cached(job.request)
+            if cached is not None:
+                pdf_artifacts, zip_artifact = cached
+                found = True
+            else:
+                cause_lists = self.pipeline.scrape(job.request, progress=on_progress)
+                self._check_cancelled(job)
+                found = bool(cause_lists)
+
+                if cause_lists:
+                    job.message = "Generating PDFs"
+                    job.publish("status", status=job.status, message=job.message)
+                    pdf_artifacts, zip_artifact = self.pipeline.render(cause_lists, job.request.date, job.request)
+                else:
+                    pdf_artifacts, zip_artifact = [], None
+
+            job.result = self.build_response(pdf_artifacts, zip_artifact, found)
+            self._finish(job, "completed", job.result.message)
+        except JobCancelled:
+            self._finish(job, "cancelled", "Job cancelled")
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, "failed", "Error fetching cause list")
+
+    def shutdown(self):
+        for job in list(self._jobs.values()):
+            job.cancel_requested.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,264 @@
+"""Process-wide Prometheus metrics, rendered in the text exposition format.
+
+A small in-repo implementation rather than a new dependency: counters,
+gauges and histograms with labels. Recording is a dict lookup plus a short
+lock-protected update, so it is safe to call on hot paths (per table parse,
+per page load). Label children are cached; keep label values low-cardinality
+(scraper names, states), never per-request ids.
+"""
+import bisect
+import threading
+from abc import ABC, abstractmethod
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Seconds; spans a fast table parse up to a slow whole-complex scrape
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional["Registry"] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def labels(self, *values: str):
+        """The child for one combination of label values (created on first use)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            key = tuple(str(value) for value in values)
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+            self._children.setdefault(values, child)  # non-str values map to the same child
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """A fresh child holding the value(s) for one label combination"""
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], object]]:
+        return [(key, child) for key, child in list(self._children.items())
+                if all(isinstance(value, str) for value in key)]
+
+    def _default(self):
+        """The child of a metric without labels"""
+        return self.labels()
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Exposition lines for every child"""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonic count (``*_total``)"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+                for key, child in self._items()]
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ("function",)
+
+    def __init__(self):
+        super().__init__()
+        self.function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from ``function`` at scrape time instead of tracking it"""
+        self.function = function
+
+    def read(self) -> float:
+        if self.function is None:
+            return self.value
+        try:
+            return self.function()
+        except Exception:
+            return float("nan")
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is computed when scraped"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self._default().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self._default().set_function(function)
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.read())}"
+                for key, child in self._items()]
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def observe_since(self, start: float):
+        """Observe the time elapsed since a ``time.perf_counter()`` reading"""
+        self.observe(time.perf_counter() - start)
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """Distribution of durations (or sizes) in cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, registry: Optional["Registry"] = None):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, child in self._items():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(self.upper_bounds + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric):
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4"  # the response adds charset=utf-8
+
+# Scraping
+DRIVER_STARTUP_SECONDS = Histogram(
+    "scraper_driver_startup_seconds", "Time to start a Chrome session for the driver pool")
+NAVIGATION_SECONDS = Histogram(
+    "scraper_navigation_seconds", "Page loads and form requests against court sites", ("engine",))
+DROPDOWN_CASCADE_SECONDS = Histogram(
+    "scraper_dropdown_cascade_seconds", "Walking the state -> district -> court complex selects", ("engine",))
+TABLE_PARSE_SECONDS = Histogram(
+    "scraper_table_parse_seconds", "Parsing cause list tables out of a page or fragment")
+SCRAPER_RETRIES = Counter(
+    "scraper_retries_total", "Calls retried on another engine after a failure", ("scraper", "state"))
+SCRAPER_FAILURES = Counter(
+    "scraper_failures_total", "Scraper calls or work items that failed", ("scraper", "state"))
+UPSTREAM_WAIT_SECONDS = Histogram(
+    "upstream_wait_seconds", "Time a request waited for the host's rate limit and concurrency cap", ("host",))
+UPSTREAM_REJECTED = Counter(
+    "upstream_rejected_total", "Requests failed fast because the host's circuit breaker was open", ("host",))
+UPSTREAM_RATE = Gauge("upstream_rate", "Current requests per second allowed to a host", ("host",))
+UPSTREAM_CIRCUIT_OPEN = Gauge("upstream_circuit_open", "1 while a host's circuit breaker is open or probing", ("host",))
+
+# Rendering and delivery
+PDF_BUILD_SECONDS = Histogram(
+    "pdf_build_seconds", "Building one cause list PDF (or one combined PDF)", ("kind",))
+ZIP_BUILD_SECONDS = Histogram(
+    "zip_build_seconds", "Writing a ZIP bundle of cause list PDFs")
+DOWNLOAD_SECONDS = Histogram(
+    "download_seconds", "Sending a generated file to the client, start to last byte", ("kind",))
+
+# Resources (read when scraped)
+QUEUE_DEPTH = Gauge("queue_depth", "Work waiting or running", ("queue",))
+BROWSERS_BUSY = Gauge("browsers_busy", "Browser sessions currently leased from the driver pool")
+GENERATED_FILES_BYTES = Gauge(
+    "generated_files_bytes", "Bytes of generated files, by directory (output, result_cache)", ("directory",))
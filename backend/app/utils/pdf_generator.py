@@ -1,12 +1,147 @@
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Flowable, PageBreak
+from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import io
+from xml.sax.saxutils import escape
+import multiprocessing
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 import os
+import tempfile
+import threading
+import time
 from datetime import datetime
-from app.models.schemas import CauseListData, CauseListEntry
+from app.core.config import settings
+from app.models.compact import CauseList
+from app.utils.metrics import PDF_BUILD_SECONDS
+from app.utils.tracing import record_span, span
+
+TABLE_HEADER = ['Sr. No.', 'Case Number', 'Case Title', 'Petitioner', 'Respondent', 'Advocate', 'Purpose']
+TABLE_COL_WIDTHS = [0.8*inch, 1.5*inch, 2*inch, 1.5*inch, 1.5*inch, 1.2*inch, 1*inch]
+
+TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+# Rows after the first page of a PagedTable (no header row)
+BODY_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 0), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+COMBINED_MAX_PASSES = 4  # layout passes for a combined PDF's table of contents to settle
+
+MIN_ROW_HEIGHT = 18  # body row: 12pt leading + 3pt top and bottom padding
+
+
+def _table_rows(entries) -> Iterator[List[str]]:
+    for entry in entries:
+        yield [
+            entry.sr_no or '',
+            entry.case_number or '',
+            entry.case_title or '',
+            entry.petitioner or '',
+            entry.respondent or '',
+            entry.advocate or '',
+            entry.purpose or ''
+        ]
+
+
+class PagedTable(Flowable):
+    """The cause list table, laid out one page of rows at a time.
+    
+    A single platypus Table re-measures and copies all remaining rows every
+    time it is split at a page break, which grows quadratically with the
+    entry count. This flowable instead pulls just enough rows from ``rows``
+    to fill the space left in the frame, splits that small table and keeps
+    only the leftover rows, so time is linear and memory stays at about one
+    page of rows. Page breaks fall on the same rows and the output looks the
+    same as the single table.
+    """
+    
+    def __init__(self, rows: Iterator[List[str]], header: bool = True):
+        super().__init__()
+        self._rows = iter(rows)
+        self._pending: List[List[str]] = []
+        self._header = header
+    
+    def wrap(self, availWidth, availHeight):
+        # Never fits as a whole: the frame always asks split() for the next page
+        return availWidth, availHeight + 1
+    
+    def split(self, availWidth, availHeight):
+        wanted = int(availHeight // MIN_ROW_HEIGHT) + 2
+        while True:
+            exhausted = self._fill(wanted)
+            table = self._table(self._pending)
+            _, height = table.wrap(availWidth, availHeight)
+            if height > availHeight or exhausted:
+                break
+            wanted *= 2  # rows were shorter than expected; take more
+        
+        if height <= availHeight:
+            self._pending = []
+            return [table]
+        
+        parts = table.split(availWidth, availHeight)
+        if not parts:
+            return []  # nothing fits in what is left of this frame; retry on the next one
+        fitted = len(parts[0]._cellvalues) - (1 if self._header else 0)
+        self._pending = self._pending[fitted:]
+        self._header = False
+        if hasattr(self, '_postponed'):
+            del self._postponed
+        return [parts[0], self]
+    
+    def _fill(self, wanted: int) -> bool:
+        """Top up the pending rows; True once the row iterator is used up"""
+        while len(self._pending) < wanted:
+            row = next(self._rows, None)
+            if row is None:
+                return True
+            self._pending.append(row)
+        return False
+    
+    def _table(self, rows: List[List[str]]) -> Table:
+        if self._header:
+            return Table([TABLE_HEADER] + rows, colWidths=TABLE_COL_WIDTHS, style=TABLE_STYLE)
+        return Table(rows, colWidths=TABLE_COL_WIDTHS, style=BODY_STYLE)
+
+class OutlinedDocTemplate(SimpleDocTemplate):
+    """Adds an outline entry and a table of contents line for flowables with an ``outline_title``"""
+    
+    def __init__(self, filename, toc: TableOfContents, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.toc = toc
+        self._outline_count = 0
+    
+    def afterFlowable(self, flowable):
+        title = getattr(flowable, 'outline_title', None)
+        if title is None:
+            return
+        self._outline_count += 1
+        key = f"list-{self._outline_count}"
+        self.canv.bookmarkPage(key)
+        self.canv.addOutlineEntry(title, key, level=0)
+        if self._outline_count == 1:
+            self.canv.showOutline()
+        self.toc.addEntry(0, escape(title), self.page, key)
+
 
 class PDFGenerator:
     def __init__(self):
@@ -26,95 +161,191 @@ class PDFGenerator:
             spaceAfter=12,
             textColor=colors.black
         )
+        self.toc_style = ParagraphStyle(
+            'TOCEntry',
+            parent=self.styles['Normal'],
+            fontSize=10,
+            leading=14
+        )
     
-    def generate_cause_list_pdf(self, cause_list_data: CauseListData, output_path: str) -> str:
-        """Generate PDF for a single cause list"""
+    def generate_cause_list_pdf(self, cause_list_data: CauseList, output_path: Union[str, BinaryIO]) -> str:
+        """Generate PDF for a single cause list (to a path or a binary file object)"""
         try:
-            doc = SimpleDocTemplate(output_path, pagesize=A4)
-            story = []
-            
-            # Title
-            title = Paragraph(f"CAUSE LIST", self.title_style)
-            story.append(title)
-            story.append(Spacer(1, 12))
-            
-            # Court and Judge Information
-            court_info = f"<b>Court:</b> {cause_list_data.court_name}<br/>"
-            court_info += f"<b>Judge:</b> {cause_list_data.judge_name}<br/>"
-            court_info += f"<b>Date:</b> {cause_list_data.date}<br/>"
-            court_info += f"<b>Case Type:</b> {cause_list_data.case_type.upper()}"
-            
-            court_para = Paragraph(court_info, self.header_style)
-            story.append(court_para)
-            story.append(Spacer(1, 20))
+            with span("pdf.build", judge=cause_list_data.judge_name, entries=len(cause_list_data.entries)), \
+                    PDF_BUILD_SECONDS.labels("single").time():
+                doc = SimpleDocTemplate(output_path, pagesize=A4)
+                doc.build(self._cause_list_story(cause_list_data))
+            return output_path
             
-            if cause_list_data.entries:
-                # Create table data
-                table_data = [
-                    ['Sr. No.', 'Case Number', 'Case Title', 'Petitioner', 'Respondent', 'Advocate', 'Purpose']
-                ]
-                
-                for entry in cause_list_data.entries:
-                    row = [
-                        entry.sr_no or '',
-                        entry.case_number or '',
-                        entry.case_title or '',
-                        entry.petitioner or '',
-                        entry.respondent or '',
-                        entry.advocate or '',
-                        entry.purpose or ''
-                    ]
-                    table_data.append(row)
-                
-                # Create table
-                table = Table(table_data, colWidths=[0.8*inch, 1.5*inch, 2*inch, 1.5*inch, 1.5*inch, 1.2*inch, 1*inch])
-                
-                # Table style
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ]))
-                
-                story.append(table)
+        except Exception as e:
+            print(f"Error generating PDF: {str(e)}")
+            raise e
+    
+    def _cause_list_story(self, cause_list_data: CauseList) -> list:
+        """Flowables for one cause list: title, court details, entry table and footer"""
+        story = []
+        
+        # Title
+        title = Paragraph(f"CAUSE LIST", self.title_style)
+        story.append(title)
+        story.append(Spacer(1, 12))
+        
+        # Court and Judge Information
+        court_info = f"<b>Court:</b> {cause_list_data.court_name}<br/>"
+        court_info += f"<b>Judge:</b> {cause_list_data.judge_name}<br/>"
+        court_info += f"<b>Date:</b> {cause_list_data.date}<br/>"
+        court_info += f"<b>Case Type:</b> {cause_list_data.case_type.upper()}"
+        
+        court_para = Paragraph(court_info, self.header_style)
+        story.append(court_para)
+        story.append(Spacer(1, 20))
+        
+        if cause_list_data.entries:
+            rows = _table_rows(cause_list_data.entries)
+            threshold = settings.PDF_PAGED_TABLE_MIN_ENTRIES
+            if threshold and len(cause_list_data.entries) >= threshold:
+                # Long lists: lay out one page of rows at a time instead of one huge table
+                story.append(PagedTable(rows))
             else:
-                no_cases = Paragraph("No cases listed for this date.", self.styles['Normal'])
-                story.append(no_cases)
-            
-            # Footer
-            story.append(Spacer(1, 30))
-            footer = Paragraph(
-                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>"
-                "Note: This cause list is generated from publicly available data and may differ from the actual court cause list.",
-                self.styles['Normal']
-            )
-            story.append(footer)
+                story.append(Table([TABLE_HEADER] + list(rows), colWidths=TABLE_COL_WIDTHS,
+                                   style=TABLE_STYLE))
+        else:
+            no_cases = Paragraph("No cases listed for this date.", self.styles['Normal'])
+            story.append(no_cases)
+        
+        # Footer
+        story.append(Spacer(1, 30))
+        footer = Paragraph(
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>"
+            "Note: This cause list is generated from publicly available data and may differ from the actual court cause list.",
+            self.styles['Normal']
+        )
+        story.append(footer)
+        return story
+    
+    def generate_combined_pdf(self, cause_lists: List[CauseList], output_path: Union[str, BinaryIO]) -> str:
+        """Generate one PDF holding every cause list, as an alternative to a ZIP of PDFs.
+        
+        Each list starts on a new page with an outline (bookmark) entry, and a
+        table of contents with page links comes first. Page numbers are only
+        known after layout, so the document is laid out again (normally once)
+        until the table of contents is stable; only the last pass is written.
+        """
+        try:
+            start = time.perf_counter()
+            with span("pdf.build_combined", lists=len(cause_lists)) as build_span:
+                toc = TableOfContents(levelStyles=[self.toc_style])
+                for passes in range(1, COMBINED_MAX_PASSES + 1):
+                    buffer = io.BytesIO()
+                    toc.beforeBuild()
+                    doc = OutlinedDocTemplate(buffer, toc, pagesize=A4)
+                    doc.build(self._combined_story(cause_lists, toc))
+                    toc.afterBuild()
+                    if toc.isSatisfied():
+                        break
+                build_span.set_attribute("passes", passes)
+            PDF_BUILD_SECONDS.labels("combined").observe_since(start)
             
-            # Build PDF
-            doc.build(story)
+            if isinstance(output_path, str):
+                with open(output_path, "wb") as f:
+                    f.write(buffer.getbuffer())
+            else:
+                output_path.write(buffer.getbuffer())
             return output_path
             
         except Exception as e:
-            print(f"Error generating PDF: {str(e)}")
+            print(f"Error generating combined PDF: {str(e)}")
             raise e
     
-    def generate_multiple_cause_lists_pdf(self, cause_lists: List[CauseListData], output_dir: str) -> List[str]:
-        """Generate multiple PDFs for different cause lists"""
+    def _combined_story(self, cause_lists: List[CauseList], toc: TableOfContents) -> list:
+        first = cause_lists[0]
+        story = [
+            Paragraph("CAUSE LISTS", self.title_style),
+            Paragraph(f"<b>Court:</b> {first.court_name}<br/><b>Date:</b> {first.date}", self.header_style),
+            Spacer(1, 12),
+            toc,
+        ]
+        for cause_list in cause_lists:
+            story.append(PageBreak())
+            section = self._cause_list_story(cause_list)
+            section[0].outline_title = f"{cause_list.judge_name} ({cause_list.case_type.upper()})"
+            story.extend(section)
+        return story
+    
+    def generate_combined_pdf_bytes(self, cause_lists: List[CauseList]) -> bytes:
+        buffer = io.BytesIO()
+        self.generate_combined_pdf(cause_lists, buffer)
+        return buffer.getvalue()
+    
+    def combined_filename(self, date: str) -> str:
+        return f"cause_lists_{date}.pdf"
+    
+    def generate_cause_list_pdf_bytes(self, cause_list_data: CauseList) -> bytes:
+        """Generate PDF for a single cause list in memory"""
+        buffer = io.BytesIO()
+        self.generate_cause_list_pdf(cause_list_data, buffer)
+        return buffer.getvalue()
+    
+    def pdf_filename(self, cause_list: CauseList) -> str:
+        """File name used for a cause list's PDF on disk and inside ZIPs"""
+        safe_judge_name = "".join(c for c in cause_list.judge_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_judge_name = safe_judge_name.replace(' ', '_')
+        return f"causelist_{safe_judge_name}_{cause_list.date}_{cause_list.case_type}.pdf"
+    
+    def _output_path(self, cause_list: CauseList, output_dir: str) -> str:
+        return os.path.join(output_dir, self.pdf_filename(cause_list))
+    
+    def iter_cause_list_pdfs(self, cause_lists: List[CauseList],
+                             workers: Optional[int] = None) -> Iterator[Tuple[str, bytes]]:
+        """Yield (filename, pdf bytes) for each cause list as soon as it is rendered.
+        
+        On the process pool documents arrive in completion order; a document
+        that fails to render is logged and skipped like in the file-based path.
+        """
+        workers = resolve_render_workers(workers)
+        if workers > 1 and len(cause_lists) > 1:
+            executor = get_render_process_pool(workers)
+            futures = {
+                executor.submit(_render_bytes_in_worker, cause_list): cause_list
+                for cause_list in cause_lists
+            }
+            try:
+                for future in as_completed(futures):
+                    cause_list = futures[future]
+                    try:
+                        pdf_bytes = _observe_worker_build(future.result(), cause_list)
+                        yield self.pdf_filename(cause_list), pdf_bytes
+                    except Exception as e:
+                        print(f"Error generating PDF for {cause_list.judge_name}: {str(e)}")
+            finally:
+                # Consumer went away (e.g. client disconnected): drop unstarted work
+                for future in futures:
+                    future.cancel()
+            return
+        
+        for cause_list in cause_lists:
+            try:
+                pdf_bytes = self.generate_cause_list_pdf_bytes(cause_list)
+            except Exception as e:
+                print(f"Error generating PDF for {cause_list.judge_name}: {str(e)}")
+                continue
+            yield self.pdf_filename(cause_list), pdf_bytes
+    
+    def generate_multiple_cause_lists_pdf(self, cause_lists: List[CauseList], output_dir: str,
+                                          workers: Optional[int] = None) -> List[str]:
+        """Generate multiple PDFs for different cause lists.
+        
+        With more than one worker the documents are rendered on a process
+        pool; ``workers`` defaults to PDF_RENDER_PROCESSES (0 = one per CPU).
+        """
+        workers = resolve_render_workers(workers)
+        if workers > 1 and len(cause_lists) > 1:
+            return self._generate_in_processes(cause_lists, output_dir, workers)
+        
         pdf_files = []
         
-        for i, cause_list in enumerate(cause_lists):
-            # Create filename
-            safe_judge_name = "".join(c for c in cause_list.judge_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_judge_name = safe_judge_name.replace(' ', '_')
-            filename = f"causelist_{safe_judge_name}_{cause_list.date}_{cause_list.case_type}.pdf"
-            output_path = os.path.join(output_dir, filename)
+        for cause_list in cause_lists:
+            output_path = self._output_path(cause_list, output_dir)
             
             try:
                 pdf_path = self.generate_cause_list_pdf(cause_list, output_path)
@@ -125,9 +356,91 @@ class PDFGenerator:
         
         return pdf_files
     
-    def create_output_directory(self, base_dir: str = "output") -> str:
+    def _generate_in_processes(self, cause_lists: List[CauseList], output_dir: str,
+                               workers: int) -> List[str]:
+        executor = get_render_process_pool(workers)
+        futures = [
+            (cause_list, executor.submit(_render_in_worker, cause_list, self._output_path(cause_list, output_dir)))
+            for cause_list in cause_lists
+        ]
+        
+        pdf_files = []
+        for cause_list, future in futures:
+            try:
+                pdf_files.append(_observe_worker_build(future.result(), cause_list))
+            except Exception as e:
+                print(f"Error generating PDF for {cause_list.judge_name}: {str(e)}")
+                continue
+        
+        return pdf_files
+    
+    def create_output_directory(self, base_dir: str = None) -> str:
         """Create output directory for PDFs"""
+        base_dir = base_dir or settings.OUTPUT_DIR
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = os.path.join(base_dir, f"cause_lists_{timestamp}")
-        os.makedirs(output_dir, exist_ok=True)
-        return output_dir
+        os.makedirs(base_dir, exist_ok=True)
+        # Unique per call: requests in the same second must not share (and overwrite) files
+        return tempfile.mkdtemp(prefix=f"cause_lists_{timestamp}_", dir=base_dir)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+_worker_generator: Optional[PDFGenerator] = None
+
+
+def resolve_render_workers(workers: Optional[int] = None) -> int:
+    """Worker processes to use; 0 or None falls back to PDF_RENDER_PROCESSES / CPU count"""
+    if workers is None:
+        workers = settings.PDF_RENDER_PROCESSES
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def get_render_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Shared process pool, recreated only when a different size is asked for"""
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_workers != workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+            # spawn, not fork: the API process is multi-threaded
+            _process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _process_pool_workers = workers
+        return _process_pool
+
+
+def shutdown_render_process_pool():
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def _render_in_worker(cause_list: CauseList, output_path: str) -> Tuple[str, float]:
+    """Process pool entry point; keeps one PDFGenerator per worker process"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = PDFGenerator()
+    start = time.perf_counter()
+    return _worker_generator.generate_cause_list_pdf(cause_list, output_path), time.perf_counter() - start
+
+
+def _render_bytes_in_worker(cause_list: CauseList) -> Tuple[bytes, float]:
+    """Process pool entry point for in-memory rendering"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = PDFGenerator()
+    start = time.perf_counter()
+    return _worker_generator.generate_cause_list_pdf_bytes(cause_list), time.perf_counter() - start
+
+
+def _observe_worker_build(result: tuple, cause_list: CauseList):
+    """Record a worker's (result, seconds) in this process's metrics and trace and return the result"""
+    value, seconds = result
+    PDF_BUILD_SECONDS.labels("single").observe(seconds)
+    record_span("pdf.build", seconds, judge=cause_list.judge_name, entries=len(cause_list.entries),
+                process="worker")
+    return value
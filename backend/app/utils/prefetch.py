@@ -0,0 +1,148 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.models.schemas import CauseListRequest
+from app.utils.cause_list_pipeline import CauseListPipeline
+
+
+def next_working_day(today: date, working_days: List[int], holidays: List[str]) -> date:
+    """First day after ``today`` that is a working weekday (0 = Monday) and not a holiday"""
+    day = today + timedelta(days=1)
+    while day.weekday() not in working_days or day.isoformat() in holidays:
+        day += timedelta(days=1)
+    return day
+
+
+def next_run_at(now: datetime, run_time: str) -> datetime:
+    """Next local datetime at ``run_time`` ("HH:MM") after ``now``"""
+    hour, minute = (int(part) for part in run_time.split(":"))
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return run_at
+
+
+class Prefetcher:
+    """Scrapes and renders configured court complexes ahead of court hours.
+
+    Once a day at PREFETCH_TIME every target in PREFETCH_TARGETS is fetched
+    for the next working day through the normal pipeline, so the results
+    land in the result cache and history store and the morning's requests
+    for them are cache hits.
+    """
+
+    def __init__(self, pipeline: CauseListPipeline, targets: List[Dict[str, str]] = None,
+                 run_time: str = None, concurrency: int = None, freshness: int = None):
+        self.pipeline = pipeline
+        self.targets = targets if targets is not None else settings.PREFETCH_TARGETS
+        self.run_time = run_time or settings.PREFETCH_TIME
+        self.concurrency = concurrency or settings.PREFETCH_CONCURRENCY
+        self.freshness = freshness or settings.PREFETCH_FRESHNESS
+        self.running = False
+        self.next_run: Optional[datetime] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._stopped = False
+            self._thread = threading.Thread(target=self._schedule, name="prefetch", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "targets": len(self.targets),
+            "running": self.running,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self.last_run,
+        }
+
+    def _schedule(self):
+        while not self._stopped:
+            self.next_run = next_run_at(datetime.now(), self.run_time)
+            self._wake.wait(max(0.0, (self.next_run - datetime.now()).total_seconds()))
+            if self._stopped:
+                return
+            self._wake.clear()
+            try:
+                self.run()
+            except Exception as e:
+                print(f"Error running scheduled prefetch: {str(e)}")
+
+    def trigger(self, target_date: Optional[str] = None):
+        """Start a run now in the background"""
+        self._begin()
+        try:
+            threading.Thread(target=self._run, args=(target_date,), name="prefetch-manual", daemon=True).start()
+        except Exception:
+            self._end()
+            raise
+
+    def run(self, target_date: Optional[str] = None) -> Dict[str, Any]:
+        """Prefetch every target now; returns the run report (also kept as ``last_run``)"""
+        self._begin()
+        return self._run(target_date)
+
+    def _begin(self):
+        """Claim the run lock, or raise if a run is in progress"""
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A prefetch run is already in progress")
+        self.running = True
+
+    def _end(self):
+        self.running = False
+        self._lock.release()
+
+    def _run(self, target_date: Optional[str]) -> Dict[str, Any]:
+        """Body of a run; the caller has claimed the lock, which is released here"""
+        try:
+            target_date = target_date or next_working_day(
+                date.today(), settings.PREFETCH_WORKING_DAYS, settings.PREFETCH_HOLIDAYS
+            ).isoformat()
+            started = time.time()
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="prefetch") as executor:
+                results = list(executor.map(lambda target: self._prefetch(target, target_date), self.targets))
+            self.last_run = {
+                "date": target_date,
+                "started_at": datetime.fromtimestamp(started).isoformat(),
+                "duration": round(time.time() - started, 3),
+                "succeeded": sum(1 for result in results if result["status"] == "ok"),
+                "failed": sum(1 for result in results if result["status"] == "failed"),
+                "targets": results,
+            }
+            return self.last_run
+        finally:
+            self._end()
+
+    def _prefetch(self, target: Dict[str, str], target_date: str) -> Dict[str, Any]:
+        started = time.time()
+        result: Dict[str, Any] = {**target, "status": "ok", "lists": 0, "error": None}
+        try:
+            # A target may set its own case_type; the date is always the one being prefetched
+            request = CauseListRequest(**{"case_type": settings.PREFETCH_CASE_TYPE, **target, "date": target_date})
+            cause_lists = self.pipeline.scrape(request)
+            result["lists"] = len(cause_lists)
+            if not cause_lists:
+                result["status"] = "empty"
+            elif self.pipeline.result_cache is not None:
+                # Without the result cache nothing would serve the rendered files later
+                self.pipeline.render(cause_lists, target_date, request, self.freshness)
+        except Exception as e:
+            print(f"Error prefetching {target}: {str(e)}")
+            result["status"] = "failed"
+            result["error"] = str(e)
+        result["duration"] = round(time.time() - started, 3)
+        return result
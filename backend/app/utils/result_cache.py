@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.models.compact import ENTRY_FIELDS, CauseList
+from app.models.schemas import CauseListRequest
+
+# (digest, filename) of a stored file
+StoredFile = Tuple[str, str]
+# (path, filename, digest) of a stored file found on disk
+ResolvedFile = Tuple[str, str, str]
+
+
+class ResultCache:
+    """Content-addressed store for rendered cause list PDFs and ZIPs.
+
+    Files are stored under the SHA-256 of the data they were rendered from,
+    so identical cause lists share one PDF no matter which request produced
+    them. Requests are also remembered by their normalized tuple: a repeat
+    within ``freshness`` seconds is answered from the store without
+    scraping. The store is bounded to ``max_bytes``, evicting least recently
+    used files first.
+    """
+
+    def __init__(self, root: str = None, db_path: str = None, freshness: int = None,
+                 max_bytes: int = None, on_evicted: Optional[Callable[[List[str]], None]] = None):
+        self.root = os.path.abspath(root or settings.RESULT_CACHE_DIR)
+        self.db_path = db_path or settings.RESULT_CACHE_DB
+        self.freshness = freshness if freshness is not None else settings.RESULT_CACHE_FRESHNESS
+        self.max_bytes = max_bytes if max_bytes is not None else settings.RESULT_CACHE_MAX_BYTES
+        self.on_evicted = on_evicted
+        self.counters: Dict[str, int] = {
+            "hits": 0, "misses": 0, "render_hits": 0, "render_misses": 0, "evictions": 0
+        }
+        self._lock = threading.Lock()
+
+        os.makedirs(self.root, exist_ok=True)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, path TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS requests ("
+            "key TEXT PRIMARY KEY, pdfs TEXT NOT NULL, zip TEXT, fresh_until REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    @staticmethod
+    def request_key(request: CauseListRequest) -> str:
+        """Normalized (state, district, court_complex, court_name, date, case_type, bundle) tuple"""
+        parts = (request.state, request.district, request.court_complex,
+                 request.court_name or "", request.date, request.case_type or "both", request.bundle)
+        return json.dumps([part.strip().lower() for part in parts])
+
+    @staticmethod
+    def data_digest(cause_list: CauseList) -> str:
+        """Digest of a cause list's content; the same for its pydantic and compact forms"""
+        content = [cause_list.court_name, cause_list.judge_name, cause_list.date, cause_list.case_type,
+                   [[getattr(entry, field) for field in ENTRY_FIELDS] for entry in cause_list.entries]]
+        return hashlib.sha256(json.dumps(content).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def bundle_digest(pdfs: List[StoredFile]) -> str:
+        """Digest of a ZIP built from the given PDFs"""
+        return hashlib.sha256(json.dumps(pdfs).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def document_digest(digests: List[str]) -> str:
+        """Digest of a combined PDF built from cause lists with the given data digests"""
+        return hashlib.sha256(json.dumps(["combined"] + digests).encode("utf-8")).hexdigest()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            files = self._db.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            requests = self._db.execute("SELECT COUNT(*) FROM requests").fetchone()[0]
+        return {**self.counters, "files": files, "requests": requests, "bytes": self._total_bytes}
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes of stored files under the cache root"""
+        return self._total_bytes
+
+    def lookup(self, request: CauseListRequest) -> Optional[Tuple[List[ResolvedFile], Optional[ResolvedFile]]]:
+        """Stored (path, filename, digest) of the PDFs and ZIP for a fresh repeat request"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT pdfs, zip, fresh_until FROM requests WHERE key = ?", (self.request_key(request),)
+            ).fetchone()
+            result = None
+            if row is not None and time.time() <= row[2]:
+                pdfs = [self._resolve(digest, filename) for digest, filename in json.loads(row[0])]
+                bundle = self._resolve(*json.loads(row[1])) if row[1] else None
+                if all(pdfs) and (bundle or not row[1]):
+                    result = (pdfs, bundle)
+            self.counters["hits" if result else "misses"] += 1
+            return result
+
+    def get(self, digest: str) -> Optional[str]:
+        """Path of a stored file, or None if it has to be rendered"""
+        with self._lock:
+            resolved = self._resolve(digest, "")
+            self.counters["render_hits" if resolved else "render_misses"] += 1
+            return resolved[0] if resolved else None
+
+    def put(self, digest: str, source_path: str, suffix: str) -> str:
+        """Move a freshly rendered file into the store and return its new path"""
+        path = os.path.join(self.root, digest + suffix)
+        os.replace(source_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._db.execute(
+                "INSERT OR REPLACE INTO blobs (digest, path, size, last_used) VALUES (?, ?, ?, ?)",
+                (digest, path, size, time.time())
+            )
+            self._db.commit()
+            evicted = self._evict(keep=digest)
+        self._forget(evicted)
+        return path
+
+    def remember(self, request: CauseListRequest, pdfs: List[StoredFile], bundle: Optional[StoredFile],
+                 freshness: Optional[int] = None):
+        """Record which stored files answer a request, for ``freshness`` seconds"""
+        fresh_until = time.time() + (self.freshness if freshness is None else freshness)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO requests (key, pdfs, zip, fresh_until) VALUES (?, ?, ?, ?)",
+                (self.request_key(request), json.dumps(pdfs), json.dumps(bundle) if bundle else None, fresh_until)
+            )
+            self._db.commit()
+
+    def _resolve(self, digest: str, filename: str) -> Optional[ResolvedFile]:
+        """(path, filename, digest) of a stored file, marking it used; caller holds the lock"""
+        row = self._db.execute("SELECT path FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is None or not os.path.exists(row[0]):
+            return None
+        self._db.execute("UPDATE blobs SET last_used = ? WHERE digest = ?", (time.time(), digest))
+        self._db.commit()
+        return row[0], filename, digest
+
+    def _evict(self, keep: str) -> List[str]:
+        """Drop least recently used files until under max_bytes; caller holds the lock"""
+        evicted = []
+        if not self.max_bytes or self._total_bytes <= self.max_bytes:
+            return evicted
+        rows = self._db.execute(
+            "SELECT digest, path, size FROM blobs WHERE digest != ? ORDER BY last_used", (keep,)
+        ).fetchall()
+        for digest, path, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self._total_bytes -= size
+            self.counters["evictions"] += 1
+            evicted.append(path)
+        self._db.commit()
+        return evicted
+
+    def _forget(self, paths: List[str]):
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception as e:
+                print(f"Error evicting cached file {path}: {str(e)}")
+        if paths and self.on_evicted:
+            self.on_evicted(paths)
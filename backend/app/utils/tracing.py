@@ -0,0 +1,212 @@
+"""Request-scoped tracing spans written to a local file.
+
+A request opens a root span with ``start_trace()``; code below it opens
+children with ``span()``. The current span lives in a context variable, so
+it follows the work onto the blocking pools and scraper worker threads
+(both copy the context). When the root span ends, the whole trace is
+appended to TRACE_FILE, either as one OTLP/JSON ``ExportTraceServiceRequest``
+per line (readable by the OpenTelemetry collector's ``otlpjsonfile``
+receiver) or as flat JSON lines, one span per line.
+
+Only a TRACE_SAMPLE_RATE fraction of requests is traced. Outside a sampled
+trace, ``span()`` returns a shared no-op after one context variable lookup.
+"""
+import json
+import os
+import random
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+
+SERVICE_NAME = "court-cause-list-api"
+
+
+class _NoopSpan:
+    """Stands in for a span when the request is not being traced"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Trace:
+    """Spans of one request; exported when its root span ends"""
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List["Span"] = []
+        self._lock = threading.Lock()
+
+    def finish(self, span: "Span"):
+        with self._lock:
+            self.spans.append(span)
+        if span.parent_id is None:
+            exporter().export(self)
+
+
+class Span:
+    __slots__ = ("trace", "name", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error", "_token")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        """Mark the span failed for an error that was handled inside it"""
+        self.error = message
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        if exc is not None and self.error is None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current.reset(self._token)
+        self.trace.finish(self)
+        return False
+
+
+def start_trace(name: str, **attributes):
+    """Root span for a request, or a no-op if it is not sampled (nested calls open a child)"""
+    if _current.get() is not None:
+        return span(name, **attributes)
+    rate = settings.TRACE_SAMPLE_RATE
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return NOOP_SPAN
+    return Span(Trace(), name, None, attributes)
+
+
+def span(name: str, **attributes):
+    """Child of the current span; a no-op outside a sampled trace"""
+    parent = _current.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.trace, name, parent.span_id, attributes)
+
+
+def record_span(name: str, seconds: float, **attributes):
+    """Add an already finished child that ended now, e.g. work timed in another process"""
+    parent = _current.get()
+    if parent is None:
+        return
+    child = Span(parent.trace, name, parent.span_id, attributes)
+    child.end_ns = time.time_ns()
+    child.start_ns = child.end_ns - int(seconds * 1e9)
+    parent.trace.finish(child)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class FileExporter:
+    """Appends finished traces to a file, one line per trace (otlp) or per span (jsonl)"""
+
+    def __init__(self, path: str = None, format: str = None):
+        self.path = path or settings.TRACE_FILE
+        self.format = format or settings.TRACE_FORMAT
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace):
+        with trace._lock:
+            spans = sorted(trace.spans, key=lambda s: s.start_ns)
+        if self.format == "otlp":
+            lines = [json.dumps(self._otlp_request(trace, spans))]
+        else:
+            lines = [json.dumps(self._flat_span(trace, s)) for s in spans]
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"Error writing trace: {str(e)}")
+
+    @staticmethod
+    def _flat_span(trace: Trace, span: Span) -> Dict[str, Any]:
+        return {
+            "trace_id": trace.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start": span.start_ns / 1e9,
+            "duration_ms": (span.end_ns - span.start_ns) / 1e6,
+            "attributes": span.attributes,
+            "error": span.error,
+        }
+
+    @staticmethod
+    def _otlp_request(trace: Trace, spans: List[Span]) -> Dict[str, Any]:
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": trace.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 2 if span.parent_id is None else 1,  # SERVER for the root, INTERNAL below it
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": "app.utils.tracing"}, "spans": otlp_spans}],
+            }]
+        }
+
+
+_exporter: Optional[FileExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def exporter() -> FileExporter:
+    """The process-wide exporter, created from the settings on first use"""
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = FileExporter()
+    return _exporter
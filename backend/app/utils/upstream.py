@@ -0,0 +1,261 @@
+"""Per-host politeness and resilience for requests to the court websites.
+
+Every request a scraper sends to a host (an HTTP call, a page load, a form
+submit) runs inside ``upstream.request()`` for that host, which
+
+- takes a token from the host's token bucket (UPSTREAM_RATE per second,
+  bursts of UPSTREAM_BURST) and one of UPSTREAM_MAX_CONCURRENT in-flight slots;
+- adapts the rate: it is halved when a request fails, is throttled (429/503,
+  honouring Retry-After) or is slower than UPSTREAM_SLOW_SECONDS, and grows
+  back a tenth of the configured rate per fast response, never below
+  UPSTREAM_MIN_RATE;
+- opens a circuit breaker after UPSTREAM_FAILURE_THRESHOLD consecutive
+  failures. While open, requests raise UpstreamUnavailable without touching
+  the host; after UPSTREAM_OPEN_SECONDS one probe request is let through and
+  its outcome closes or re-opens the circuit.
+
+The state is shared by all scrapers and sessions in the process through the
+``upstreams`` registry. Callers that hold older data (the hierarchy cache,
+the cause list history) serve it on UpstreamUnavailable; the API answers 503
+with Retry-After otherwise.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+from app.core.config import settings
+from app.utils.metrics import UPSTREAM_CIRCUIT_OPEN, UPSTREAM_RATE, UPSTREAM_REJECTED, UPSTREAM_WAIT_SECONDS
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Statuses that mean "slow down" rather than "this request was wrong"
+THROTTLE_STATUSES = (429, 503)
+
+
+class UpstreamUnavailable(Exception):
+    """Raised instead of sending a request while a host's circuit breaker is open"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"{host} is not responding, try again in {max(1, round(retry_after))}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Tokens refill at ``rate`` per second up to ``burst``; a rate of 0 never waits"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it (callers queue up in order)"""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        """Hold back every request for ``seconds``, e.g. for a Retry-After"""
+        if not self.rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            # The next reservation brings this to -seconds * rate, i.e. a wait of ``seconds``
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    return getattr(getattr(error, "response", None), "status_code", None)
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Seconds from a throttling response's Retry-After header, if it gave one"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else None
+
+
+class Upstream:
+    """Rate limit, concurrency cap and circuit breaker for one host"""
+
+    def __init__(self, host: str, rate: float = None, burst: int = None, min_rate: float = None,
+                 max_concurrent: int = None, slow_seconds: float = None, failure_threshold: int = None,
+                 open_seconds: float = None):
+        self.host = host
+        self.max_rate = rate if rate is not None else settings.UPSTREAM_RATE
+        self.min_rate = min(min_rate if min_rate is not None else settings.UPSTREAM_MIN_RATE, self.max_rate)
+        self.max_concurrent = max_concurrent or settings.UPSTREAM_MAX_CONCURRENT
+        self.slow_seconds = slow_seconds or settings.UPSTREAM_SLOW_SECONDS
+        self.failure_threshold = failure_threshold or settings.UPSTREAM_FAILURE_THRESHOLD
+        self.open_seconds = open_seconds if open_seconds is not None else settings.UPSTREAM_OPEN_SECONDS
+
+        self.bucket = TokenBucket(self.max_rate, burst or settings.UPSTREAM_BURST)
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.consecutive_failures = 0
+        self.in_flight = 0
+        self.counters = {"requests": 0, "failures": 0, "slow": 0, "throttled": 0, "rejected": 0}
+
+        self._wait_seconds = UPSTREAM_WAIT_SECONDS.labels(host)
+        UPSTREAM_RATE.labels(host).set_function(lambda: self.bucket.rate)
+        UPSTREAM_CIRCUIT_OPEN.labels(host).set_function(lambda: 0 if self.state == CLOSED else 1)
+
+    @contextmanager
+    def request(self):
+        """Wrap one request to the host: wait for its turn, then record how it went"""
+        probe = self._admit()
+        try:
+            start = time.perf_counter()
+            self._slots.acquire()
+            with self._lock:
+                self.in_flight += 1
+            try:
+                self.bucket.acquire()
+                self._wait_seconds.observe_since(start)
+                start = time.perf_counter()
+                try:
+                    yield
+                except Exception as e:
+                    self._record(time.perf_counter() - start, e)
+                    raise
+                self._record(time.perf_counter() - start)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                self._slots.release()
+        finally:
+            if probe:
+                # Let the next caller probe if this one ended without an outcome (e.g. cancelled)
+                with self._lock:
+                    self._probing = False
+
+    def _admit(self) -> bool:
+        """Raise while the circuit is open; True if this request is the half-open probe"""
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened_at + self.open_seconds - time.monotonic()
+                if remaining > 0:
+                    self._reject()
+                    raise UpstreamUnavailable(self.host, remaining)
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self._probing:
+                    self._reject()
+                    raise UpstreamUnavailable(self.host, self.open_seconds)
+                self._probing = True
+                return True
+            return False
+
+    def _reject(self):
+        self.counters["rejected"] += 1
+        UPSTREAM_REJECTED.labels(self.host).inc()
+
+    def _record(self, seconds: float, error: Optional[Exception] = None):
+        status = _status_code(error) if error is not None else None
+        # A 404 or a page we could not parse still means the host answered
+        failed = error is not None and (status is None or status >= 500 or status in THROTTLE_STATUSES)
+        retry_after = _retry_after(error) if status in THROTTLE_STATUSES else None
+
+        with self._lock:
+            self.counters["requests"] += 1
+            if failed:
+                self.counters["failures"] += 1
+                if status in THROTTLE_STATUSES:
+                    self.counters["throttled"] += 1
+                self.consecutive_failures += 1
+                self._slow_down()
+                if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                    self._open()
+            else:
+                self.consecutive_failures = 0
+                if self.state == HALF_OPEN:
+                    self.state = CLOSED
+                if seconds > self.slow_seconds:
+                    self.counters["slow"] += 1
+                    self._slow_down()
+                else:
+                    self._speed_up()
+        if retry_after:
+            self.bucket.pause(retry_after)
+
+    def _slow_down(self):
+        if self.max_rate:
+            self.bucket.set_rate(max(self.min_rate, self.bucket.rate / 2))
+
+    def _speed_up(self):
+        if self.max_rate and self.bucket.rate < self.max_rate:
+            self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.max_rate / 10))
+
+    def _open(self):
+        if self.state != OPEN:
+            print(f"Error reaching {self.host}: circuit opened after "
+                  f"{self.consecutive_failures} consecutive failures")
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_after = max(0.0, self._opened_at + self.open_seconds - time.monotonic()) \
+                if self.state == OPEN else 0.0
+            return {
+                "host": self.host,
+                "state": self.state,
+                "rate": round(self.bucket.rate, 3),
+                "max_rate": self.max_rate,
+                "in_flight": self.in_flight,
+                "max_concurrent": self.max_concurrent,
+                "consecutive_failures": self.consecutive_failures,
+                "retry_after": round(retry_after, 1),
+                **self.counters,
+            }
+
+
+class UpstreamRegistry:
+    """One Upstream per host, created from the settings on first use"""
+
+    def __init__(self):
+        self._hosts: Dict[str, Upstream] = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> Upstream:
+        host = urlsplit(url).netloc.lower() or url
+        upstream = self._hosts.get(host)
+        if upstream is None:
+            with self._lock:
+                upstream = self._hosts.get(host)
+                if upstream is None:
+                    upstream = self._hosts[host] = Upstream(host)
+        return upstream
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [upstream.status() for upstream in list(self._hosts.values())]
+
+
+# Shared by every scraper in the process
+upstreams = UpstreamRegistry()
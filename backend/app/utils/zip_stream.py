@@ -0,0 +1,46 @@
+import zipfile
+from typing import Iterable, Iterator, Tuple
+
+
+class _ChunkSink:
+    """Write-only file object that hands ZipFile output back in chunks.
+
+    It has no ``tell``/``seek``, so ZipFile treats it as unseekable and
+    writes data descriptors after each member instead of going back to patch
+    local headers - which is what lets the archive be sent as it is built.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(members: Iterable[Tuple[str, bytes]]) -> Iterator[bytes]:
+    """Build a ZIP from (name, data) pairs and yield it chunk by chunk.
+
+    Each member's bytes are yielded as soon as the member has been added, so
+    nothing is staged on disk and only one member is held in memory at once.
+    PDFs are already compressed, so members are stored as-is.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    # Central directory is written on close
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
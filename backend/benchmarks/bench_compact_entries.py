@@ -0,0 +1,65 @@
+"""Compare memory and construction time of cause list entry representations.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_compact_entries [--entries 1000 10000 50000] [--repeat 3]
+
+For every entry count, builds the same rows as validated CauseListEntry
+models, as unvalidated models (``model_construct``) and as CompactEntries,
+and prints the best construction time and the memory retained by the result
+(measured with tracemalloc, including the row strings).
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Tuple
+from app.models.compact import ENTRY_FIELDS, CompactEntries
+from app.models.schemas import CauseListEntry
+from benchmarks.common import best_of, make_rows
+
+def validated(rows):
+    return [CauseListEntry(**dict(zip(ENTRY_FIELDS, row))) for row in rows]
+
+
+def constructed(rows):
+    return [CauseListEntry.model_construct(**dict(zip(ENTRY_FIELDS, row))) for row in rows]
+
+
+def compact(rows):
+    return CompactEntries(rows)
+
+
+def measure(build: Callable, entries: int, repeat: int) -> Tuple[float, int]:
+    """Best build time in seconds and bytes retained by the built object"""
+    best, _ = best_of(build, repeat, setup=lambda: make_rows(entries))
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    rows = make_rows(entries)
+    result = build(rows)
+    del rows  # only what the representation keeps alive counts, strings included
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del result
+    return best, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8}  {'representation':<18}{'build ms':>10}{'MB':>9}{'bytes/entry':>13}")
+    for entries in args.entries:
+        for name, build in (("validated models", validated), ("model_construct", constructed),
+                            ("CompactEntries", compact)):
+            seconds, retained = measure(build, entries, args.repeat)
+            print(f"{entries:>8}  {name:<18}{seconds * 1000:>10.1f}{retained / 1e6:>9.2f}"
+                  f"{retained / entries:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
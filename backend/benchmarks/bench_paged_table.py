@@ -0,0 +1,54 @@
+"""Compare the single-table and paged-table PDF layouts for long cause lists.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_paged_table [--entries 500 2000 10000] [--repeat 2]
+
+For every entry count, renders the same cause list once with one platypus
+Table holding every row and once with PagedTable (see
+PDF_PAGED_TABLE_MIN_ENTRIES), and prints the best render time, the peak
+memory during the render (tracemalloc) and the PDF size.
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Tuple
+from app.core.config import settings
+from app.models.compact import CompactCauseList
+from app.utils.pdf_generator import PDFGenerator
+from benchmarks.common import best_of, make_cause_list
+
+ENGINES = (("single table", 0), ("paged table", 1))
+
+
+def measure(generator: PDFGenerator, cause_list: CompactCauseList, threshold: int,
+            repeat: int) -> Tuple[float, int, int]:
+    """Best render time in seconds, peak bytes allocated while rendering and PDF size"""
+    settings.PDF_PAGED_TABLE_MIN_ENTRIES = threshold
+    best, pdf = best_of(lambda: generator.generate_cause_list_pdf_bytes(cause_list), repeat)
+
+    gc.collect()
+    tracemalloc.start()
+    generator.generate_cause_list_pdf_bytes(cause_list)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, len(pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[500, 2000, 10000])
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    generator = PDFGenerator()
+    print(f"{'entries':>8}  {'layout':<14}{'render ms':>11}{'peak MB':>10}{'PDF KB':>9}")
+    for entries in args.entries:
+        cause_list = make_cause_list(entries)
+        for name, threshold in ENGINES:
+            seconds, peak, size = measure(generator, cause_list, threshold, args.repeat)
+            print(f"{entries:>8}  {name:<14}{seconds * 1000:>11.0f}{peak / 1e6:>10.1f}{size / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
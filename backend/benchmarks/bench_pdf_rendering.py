@@ -0,0 +1,50 @@
+"""Measure how bulk PDF rendering scales with worker processes.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_pdf_rendering [--documents 16] [--workers 1 2 4 8] [--entries 10 100 1000]
+
+For every entry count, renders ``--documents`` cause lists with each worker
+count and prints wall time and speed-up over one worker. The first call for
+each worker count includes process pool start-up, so a warm-up round is run
+first.
+"""
+import argparse
+import os
+import tempfile
+from app.utils.pdf_generator import PDFGenerator, shutdown_render_process_pool
+from benchmarks.common import best_of, make_cause_lists
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--entries", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    generator = PDFGenerator()
+    print(f"CPUs: {os.cpu_count()}, documents per run: {args.documents}")
+    print(f"{'entries':>8}{'workers':>9}{'seconds':>10}{'speed-up':>10}")
+
+    try:
+        for entries in args.entries:
+            cause_lists = make_cause_lists(args.documents, entries)
+            baseline = None
+            for workers in args.workers:
+                with tempfile.TemporaryDirectory() as output_dir:
+                    # Warm-up: start the pool and import ReportLab in the workers
+                    generator.generate_multiple_cause_lists_pdf(cause_lists[:workers], output_dir, workers=workers)
+
+                    elapsed, files = best_of(
+                        lambda: generator.generate_multiple_cause_lists_pdf(cause_lists, output_dir, workers=workers), 1)
+
+                assert len(files) == len(cause_lists)
+                baseline = baseline or elapsed
+                print(f"{entries:>8}{workers:>9}{elapsed:>10.2f}{baseline / elapsed:>9.2f}x")
+    finally:
+        shutdown_render_process_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the eCourts scraper end to end against the local fake court site.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_scrapers [--engines http selenium] [--delay 0.05] [--rows 100]
+                                        [--judges 5] [--parallelism 1 3] [--repeat 3]
+                                        [--rate 0]
+
+Starts benchmarks.fake_court_site on a free port, points ECOURTS_BASE_URL at
+it and, for every engine and SCRAPE_PARALLELISM value, times the hierarchy
+calls and a whole-complex fetch_cause_list (every judge, civil and criminal).
+Prints best latency per call and lists/entries per second for the fetch.
+The per-host rate limit is off by default (``--rate 0``) so the numbers
+show the scrapers themselves; pass UPSTREAM_RATE's value to include it.
+No network access is needed; the Selenium engine needs a local Chrome.
+"""
+import argparse
+from app.core.config import settings
+from benchmarks.common import best_of
+from benchmarks.fake_court_site import ECOURTS_PREFIX, FakeCourtSite, serve_in_thread
+
+STATE = "Delhi"
+DISTRICT = "New Delhi"
+COURT_COMPLEX = "Patiala House Court Complex"
+DATE = "2024-10-15"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", nargs="+", default=["http"], choices=["http", "selenium"])
+    parser.add_argument("--delay", type=float, default=0.05, help="fake site seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=100, help="entries per cause list table")
+    parser.add_argument("--judges", type=int, default=5)
+    parser.add_argument("--parallelism", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--rate", type=float, default=0.0, help="UPSTREAM_RATE for the fake site; 0 = unlimited")
+    args = parser.parse_args()
+
+    site = FakeCourtSite(rows=args.rows, judges=args.judges, delay=args.delay, jitter=args.jitter)
+    server, base = serve_in_thread(site)
+    settings.ECOURTS_BASE_URL = base + ECOURTS_PREFIX
+    settings.SCRAPER_ENGINE_FALLBACK = False
+    settings.UPSTREAM_RATE = args.rate
+    settings.UPSTREAM_MAX_CONCURRENT = max(settings.UPSTREAM_MAX_CONCURRENT, *args.parallelism)
+
+    from app.scrapers.ecourts_scraper import ECourtsScraper
+    scraper = ECourtsScraper()
+
+    print(f"fake site {base}: delay {args.delay}s, {args.judges} judges, {args.rows} rows per table")
+    try:
+        for engine in args.engines:
+            calls = (
+                ("get_states", lambda: scraper.get_states(engine=engine)),
+                ("get_districts", lambda: scraper.get_districts(STATE, engine=engine)),
+                ("get_court_complexes", lambda: scraper.get_court_complexes(STATE, DISTRICT, engine=engine)),
+                ("get_judges", lambda: scraper.get_judges(STATE, DISTRICT, COURT_COMPLEX, engine=engine)),
+            )
+            for name, call in calls:
+                seconds, result = best_of(call, args.repeat)
+                print(f"{engine:<9}{name:<22}{seconds * 1000:>10.1f} ms  ({len(result)} results)")
+
+            for parallelism in args.parallelism:
+                settings.SCRAPE_PARALLELISM = parallelism
+                before = site.requests
+                seconds, cause_lists = best_of(
+                    lambda: scraper.fetch_cause_list(STATE, DISTRICT, COURT_COMPLEX, None, DATE, "both",
+                                                     engine=engine),
+                    args.repeat
+                )
+                entries = sum(len(cause_list.entries) for cause_list in cause_lists)
+                requests_per_fetch = (site.requests - before) / args.repeat
+                print(f"{engine:<9}{'fetch_cause_list':<22}{seconds * 1000:>10.1f} ms  "
+                      f"parallelism {parallelism}: {len(cause_lists)} lists, {entries} entries, "
+                      f"{len(cause_lists) / seconds:.1f} lists/s, {entries / seconds:.0f} entries/s, "
+                      f"{requests_per_fetch:.0f} requests")
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare single-pass page_source parsing with per-cell WebDriver parsing.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_table_parser            # parser only
+    python -m benchmarks.bench_table_parser --selenium # also drive Chrome
+
+Without ``--selenium`` the per-cell column reports how many WebDriver round
+trips the old ``find_elements``/``.text`` loop would make for each fixture.
+"""
+import argparse
+import glob
+import os
+from pathlib import Path
+from typing import List
+from app.models.schemas import CauseListEntry
+from app.scrapers.table_parser import parse_cause_list_html
+from benchmarks.common import best_of
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def parse_per_cell(driver) -> List[CauseListEntry]:
+    """The parser both scrapers used before: one round trip per element"""
+    from selenium.webdriver.common.by import By
+
+    entries = []
+    for table in driver.find_elements(By.TAG_NAME, "table"):
+        rows = table.find_elements(By.TAG_NAME, "tr")
+        if len(rows) < 2:
+            continue
+        for row in rows[1:]:
+            cells = row.find_elements(By.TAG_NAME, "td")
+            if len(cells) >= 3:
+                texts = [cell.text.strip() for cell in cells[:9]]
+                texts += [""] * (9 - len(texts))
+                entries.append(CauseListEntry(
+                    sr_no=texts[0], case_number=texts[1], case_title=texts[2],
+                    petitioner=texts[3], respondent=texts[4], advocate=texts[5],
+                    case_type=texts[6], stage=texts[7], purpose=texts[8]
+                ))
+    return entries
+
+
+def count_round_trips(html: str) -> int:
+    """Round trips the per-cell loop makes: tables + rows + cells + cell texts"""
+    import lxml.html
+
+    document = lxml.html.fromstring(html)
+    trips = 1  # find_elements(table)
+    for table in document.iter("table"):
+        rows = list(table.iter("tr"))
+        trips += 1  # find_elements(tr)
+        if len(rows) < 2:
+            continue
+        for row in rows[1:]:
+            cells = [cell for cell in row if cell.tag == "td"]
+            trips += 1  # find_elements(td)
+            if len(cells) >= 3:
+                trips += min(len(cells), 9)  # .text per cell
+    return trips
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--selenium", action="store_true", help="also time the per-cell parser in Chrome")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    driver = None
+    if args.selenium:
+        from app.scrapers.driver_pool import create_chrome_driver
+        driver = create_chrome_driver()
+
+    print(f"{'fixture':<22}{'rows':>6}{'single-pass ms':>16}{'per-cell ms':>14}{'round trips':>13}")
+    try:
+        for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "cause_list_*.html"))):
+            html = Path(path).read_text()
+            rows = len(parse_cause_list_html(html))
+            single = best_of(lambda: parse_cause_list_html(html), args.repeat)[0]
+
+            if driver is not None:
+                driver.get(Path(path).resolve().as_uri())
+                single += best_of(lambda: driver.page_source, args.repeat)[0]
+                per_cell = f"{best_of(lambda: parse_per_cell(driver), 3)[0] * 1000:.1f}"
+            else:
+                per_cell = "n/a"
+
+            print(f"{os.path.basename(path):<22}{rows:>6}{single * 1000:>16.2f}{per_cell:>14}"
+                  f"{count_round_trips(html):>13}")
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
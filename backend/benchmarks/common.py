@@ -0,0 +1,62 @@
+"""Timers and synthetic cause lists shared by the benchmark scripts."""
+import time
+from typing import Callable, List, Optional, Tuple
+from app.models.compact import CompactCauseList, CompactEntries
+
+STAGES = ("Arguments", "Evidence", "Framing of Charges", "Final Hearing", "Misc. Appearance")
+PURPOSES = ("Hearing", "Orders", "Judgment", "Bail")
+
+
+def samples(func: Callable, repeat: int) -> List[float]:
+    """Seconds taken by each of ``repeat`` calls"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def best_of(func: Callable, repeat: int, setup: Optional[Callable] = None) -> Tuple[float, object]:
+    """Fastest of ``repeat`` calls in seconds, and the last result.
+
+    With ``setup``, each call gets a fresh ``setup()`` result as its
+    argument, produced outside the timing.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def make_rows(entries: int) -> List[Tuple[str, ...]]:
+    """Entry rows in ENTRY_FIELDS order"""
+    # Fresh string objects per row, as a parser would produce them
+    return [
+        (
+            str(i),
+            f"CC/{i:05d}/2024",
+            f"Petitioner {i} vs Respondent {i}",
+            f"Petitioner {i}",
+            f"Respondent {i}",
+            f"Advocate {i % 50}",
+            "".join(["Civ", "il"]) if i % 2 else "".join(["Crimi", "nal"]),
+            "".join(STAGES[i % len(STAGES)]),
+            "".join(PURPOSES[i % len(PURPOSES)]),
+        )
+        for i in range(1, entries + 1)
+    ]
+
+
+def make_cause_list(entries: int, judge_name: str = "Hon'ble Judge 1") -> CompactCauseList:
+    """One cause list in the form the scrapers return"""
+    return CompactCauseList("Benchmark Court Complex", judge_name, "2024-10-15", "civil",
+                            CompactEntries(make_rows(entries)))
+
+
+def make_cause_lists(documents: int, entries: int) -> List[CompactCauseList]:
+    return [make_cause_list(entries, f"Judge {d}") for d in range(documents)]
@@ -0,0 +1,320 @@
+"""Local stand-in for the eCourts and Delhi district court cause list pages.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.fake_court_site [--port 8765] [--delay 0.2] [--jitter 0.05]
+                                         [--rows 50] [--judges 5] [--seed 0]
+
+then point the scrapers at it, e.g. in ``.env``:
+
+    ECOURTS_BASE_URL=http://127.0.0.1:8765/ecourtindia_v6/
+    DELHI_COURTS_BASE_URL=http://127.0.0.1:8765
+
+eCourts (``/ecourtindia_v6/?p=...``) serves the cause list form with the
+``state_code`` -> ``dist_code`` -> ``court_code`` -> ``court_name`` selects
+filled by the same AJAX calls the HTTP engine replays (JSON with an HTML
+fragment and a rotating ``app_token``), a ``hearing_date`` input and
+``civil_btn`` / ``criminal_btn`` submits that navigate to a result page.
+The form keeps its selections in the URL, so ``driver.back()`` lands on a
+filled-in form like on the real site. The Delhi page has a court select, a
+date input and a submit button.
+
+Every response waits ``--delay`` +/- ``--jitter`` seconds; result tables have
+``--rows`` entries generated from ``--seed``, so runs are repeatable.
+"""
+import argparse
+import asyncio
+import html
+import json
+import random
+import secrets
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, Response
+
+ECOURTS_PREFIX = "/ecourtindia_v6/"
+DELHI_PATH = "/cause-list-⁄-daily-board/"
+
+STATES = ("Delhi", "Maharashtra", "Karnataka", "Tamil Nadu", "Gujarat", "Rajasthan")
+DELHI_DISTRICTS = ("New Delhi", "South", "East", "West", "North", "Shahdara")
+DELHI_COMPLEXES = ("Patiala House Court Complex", "Karkardooma Court Complex", "Rohini Court Complex",
+                   "Saket Court Complex", "Dwarka Court Complex", "Rouse Avenue Court Complex")
+DESIGNATIONS = ("District Judge", "Additional District Judge", "Civil Judge", "Metropolitan Magistrate")
+STAGES = ("Arguments", "Evidence", "Framing of Charges", "Final Hearing", "Misc. Appearance")
+PURPOSES = ("Hearing", "Orders", "Judgment", "Bail")
+COLUMNS = ("Sr No", "Case Number", "Title", "Petitioner", "Respondent", "Advocate", "Case Type",
+           "Stage", "Purpose")
+
+Options = List[Tuple[str, str]]
+
+
+class FakeCourtSite:
+    """Deterministic court hierarchy and cause list tables behind a FastAPI app"""
+
+    def __init__(self, rows: int = 50, judges: int = 5, districts: int = 3, complexes: int = 3,
+                 delay: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.rows = rows
+        self.judges = judges
+        self.districts = districts
+        self.complexes = complexes
+        self.delay = delay
+        self.jitter = jitter
+        self.seed = seed
+        self._delay_rng = random.Random(seed)
+        self.requests = 0
+        self.app = self._build_app()
+
+    # Hierarchy: option values are numeric codes as on the real site
+
+    def state_options(self) -> Options:
+        return [(str(code), name) for code, name in enumerate(STATES, 1)]
+
+    def district_options(self, state_code: str) -> Options:
+        state = dict(self.state_options()).get(state_code)
+        if state is None:
+            return []
+        if state == "Delhi":
+            names = DELHI_DISTRICTS[:max(self.districts, 1)]
+        else:
+            names = [f"{state} District {i}" for i in range(1, self.districts + 1)]
+        return [(str(code), name) for code, name in enumerate(names, 1)]
+
+    def complex_options(self, state_code: str, dist_code: str) -> Options:
+        district = dict(self.district_options(state_code)).get(dist_code)
+        if district is None:
+            return []
+        if district == "New Delhi":
+            names = DELHI_COMPLEXES
+        else:
+            names = [f"{district} Court Complex {i}" for i in range(1, self.complexes + 1)]
+        return [(f"{state_code}{dist_code}{code:03d}", name) for code, name in enumerate(names, 1)]
+
+    def court_options(self, state_code: str, dist_code: str, court_code: str) -> Options:
+        if court_code not in dict(self.complex_options(state_code, dist_code)):
+            return []
+        return [
+            (f"{court_code}^{n}", f"{n}-{DESIGNATIONS[(n - 1) % len(DESIGNATIONS)]} Court No. {n}")
+            for n in range(1, self.judges + 1)
+        ]
+
+    def cause_list_rows(self, court_value: str, date: str, case_type: str) -> List[Tuple[str, ...]]:
+        rng = random.Random(f"{self.seed}:{court_value}:{date}:{case_type}")
+        prefix = "CS" if case_type == "civil" else "CR"
+        rows = []
+        for i in range(1, self.rows + 1):
+            year = rng.randint(2015, 2024)
+            number = rng.randint(1, 99999)
+            petitioner = f"Petitioner {rng.randint(1, 9999)}"
+            respondent = "State" if case_type == "criminal" else f"Respondent {rng.randint(1, 9999)}"
+            rows.append((
+                str(i),
+                f"{prefix}/{number}/{year}",
+                f"{petitioner} vs {respondent}",
+                petitioner,
+                respondent,
+                f"Advocate {rng.randint(1, 300)}",
+                "Civil" if case_type == "civil" else "Criminal",
+                rng.choice(STAGES),
+                rng.choice(PURPOSES),
+            ))
+        return rows
+
+    # Rendering
+
+    @staticmethod
+    def _options_html(options: Options, placeholder: str, selected: Optional[str] = None) -> str:
+        parts = [f'<option value="">{placeholder}</option>']
+        for value, text in options:
+            mark = " selected" if value == selected else ""
+            parts.append(f'<option value="{html.escape(value)}"{mark}>{html.escape(text)}</option>')
+        return "".join(parts)
+
+    def table_html(self, court_value: str, date: str, case_type: str) -> str:
+        header = "".join(f"<th>{column}</th>" for column in COLUMNS)
+        body = "".join(
+            "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>"
+            for row in self.cause_list_rows(court_value, date, case_type)
+        )
+        return f'<table class="cause_list"><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>'
+
+    def ecourts_page(self, params: Dict[str, str], result: str = "") -> str:
+        state_code = params.get("state_code", "")
+        dist_code = params.get("dist_code", "")
+        court_code = params.get("court_code", "")
+        selects = (
+            ("state_code", self.state_options(), "Select State", state_code),
+            ("dist_code", self.district_options(state_code), "Select District", dist_code),
+            ("court_code", self.complex_options(state_code, dist_code), "Select Court Complex", court_code),
+            ("court_name", self.court_options(state_code, dist_code, court_code), "Select Court",
+             params.get("court_name", "")),
+        )
+        fields = "".join(
+            f'<div class="field"><select id="{name}" name="{name}">{self._options_html(options, label, value)}'
+            f"</select></div>"
+            for name, options, label, value in selects
+        )
+        return f"""<!DOCTYPE html>
+<html><head><title>Cause List - eCourts (local)</title></head><body>
+<form id="frm_cause_list" method="get" action="{ECOURTS_PREFIX}">
+<input type="hidden" name="p" value="cause_list/show">
+<input type="hidden" id="app_token" name="app_token" value="{secrets.token_hex(16)}">
+{fields}
+<div class="field"><input type="text" id="hearing_date" name="hearing_date"
+ value="{html.escape(params.get("hearing_date", ""))}" placeholder="YYYY-MM-DD"></div>
+<input type="submit" name="civil_btn" value="Civil">
+<input type="submit" name="criminal_btn" value="Criminal">
+</form>
+<div id="res_cause_list">{result}</div>
+<script>
+const cascade = {{
+  state_code: ["fillDistrict", "dist_code", "Select District"],
+  dist_code: ["fillComplex", "court_code", "Select Court Complex"],
+  court_code: ["fillCauseList", "court_name", "Select Court"],
+}};
+const order = ["state_code", "dist_code", "court_code", "court_name"];
+function remember() {{
+  const query = new URLSearchParams({{p: "cause_list/index"}});
+  for (const id of order) {{
+    const value = document.getElementById(id).value;
+    if (value) query.set(id, value);
+  }}
+  history.replaceState(null, "", "?" + query.toString());
+}}
+for (const [id, [action, target, label]] of Object.entries(cascade)) {{
+  document.getElementById(id).addEventListener("change", async () => {{
+    for (const below of order.slice(order.indexOf(id) + 1)) {{
+      document.getElementById(below).innerHTML = "<option value=''>Select</option>";
+    }}
+    const body = new URLSearchParams({{ajax_req: "true", app_token: document.getElementById("app_token").value}});
+    for (const above of order.slice(0, order.indexOf(id) + 1)) body.set(above, document.getElementById(above).value);
+    const response = await fetch("?p=cause_list/" + action, {{method: "POST", body}});
+    const data = await response.json();
+    document.getElementById("app_token").value = data.app_token;
+    document.getElementById(target).innerHTML = "<option value=''>" + label + "</option>" + data.options;
+    remember();
+  }});
+}}
+document.getElementById("court_name").addEventListener("change", remember);
+</script>
+</body></html>"""
+
+    def delhi_page(self, params: Dict[str, str], result: str = "") -> str:
+        courts = self.court_options("1", "1", self.complex_options("1", "1")[0][0])
+        selected = params.get("court_no", courts[0][0] if courts else "")
+        return f"""<!DOCTYPE html>
+<html><head><title>Cause List / Daily Board - District Courts, New Delhi (local)</title></head><body>
+<form method="get" action="{DELHI_PATH}">
+<select name="court_no">{self._options_html(courts, "Select Court", selected)}</select>
+<input type="text" name="cause_date" value="{html.escape(params.get("cause_date", ""))}">
+<input type="submit" value="Search">
+</form>
+<div class="cause-list">{result}</div>
+</body></html>"""
+
+    # Server
+
+    async def _wait(self):
+        self.requests += 1
+        delay = self.delay + self._delay_rng.uniform(-self.jitter, self.jitter) if self.jitter else self.delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _ajax(self, action: str, form: Dict[str, str]) -> Response:
+        state_code = form.get("state_code", "")
+        dist_code = form.get("dist_code", "")
+        court_code = form.get("court_code", "")
+        if action == "fillDistrict":
+            payload = {"options": self._options_html(self.district_options(state_code), "Select District")}
+        elif action == "fillComplex":
+            payload = {"options": self._options_html(self.complex_options(state_code, dist_code),
+                                                     "Select Court Complex")}
+        elif action == "fillCauseList":
+            payload = {"options": self._options_html(self.court_options(state_code, dist_code, court_code),
+                                                     "Select Court")}
+        elif action == "submitCauseList":
+            courts = dict(self.court_options(state_code, dist_code, court_code))
+            court_value = form.get("court_name", "")
+            if court_value not in courts or not form.get("hearing_date"):
+                payload = {"errormsg": "Select court and enter hearing date"}
+            else:
+                case_type = "criminal" if form.get("cicri") == "cri" else "civil"
+                payload = {"case_data": self.table_html(court_value, form["hearing_date"], case_type)}
+        else:
+            return Response(status_code=404)
+        payload["app_token"] = secrets.token_hex(16)
+        return Response(json.dumps(payload), media_type="application/json")
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(title="Fake court site")
+
+        @app.get(ECOURTS_PREFIX, response_class=HTMLResponse)
+        async def ecourts_get(request: Request):
+            await self._wait()
+            params = dict(request.query_params)
+            page = params.get("p", "cause_list/index")
+            if page == "cause_list/show":
+                courts = dict(self.court_options(params.get("state_code", ""), params.get("dist_code", ""),
+                                                 params.get("court_code", "")))
+                case_type = "criminal" if "criminal_btn" in params else "civil"
+                court_value = params.get("court_name", "")
+                if court_value in courts and params.get("hearing_date"):
+                    result = self.table_html(court_value, params["hearing_date"], case_type)
+                else:
+                    result = "<p>Select court and enter hearing date</p>"
+                return self.ecourts_page(params, result)
+            if page == "cause_list/index":
+                return self.ecourts_page(params)
+            return HTMLResponse(status_code=404)
+
+        @app.post(ECOURTS_PREFIX)
+        async def ecourts_post(request: Request):
+            await self._wait()
+            page = request.query_params.get("p", "")
+            form = dict(await request.form())
+            return self._ajax(page.rsplit("/", 1)[-1], form)
+
+        @app.get(DELHI_PATH, response_class=HTMLResponse)
+        async def delhi_get(request: Request):
+            await self._wait()
+            params = dict(request.query_params)
+            result = ""
+            if params.get("cause_date") and params.get("court_no"):
+                result = self.table_html(params["court_no"], params["cause_date"], "civil")
+            return self.delhi_page(params, result)
+
+        return app
+
+
+def serve_in_thread(site: FakeCourtSite, port: int = 0) -> Tuple[uvicorn.Server, str]:
+    """Start the site on 127.0.0.1 in a daemon thread; returns the server and its base URL"""
+    config = uvicorn.Config(site.app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=50, help="entries per cause list table")
+    parser.add_argument("--judges", type=int, default=5, help="courts per court complex")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    site = FakeCourtSite(rows=args.rows, judges=args.judges, delay=args.delay, jitter=args.jitter, seed=args.seed)
+    base = f"http://127.0.0.1:{args.port}"
+    print(f"eCourts:      ECOURTS_BASE_URL={base}{ECOURTS_PREFIX}")
+    print(f"Delhi courts: DELHI_COURTS_BASE_URL={base}")
+    uvicorn.run(site.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Repeatable benchmark suite for the API and rendering paths on synthetic data.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.suite [--judges 20] [--entries 200] [--field-length 60]
+                               [--latency 0] [--jitter 0] [--seed 0] [--repeat 5]
+                               [--only fetch_causelist pdf_render ...]
+                               [--output results.json] [--baseline previous.json]
+                               [--max-regression 1.25]
+
+The app runs in-process (TestClient) on the MockScraper's synthetic load
+mode (MOCK_* settings), with output, caches and history in a temporary
+directory and the result cache off so every fetch renders. Each case gets
+one warm-up call and then ``--repeat`` timed calls; min/median/p95/mean
+seconds per case are written as JSON to ``--output`` (or stdout).
+
+With ``--baseline``, medians are compared with an earlier result file and
+the exit status is 1 if any case is slower than ``--max-regression`` times
+its baseline median.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from typing import Callable, Dict
+from benchmarks.common import samples
+
+COURT_COMPLEX = "Saket Court Complex"
+DATE = "2024-10-15"
+
+
+def configure(args, workdir: str):
+    """Point the app at the synthetic scraper and a scratch directory; must run before importing main"""
+    from app.core.config import settings
+    settings.MOCK_JUDGES = args.judges
+    settings.MOCK_ENTRIES_PER_JUDGE = args.entries
+    settings.MOCK_FIELD_LENGTH = args.field_length
+    settings.MOCK_LATENCY = args.latency
+    settings.MOCK_JITTER = args.jitter
+    settings.MOCK_SEED = args.seed
+    settings.OUTPUT_DIR = os.path.join(workdir, "output")
+    settings.HIERARCHY_CACHE_DB = os.path.join(workdir, "hierarchy.sqlite3")
+    settings.ARTIFACT_DB = os.path.join(workdir, "artifacts.sqlite3")
+    settings.HISTORY_DB = os.path.join(workdir, "history.sqlite3")
+    settings.RESULT_CACHE_ENABLED = False
+    settings.PREFETCH_ENABLED = False
+
+
+def build_cases(client) -> Dict[str, Callable[[], None]]:
+    from app.api import routes
+    from app.utils.zip_stream import stream_zip
+
+    request = {"state": "Delhi", "district": "Delhi", "court_complex": COURT_COMPLEX,
+               "date": DATE, "case_type": "civil", "refresh": True}
+
+    def get(url: str):
+        response = client.get(url)
+        response.raise_for_status()
+        return response
+
+    def fetch():
+        response = client.post("/api/fetch-causelist", json=request)
+        response.raise_for_status()
+        return response.json()
+
+    # Inputs for the rendering cases, produced once outside the timings
+    cause_lists = routes.mock_scraper.fetch_cause_list("Delhi", "Delhi", COURT_COMPLEX, None, DATE, "civil")
+    rendered = list(routes.pdf_generator.iter_cause_list_pdfs(cause_lists))
+    download_url = "/api" + fetch()["pdf_url"]
+
+    return {
+        "hierarchy_states": lambda: get("/api/states"),
+        "hierarchy_districts": lambda: get("/api/districts/Delhi"),
+        "hierarchy_courts": lambda: get("/api/courts/Delhi/Delhi"),
+        "hierarchy_judges": lambda: get(f"/api/judges/Delhi/Delhi/{COURT_COMPLEX}"),
+        "fetch_causelist": fetch,
+        "pdf_render": lambda: routes.pdf_generator.generate_cause_list_pdf_bytes(cause_lists[0]),
+        "zip_build": lambda: b"".join(stream_zip(iter(rendered))),
+        "download": lambda: get(download_url).content,
+    }
+
+
+def run_case(func: Callable[[], None], repeat: int) -> Dict[str, float]:
+    func()  # warm-up: caches, process pool, first-import costs
+    durations = sorted(samples(func, repeat))
+    return {
+        "min": durations[0],
+        "median": statistics.median(durations),
+        "p95": durations[min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))],
+        "mean": statistics.fmean(durations),
+        "runs": len(durations),
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            max_regression: float) -> bool:
+    """Print median vs baseline per case; False if any case regressed past the limit"""
+    ok = True
+    print(f"{'case':<22}{'median ms':>11}{'baseline ms':>13}{'ratio':>8}", file=sys.stderr)
+    for case, stats in results.items():
+        before = baseline.get(case)
+        if before is None:
+            print(f"{case:<22}{stats['median'] * 1000:>11.2f}{'-':>13}{'-':>8}", file=sys.stderr)
+            continue
+        ratio = stats["median"] / before["median"] if before["median"] else float("inf")
+        flag = ""
+        if ratio > max_regression:
+            ok = False
+            flag = "  REGRESSION"
+        print(f"{case:<22}{stats['median'] * 1000:>11.2f}{before['median'] * 1000:>13.2f}{ratio:>8.2f}{flag}",
+              file=sys.stderr)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--judges", type=int, default=20)
+    parser.add_argument("--entries", type=int, default=200, help="entries per judge")
+    parser.add_argument("--field-length", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per simulated page load")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="run just these cases")
+    parser.add_argument("--output", help="write results JSON here instead of stdout")
+    parser.add_argument("--baseline", help="results JSON from an earlier run to compare medians with")
+    parser.add_argument("--max-regression", type=float, default=1.25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="scraper_bench_") as workdir:
+        configure(args, workdir)
+        from fastapi.testclient import TestClient
+        import main as app_main
+        from app.utils.pdf_generator import shutdown_render_process_pool
+
+        with TestClient(app_main.app) as client:
+            cases = build_cases(client)
+            unknown = set(args.only or ()) - set(cases)
+            if unknown:
+                parser.error(f"unknown cases: {', '.join(sorted(unknown))}; choose from {', '.join(cases)}")
+            results = {}
+            for name, func in cases.items():
+                if args.only and name not in args.only:
+                    continue
+                results[name] = run_case(func, args.repeat)
+                print(f"{name:<22}{results[name]['median'] * 1000:>11.2f} ms", file=sys.stderr)
+        shutdown_render_process_pool()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "params": {key: value for key, value in vars(args).items()
+                       if key in ("judges", "entries", "field_length", "latency", "jitter", "seed", "repeat")},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("params") != report["meta"]["params"]:
+            print("warning: baseline was recorded with different parameters", file=sys.stderr)
+        if not compare(results, baseline.get("results", {}), args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
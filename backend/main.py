@@ -1,9 +1,13 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 import uvicorn
-from app.api.routes import router as api_router
+from app.api.routes import router as api_router, job_manager, janitor, history, prefetcher, result_cache
 from app.core.config import settings
+from app.scrapers.driver_pool import driver_pool
+from app.utils.executors import scrape_pool, render_pool
+from app.utils.pdf_generator import shutdown_render_process_pool
+from app.utils import metrics
 from app.utils.logger import logger
 
 app = FastAPI(
@@ -22,6 +26,47 @@ app.add_middleware(
 
 app.include_router(api_router, prefix="/api")
 
+@app.on_event("startup")
+def warm_driver_pool():
+    if settings.DRIVER_POOL_WARM_ON_STARTUP:
+        logger.info(f"Warming {settings.DRIVER_POOL_SIZE} browser sessions")
+        driver_pool.warm_up()
+
+@app.on_event("startup")
+def start_background_workers():
+    # The janitor also picks up files left behind by a previous run
+    janitor.start()
+    if history is not None:
+        history.start()
+    if settings.PREFETCH_ENABLED:
+        prefetcher.start()
+
+@app.on_event("shutdown")
+def close_driver_pool():
+    job_manager.shutdown()
+    scrape_pool.shutdown()
+    render_pool.shutdown()
+    shutdown_render_process_pool()
+    driver_pool.shutdown()
+    janitor.stop()
+    prefetcher.stop()
+    if history is not None:
+        history.stop()
+
+# Resource gauges are read when /metrics is scraped, not tracked on every change
+metrics.QUEUE_DEPTH.labels("jobs").set_function(lambda: job_manager.pending)
+metrics.QUEUE_DEPTH.labels("scrape").set_function(lambda: scrape_pool.in_flight)
+metrics.QUEUE_DEPTH.labels("render").set_function(lambda: render_pool.in_flight)
+metrics.BROWSERS_BUSY.set_function(lambda: driver_pool.busy)
+metrics.GENERATED_FILES_BYTES.labels("output").set_function(lambda: janitor.total_bytes)
+if result_cache is not None:
+    metrics.GENERATED_FILES_BYTES.labels("result_cache").set_function(lambda: result_cache.total_bytes)
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
 @app.get("/")
 async def root():
     return {"message": "Court Cause List API is running"}
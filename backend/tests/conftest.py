@@ -0,0 +1,49 @@
+"""Shared fixtures. Every file the app writes goes to a temporary directory,
+configured here before any test imports ``main``."""
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import pytest
+import uvicorn
+from app.core.config import settings
+
+WORKDIR = tempfile.mkdtemp(prefix="court_tests_")
+settings.OUTPUT_DIR = os.path.join(WORKDIR, "output")
+settings.HIERARCHY_CACHE_DB = os.path.join(WORKDIR, "hierarchy.sqlite3")
+settings.ARTIFACT_DB = os.path.join(WORKDIR, "artifacts.sqlite3")
+settings.RESULT_CACHE_DIR = os.path.join(WORKDIR, "pdfs")
+settings.RESULT_CACHE_DB = os.path.join(WORKDIR, "results.sqlite3")
+settings.HISTORY_DB = os.path.join(WORKDIR, "history.sqlite3")
+settings.PREFETCH_ENABLED = False
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def live_server():
+    """Base URL of the app running under uvicorn in a background thread"""
+    import main
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline or not thread.is_alive():
+            pytest.fail("uvicorn did not start")
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(timeout=10)
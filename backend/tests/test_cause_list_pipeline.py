@@ -0,0 +1,64 @@
+"""Serving stored lists while the court website is unavailable."""
+import pytest
+from app.models.schemas import CauseListRequest
+from app.utils.cause_list_pipeline import CauseListPipeline
+from app.utils.upstream import UpstreamUnavailable
+from benchmarks.common import make_cause_lists
+
+REQUEST = CauseListRequest(state="Delhi", district="New Delhi", court_complex="Benchmark Court Complex",
+                           date="2024-10-15", case_type="civil")
+
+
+class DownScraper:
+    def fetch_cause_list(self, *args, **kwargs):
+        raise UpstreamUnavailable("services.ecourts.gov.in", 30)
+
+
+class StoredHistory:
+    def __init__(self, cause_lists):
+        self.cause_lists = cause_lists
+        self.recorded = []
+
+    def stored_lists(self, *args):
+        return self.cause_lists
+
+    def previous_entries(self, cause_list):
+        return cause_list.entries
+
+    def flush(self):
+        pass
+
+    def submit(self, cause_lists, request):
+        self.recorded.append(cause_lists)
+
+    def ingest(self, batch):
+        self.recorded.extend(cause_lists for cause_lists, _, _ in batch)
+
+
+@pytest.fixture
+def history():
+    return StoredHistory(make_cause_lists(2, 3))
+
+
+@pytest.fixture
+def pipeline(history):
+    return CauseListPipeline(DownScraper(), pdf_generator=None, artifacts=None, history=history)
+
+
+def test_diff_of_stored_lists_is_flagged_stale(pipeline, history):
+    cause_lists, diffs, stale = pipeline.scrape_with_diff(REQUEST)
+    assert cause_lists == history.cause_lists
+    assert stale and diffs == []
+    assert history.recorded == []
+
+
+def test_stored_lists_are_not_recorded_again(pipeline, history):
+    assert pipeline.scrape(REQUEST) == history.cause_lists
+    assert pipeline.scrape_into_history(REQUEST) == history.cause_lists
+    assert history.recorded == []
+
+
+def test_no_stored_lists_reraises(pipeline, history):
+    history.cause_lists = []
+    with pytest.raises(UpstreamUnavailable):
+        pipeline.scrape_with_diff(REQUEST)
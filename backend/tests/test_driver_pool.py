@@ -0,0 +1,39 @@
+import os
+from types import SimpleNamespace
+from app.scrapers import driver_pool as driver_pool_module
+from app.scrapers.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.service = SimpleNamespace(process=SimpleNamespace(pid=os.getpid()))
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        pass
+
+
+def test_memory_is_sampled_outside_checkouts(monkeypatch):
+    walks = []
+    monkeypatch.setattr(driver_pool_module, "_process_tree_rss_mb", lambda pid: walks.append(pid) or 100.0)
+    pool = DriverPool(size=2, max_memory_mb=1000, memory_sample_seconds=60, driver_factory=FakeDriver)
+
+    for _ in range(20):
+        with pool.lease(), pool.lease():
+            pass
+
+    # One sample per driver at startup; returns within the interval reuse it
+    assert len(walks) == 2
+    assert pool.idle == 2
+
+
+def test_memory_cap_reads_cached_samples(monkeypatch):
+    monkeypatch.setattr(driver_pool_module, "_process_tree_rss_mb", lambda pid: 600.0)
+    pool = DriverPool(size=3, lease_timeout=0.1, max_memory_mb=1000, memory_sample_seconds=60,
+                      driver_factory=FakeDriver)
+
+    with pool.lease(), pool.lease():
+        # 2 x 600 MB already in use: a third browser would go over the cap
+        assert not pool._memory_allows_new_driver()
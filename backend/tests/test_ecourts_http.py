@@ -0,0 +1,68 @@
+"""The browserless eCourts engine against the local fake court site."""
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.core.config import settings
+from benchmarks.fake_court_site import ECOURTS_PREFIX, STATES, FakeCourtSite, serve_in_thread
+
+DATE = "2024-10-15"
+STATE = "Delhi"
+DISTRICT = "New Delhi"
+COURT_COMPLEX = "Patiala House Court Complex"
+
+
+@pytest.fixture(scope="module")
+def site():
+    site = FakeCourtSite(rows=5, judges=3)
+    server, base = serve_in_thread(site)
+    site.base_url = base + ECOURTS_PREFIX
+    yield site
+    server.should_exit = True
+
+
+@pytest.fixture
+def scraper(site, monkeypatch):
+    monkeypatch.setattr(settings, "ECOURTS_BASE_URL", site.base_url)
+    monkeypatch.setattr(settings, "SCRAPER_ENGINE_FALLBACK", False)  # no Chrome here; fail instead
+    monkeypatch.setattr(settings, "UPSTREAM_RATE", 0.0)
+    from app.scrapers.ecourts_scraper import ECourtsScraper
+    return ECourtsScraper()
+
+
+def codes_for(site: FakeCourtSite, state: str, district: str, court_complex: str):
+    state_code = {name: code for code, name in site.state_options()}[state]
+    dist_code = {name: code for code, name in site.district_options(state_code)}[district]
+    court_code = {name: code for code, name in site.complex_options(state_code, dist_code)}[court_complex]
+    return state_code, dist_code, court_code
+
+
+def test_get_states(scraper):
+    assert scraper.get_states(engine="http") == list(STATES)
+
+
+def test_get_judges(scraper, site):
+    judges = scraper.get_judges(STATE, DISTRICT, COURT_COMPLEX, engine="http")
+    courts = site.court_options(*codes_for(site, STATE, DISTRICT, COURT_COMPLEX))
+    assert [(judge.court_number, judge.name) for judge in judges] == courts
+
+
+def test_fetch_cause_list(scraper, site):
+    cause_lists = scraper.fetch_cause_list(STATE, DISTRICT, COURT_COMPLEX, None, DATE, "both", engine="http")
+    courts = {text: value for value, text in site.court_options(*codes_for(site, STATE, DISTRICT, COURT_COMPLEX))}
+
+    assert sorted((c.judge_name, c.case_type) for c in cause_lists) == \
+        sorted((judge, ct) for judge in courts for ct in ("civil", "criminal"))
+    for cause_list in cause_lists:
+        expected = site.cause_list_rows(courts[cause_list.judge_name], DATE, cause_list.case_type)
+        assert [entry.case_number for entry in cause_list.entries] == [row[1] for row in expected]
+
+
+def test_concurrent_hierarchy_calls(scraper, site):
+    # One scraper serves every request, as in the API; calls must not share form state
+    state_code = {name: code for code, name in site.state_options()}[STATE]
+    districts = site.district_options(state_code)
+    with ThreadPoolExecutor(max_workers=len(districts)) as executor:
+        results = list(executor.map(
+            lambda district: scraper.get_court_complexes(STATE, district[1], engine="http"), districts
+        ))
+    for (dist_code, _), complexes in zip(districts, results):
+        assert complexes == [name for _, name in site.complex_options(state_code, dist_code)]
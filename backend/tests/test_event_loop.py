@@ -0,0 +1,49 @@
+"""Blocking scraper work must not stall the event loop."""
+import threading
+import time
+import requests
+from app.scrapers.mock_scraper import MockScraper
+
+FETCH_SECONDS = 2.0
+MAX_HEALTH_MS = 200.0
+
+
+class SlowMockScraper(MockScraper):
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def fetch_cause_list(self, *args, **kwargs):
+        time.sleep(self.delay)  # Stand-in for a blocking Selenium session
+        return super().fetch_cause_list(*args, **kwargs)
+
+
+def test_health_during_slow_fetch(live_server, monkeypatch):
+    from app.api import routes
+
+    monkeypatch.setattr(routes.pipeline, "scraper", SlowMockScraper(FETCH_SECONDS))
+    fetch_result = {}
+
+    def fetch():
+        response = requests.post(f"{live_server}/api/fetch-causelist", json={
+            "state": "Delhi", "district": "Delhi",
+            "court_complex": "Saket Court Complex", "date": "2024-10-15",
+            "refresh": True  # skip the result cache so the slow scraper really runs
+        }, timeout=30)
+        fetch_result["status"] = response.status_code
+
+    fetch_thread = threading.Thread(target=fetch)
+    fetch_thread.start()
+    time.sleep(0.2)  # let the fetch reach the scraper
+
+    latencies = []
+    while fetch_thread.is_alive():
+        start = time.perf_counter()
+        requests.get(f"{live_server}/health", timeout=5).raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.1)
+    fetch_thread.join()
+
+    assert fetch_result.get("status") == 200
+    assert len(latencies) >= 5, "the fetch finished before /health could be polled"
+    assert max(latencies) < MAX_HEALTH_MS, f"/health took {max(latencies):.1f} ms during the fetch"
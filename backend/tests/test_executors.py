@@ -0,0 +1,55 @@
+import asyncio
+import time
+import pytest
+from app.utils.executors import BlockingPool, PoolSaturated
+
+
+async def saturate(pool: BlockingPool):
+    """Fill every slot, check the next call is rejected and a stream waits its turn"""
+    busy = [asyncio.ensure_future(pool.run(time.sleep, 0.2)) for _ in range(pool.max_workers + pool.max_queued)]
+    await asyncio.sleep(0.01)
+    with pytest.raises(PoolSaturated):
+        await pool.run(time.sleep, 0)
+    assert [item async for item in pool.iterate(iter([1, 2]))] == [1, 2]
+    await asyncio.gather(*busy)
+
+
+def test_pool_works_across_event_loops():
+    pool = BlockingPool("test", 1, 1)
+    try:
+        # e.g. two TestClients or a reloaded app, each with its own loop
+        asyncio.run(saturate(pool))
+        asyncio.run(saturate(pool))
+        assert pool.in_flight == 0
+    finally:
+        pool.shutdown()
+
+
+def test_disconnect_waits_for_in_flight_item():
+    closed = []
+
+    def items():
+        try:
+            for i in range(5):
+                time.sleep(0.2)
+                yield i
+        finally:
+            closed.append(True)
+
+    async def consume_then_disconnect(pool: BlockingPool):
+        async def consume():
+            async for _ in pool.iterate(items()):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.3)  # second next() is running on the pool
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    pool = BlockingPool("test", 1, 1)
+    try:
+        asyncio.run(consume_then_disconnect(pool))
+        assert closed == [True]
+    finally:
+        pool.shutdown()
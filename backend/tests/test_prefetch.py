@@ -0,0 +1,23 @@
+from app.utils.prefetch import Prefetcher
+
+TARGET = {"state": "Delhi", "district": "New Delhi", "court_complex": "Patiala House Court Complex"}
+
+
+class RecordingPipeline:
+    result_cache = None
+
+    def __init__(self):
+        self.requests = []
+
+    def scrape(self, request):
+        self.requests.append(request)
+        return []
+
+
+def test_target_keys_override_defaults_but_not_the_date():
+    pipeline = RecordingPipeline()
+    prefetcher = Prefetcher(pipeline, targets=[])
+    prefetcher._prefetch(TARGET, "2024-10-15")
+    prefetcher._prefetch({**TARGET, "case_type": "civil", "date": "2001-01-01"}, "2024-10-15")
+
+    assert [(r.case_type, r.date) for r in pipeline.requests] == [("both", "2024-10-15"), ("civil", "2024-10-15")]
@@ -0,0 +1,90 @@
+import threading
+import time
+import pytest
+from app.scrapers.single_flight import FlightTimeout, SingleFlight
+
+
+class Cancelled(BaseException):
+    pass
+
+
+def slow_call(seconds: float, calls: list, steps: int = 1):
+    def func(progress):
+        calls.append(threading.current_thread())
+        for step in range(steps):
+            time.sleep(seconds / steps)
+            progress(step + 1, steps, "judge")
+        return "result"
+    return func
+
+
+def test_leader_runs_the_call_on_its_own_thread():
+    calls = []
+    assert SingleFlight().do("key", slow_call(0, calls)) == "result"
+    assert calls == [threading.current_thread()]
+
+
+def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    calls, results = [], []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("key", slow_call(0.3, calls))))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == ["result"] * 4
+    assert flights.counters == {"calls": 1, "shared": 3}
+
+
+def test_follower_timeout_leaves_the_leader_running():
+    flights = SingleFlight()
+    calls, results = [], []
+    leader = threading.Thread(target=lambda: results.append(flights.do("key", slow_call(0.3, calls))))
+    leader.start()
+    time.sleep(0.05)
+    with pytest.raises(FlightTimeout):
+        flights.do("key", slow_call(0.3, calls), timeout=0.05)
+    leader.join()
+    assert results == ["result"]
+    assert len(calls) == 1
+
+
+def test_cancelled_leader_finishes_for_followers():
+    flights = SingleFlight()
+    calls, results = [], []
+
+    def cancel(*args):
+        raise Cancelled()
+
+    def leader():
+        with pytest.raises(Cancelled):
+            flights.do("key", slow_call(0.4, calls, steps=4), progress=cancel)
+
+    leader_thread = threading.Thread(target=leader)
+    leader_thread.start()
+    time.sleep(0.05)
+    results.append(flights.do("key", slow_call(0.4, calls)))
+    leader_thread.join()
+    assert results == ["result"]
+    assert len(calls) == 1
+
+
+def test_abandoned_call_stops_at_next_progress():
+    flights = SingleFlight()
+    steps = []
+
+    def func(progress):
+        for step in range(5):
+            steps.append(step)
+            progress(step + 1, 5, "judge")
+        return "result"
+
+    def cancel(*args):
+        raise Cancelled()
+
+    with pytest.raises(Cancelled):
+        flights.do("key", func, progress=cancel)
+    assert steps == [0]
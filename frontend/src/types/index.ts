@@ -5,6 +5,9 @@ export interface CauseListRequest {
   court_name?: string;
   date: string;
   case_type?: 'civil' | 'criminal' | 'both';
+  engine?: 'selenium' | 'http';
+  refresh?: boolean;
+  bundle?: 'zip' | 'pdf';
 }
 
 export interface CauseListResponse {